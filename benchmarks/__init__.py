@@ -0,0 +1,2 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
@@ -0,0 +1,49 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Compares adding components one by one against adding them in ``StandardBom.build()``.
+
+Run with ``python -m benchmarks.bench_build [component-count]``.
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generator import write_document
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with tempfile.TemporaryDirectory() as directory:
+        filename = write_document(Path(directory) / 'bench.cdx.json', count)
+        components = list(StandardBomParser.parse(str(filename)).bom.components)
+    # generators add components in the order they find them, not in the order of the set
+    random.Random(42).shuffle(components)
+
+    single = StandardBom()
+    start = time.perf_counter()
+    for component in components:
+        single.add_component(component)
+    single_seconds = time.perf_counter() - start
+
+    built = StandardBom()
+    start = time.perf_counter()
+    with built.build():
+        for component in components:
+            built.add_component(component)
+    build_seconds = time.perf_counter() - start
+
+    assert list(single.bom.components) == list(built.bom.components)
+    print(f'{count} components')
+    print(f'{"add_component":<16} {single_seconds:8.2f} s')
+    print(f'{"build":<16} {build_seconds:8.2f} s ({single_seconds / build_seconds:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
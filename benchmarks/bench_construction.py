@@ -0,0 +1,34 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Measures how fast empty and wrapped ``StandardBom`` documents can be created.
+
+Run with ``python -m benchmarks.bench_construction [count]``.
+"""
+import sys
+import timeit
+from typing import Callable
+
+from cyclonedx.model.bom import Bom
+
+from siemens_standard_bom.model import StandardBom
+
+
+def report(label: str, func: Callable[[], object], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f'{label:<28} {seconds * 1_000_000:10.1f} us {1 / seconds:12.0f} docs/s')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    report('Bom()', Bom, count)
+    report('StandardBom()', StandardBom, count)
+    report('StandardBom(Bom())', lambda: StandardBom(Bom()), count)
+    existing = StandardBom().bom
+    report('StandardBom(existing bom)', lambda: StandardBom(existing), count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Measures the corpus index over a directory of generated SBOM files: the first sweep on a process pool, an
+update without changes, an update after a few files changed, and a lookup.
+
+Run with ``python -m benchmarks.bench_corpus [files] [components-per-file] [workers]``.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generator import write_document
+from siemens_standard_bom.corpus import SbomCorpusIndex
+
+
+def main() -> None:
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    components = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'archive'
+        for i in range(files):
+            write_document(root / f'{i % 16:02d}' / f'sbom-{i}.cdx.json', components, seed=i)
+        index_file = Path(tmp) / 'corpus.json'
+        print(f'{files} files with {components} components each')
+
+        start = time.perf_counter()
+        index = SbomCorpusIndex(root, index_file)
+        index.update(workers)
+        print(f'{"full sweep":<24} {time.perf_counter() - start:10.3f} s')
+
+        start = time.perf_counter()
+        index = SbomCorpusIndex(root, index_file)
+        index.update(workers)
+        print(f'{"load and no-op update":<24} {time.perf_counter() - start:10.3f} s')
+
+        for i in range(0, files, max(1, files // 10)):
+            write_document(root / f'{i % 16:02d}' / f'sbom-{i}.cdx.json', components, seed=files + i)
+        start = time.perf_counter()
+        update = index.update(workers)
+        print(f'{"update":<24} {time.perf_counter() - start:10.3f} s ({len(update.parsed)} files changed)')
+
+        start = time.perf_counter()
+        found = index.files_containing(license='MIT')
+        print(f'{"license lookup":<24} {(time.perf_counter() - start) * 1000:10.3f} ms ({len(found)} files with MIT)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Compares wildcard CPE queries through ``CpeIndex`` against a scan that tests every component.
+
+Run with ``python -m benchmarks.bench_cpe [component-count]``.
+"""
+import random
+import sys
+import timeit
+from typing import Callable, List
+
+from siemens_standard_bom.cpe import CpeIndex, cpe_matcher, parse_cpe
+
+VENDORS = ['apache', 'apple', 'cisco', 'debian', 'google', 'microsoft', 'mozilla', 'oracle', 'redhat', 'siemens']
+QUERIES = ['cpe:2.3:a:apache:product-42:*', 'cpe:2.3:a:app*:product-1*:1.*', 'cpe:2.3:a:*:product-7:2.3']
+
+
+def build_cpes(count: int, seed: int = 42) -> List[str]:
+    rnd = random.Random(seed)
+    return [f'cpe:2.3:a:{rnd.choice(VENDORS)}:product-{rnd.randrange(count // 10 or 1)}:{rnd.randrange(5)}.'
+            f'{rnd.randrange(10)}:*:*:*:*:*:*:*' for _ in range(count)]
+
+
+def scan(cpes: List[str], pattern: str) -> List[str]:
+    matches = cpe_matcher(pattern)
+    return [cpe for cpe in cpes if matches(parse_cpe(cpe))]
+
+
+def report(label: str, func: Callable[[], object], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f'{label:<32} {seconds * 1000:10.3f} ms')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cpes = build_cpes(count)
+    index = CpeIndex((cpe, cpe) for cpe in cpes)
+    print(f'{count} CPEs')
+    for query in QUERIES:
+        assert scan(cpes, query) == index.match(query)
+        report(f'scan {query[10:]}', lambda: scan(cpes, query), 3)
+        report(f'index {query[10:]}', lambda: index.match(query), 3)
+    report('index build', lambda: CpeIndex((cpe, cpe) for cpe in cpes), 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Compares the specialized deserializer against the generic ``Bom.from_json`` of cyclonedx.
+
+Run with ``python -m benchmarks.bench_loader [component-count]``.
+"""
+import json
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from cyclonedx.model.bom import Bom
+
+from benchmarks.generator import write_document
+from siemens_standard_bom.loader import from_json
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    warnings.simplefilter('ignore')
+    with tempfile.TemporaryDirectory() as directory:
+        filename = write_document(Path(directory) / 'bench.cdx.json', count)
+        data = json.loads(filename.read_bytes())
+
+    start = time.perf_counter()
+    generic: Bom = Bom.from_json(data=data)  # type: ignore[attr-defined]
+    generic_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    specialized = from_json(data)
+    specialized_seconds = time.perf_counter() - start
+
+    specialized.serial_number = generic.serial_number
+    specialized.metadata.timestamp = generic.metadata.timestamp
+    assert specialized == generic
+    print(f'{count} components')
+    print(f'{"Bom.from_json":<16} {generic_seconds:8.2f} s')
+    print(f'{"from_json":<16} {specialized_seconds:8.2f} s ({generic_seconds / specialized_seconds:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Compares the component query planner against naive loops over ``StandardBom.components``.
+
+Run with ``python -m benchmarks.bench_query [component-count]``.
+"""
+import random
+import sys
+import timeit
+from typing import Callable, List
+
+from cyclonedx.model.component import Component, ComponentScope
+from cyclonedx.model.license import DisjunctiveLicense
+from packageurl import PackageURL
+
+from siemens_standard_bom.model import SbomComponent, StandardBom
+from siemens_standard_bom.query import ComponentIndex
+
+LICENSES = ['MIT', 'Apache-2.0', 'BSD-3-Clause', 'GPL-2.0-only', 'EPL-2.0']
+PURL_TYPES = ['maven', 'npm', 'pypi', 'golang', 'nuget']
+
+
+def build_sbom(count: int, seed: int = 42) -> StandardBom:
+    rnd = random.Random(seed)
+    sbom = StandardBom()
+    for i in range(count):
+        purl_type = rnd.choice(PURL_TYPES)
+        component = SbomComponent(Component(name=f'component-{i}', version=f'1.{i % 100}.0', bom_ref=f'ref-{i}'))
+        component.purl = PackageURL(type=purl_type, name=f'component-{i}', version=f'1.{i % 100}.0')
+        component.scope = rnd.choice(list(ComponentScope))
+        component.licenses = [DisjunctiveLicense(id=rnd.choice(LICENSES))]
+        component.internal = rnd.random() < 0.1
+        component.direct_dependency = 'true' if rnd.random() < 0.2 else 'false'
+        sbom.add_component(component)
+    return sbom
+
+
+def naive(sbom: StandardBom) -> List[str]:
+    return [c.name for c in sbom.components
+            if c.scope == ComponentScope.REQUIRED
+            and not c.internal
+            and c.purl is not None and c.purl.type == 'npm'
+            and any(getattr(lic, 'id', None) == 'EPL-2.0' for lic in c.licenses)]
+
+
+def planned(sbom: StandardBom, index: ComponentIndex | None = None) -> List[str]:
+    query = sbom.query(index).where(scope=ComponentScope.REQUIRED, internal=False, purl_type='npm')
+    return [c.name for c in query.license_in(['EPL-2.0'])]
+
+
+def report(label: str, func: Callable[[], object], number: int) -> None:
+    seconds = min(timeit.repeat(func, number=number, repeat=3)) / number
+    print(f'{label:<24} {seconds * 1000:10.3f} ms')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    sbom = build_sbom(count)
+    index = ComponentIndex(sbom.bom.components)
+    assert naive(sbom) == planned(sbom) == planned(sbom, index)
+
+    print(f'{count} components')
+    report('naive loop', lambda: naive(sbom), 5)
+    report('query', lambda: planned(sbom), 5)
+    report('query with index', lambda: planned(sbom, index), 5)
+    report('index build', lambda: ComponentIndex(sbom.bom.components), 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Compares the specialized JSON serializer against the generic ``JsonV1Dot6`` writer of cyclonedx.
+
+Run with ``python -m benchmarks.bench_serializer [component-count]``.
+"""
+import copy
+import random
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from cyclonedx.output.json import JsonV1Dot6
+
+from benchmarks.generator import write_document
+from siemens_standard_bom.parser import StandardBomParser
+from siemens_standard_bom.serializer import to_json
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    warnings.simplefilter('ignore')
+    with tempfile.TemporaryDirectory() as directory:
+        filename = write_document(Path(directory) / 'bench.cdx.json', count)
+        bom = StandardBomParser.parse(str(filename)).bom
+    # both writers add the missing dependency entries to the BOM, so each gets its own copy
+    copied = copy.deepcopy(bom)
+
+    # generated bom-refs for components without one are equal with the same seed
+    random.seed(42)
+    start = time.perf_counter()
+    specialized = to_json(copied, indent=4)
+    specialized_seconds = time.perf_counter() - start
+    random.seed(42)
+    start = time.perf_counter()
+    generic = JsonV1Dot6(bom=bom).output_as_string(indent=4)
+    generic_seconds = time.perf_counter() - start
+
+    assert specialized == generic
+    print(f'{count} components, {len(generic)} characters')
+    print(f'{"JsonV1Dot6":<16} {generic_seconds:8.2f} s')
+    print(f'{"to_json":<16} {specialized_seconds:8.2f} s ({generic_seconds / specialized_seconds:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Compares sorting components by ``Component.__lt__`` against sorting them by sort keys that
+read the leading fields of that order once per component.
+
+Run with ``python -m benchmarks.bench_sort_keys [component-count]``.
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+from sortedcontainers import SortedSet
+
+from benchmarks.generator import write_document
+from siemens_standard_bom.parser import StandardBomParser
+
+
+def timed(func: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def report(label: str, plain_seconds: float, keyed_seconds: float) -> None:
+    print(f'{label:<24} {plain_seconds:8.2f} s {keyed_seconds:8.2f} s ({plain_seconds / keyed_seconds:.1f}x)')
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with tempfile.TemporaryDirectory() as directory:
+        filename = write_document(Path(directory) / 'bench.cdx.json', count)
+        sbom = StandardBomParser.parse(str(filename))
+    components = list(sbom.bom.components)
+    random.Random(42).shuffle(components)
+    print(f'{count} components, plain and with sort keys')
+
+    expected, plain = timed(lambda: SortedSet(components))
+    _, keyed = timed(lambda: setattr(sbom, 'components', components))
+    assert list(expected) == list(sbom.bom.components)
+    report('components setter', plain, keyed)
+
+    wrappers = list(sbom.components)
+    random.Random(42).shuffle(wrappers)
+    expected, plain = timed(lambda: sorted(w.component for w in wrappers))
+    result, keyed = timed(lambda: sorted(wrappers))
+    assert expected == [w.component for w in result]
+    report('sorted wrappers', plain, keyed)
+
+    def rename() -> None:
+        with sbom.batch():
+            for wrapper in sbom.components[::10]:
+                wrapper.version = f'{wrapper.version}-patched'
+
+    # plain is only the sort a batch ended with before, keyed the whole batch including the changes
+    changed = list(sbom.bom.components)
+    _, keyed = timed(rename)
+    _, plain = timed(lambda: SortedSet(changed))
+    assert list(SortedSet(sbom.bom.components)) == list(sbom.bom.components)
+    report('batch of 10% changes', plain, keyed)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Measures the SQLite export and import of Standard BOMs and queries over a large collection.
+
+The same generated SBOM is stored repeatedly, so that ``components x sboms`` rows are loaded without parsing
+that many components. Run with ``python -m benchmarks.bench_sqlite [components] [sboms]``; the defaults load
+1,000,000 components.
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.generator import write_document
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+def main() -> None:
+    components = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    sboms = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    with tempfile.TemporaryDirectory() as tmp:
+        sbom = StandardBomParser.parse(str(write_document(Path(tmp) / 'sbom.cdx.json', components)))
+        purl = str(next(c.purl for c in sbom.components if c.purl is not None))
+        conn = sqlite3.connect(Path(tmp) / 'sboms.db')
+        try:
+            start = time.perf_counter()
+            for _ in range(sboms):
+                sbom_id = sbom.to_sqlite(conn)
+            elapsed = time.perf_counter() - start
+            print(f'{components * sboms} components in {sboms} SBOMs')
+            print(f'{"to_sqlite":<24} {elapsed:10.3f} s ({elapsed / sboms * 1000:.1f} ms per SBOM)')
+
+            start = time.perf_counter()
+            found = conn.execute('SELECT COUNT(*) FROM component WHERE purl = ?', (purl,)).fetchone()[0]
+            print(f'{"purl lookup":<24} {(time.perf_counter() - start) * 1000:10.3f} ms ({found} rows)')
+
+            start = time.perf_counter()
+            rows = conn.execute('SELECT s.id, c.purl FROM component c JOIN sbom s ON s.id = c.sbom_id '
+                                'JOIN license l ON l.component_id = c.id WHERE l.value = ?', ('EPL-2.0',)).fetchall()
+            print(f'{"license join":<24} {(time.perf_counter() - start) * 1000:10.3f} ms ({len(rows)} rows)')
+
+            start = time.perf_counter()
+            loaded = StandardBom.from_sqlite(conn, sbom_id)
+            print(f'{"from_sqlite":<24} {time.perf_counter() - start:10.3f} s ({len(loaded.components)} components)')
+        finally:
+            conn.close()
+
+
+if __name__ == '__main__':
+    main()
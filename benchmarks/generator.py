@@ -0,0 +1,156 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Seeded generator for synthetic but realistic Standard BOM documents.
+
+The documents are produced as plain JSON data, so that even very large SBOMs can be generated quickly and the
+parser is exercised exactly as with a file written by a scanner.
+"""
+import json
+import random
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+LICENSES = ['MIT', 'Apache-2.0', 'BSD-3-Clause', 'BSD-2-Clause', 'GPL-2.0-only', 'LGPL-2.1-or-later', 'EPL-2.0',
+            'MPL-2.0', 'ISC']
+ECOSYSTEMS = [
+    # purl type, primary language, archive extension
+    ('maven', 'Java', 'jar'),
+    ('npm', 'JavaScript', 'tgz'),
+    ('pypi', 'Python', 'whl'),
+    ('golang', 'Go', 'zip'),
+    ('nuget', 'C#', 'nupkg'),
+]
+WORDS = ['core', 'api', 'util', 'commons', 'http', 'json', 'log', 'test', 'io', 'net', 'codec', 'crypto', 'xml',
+         'cli', 'config', 'data', 'async', 'cache', 'auth', 'client']
+
+
+def _hex(rnd: random.Random, length: int) -> str:
+    return f'{rnd.getrandbits(length * 4):0{length}x}'
+
+
+def _hashes(rnd: random.Random) -> List[Dict[str, str]]:
+    return [
+        {'alg': 'MD5', 'content': _hex(rnd, 32)},
+        {'alg': 'SHA-1', 'content': _hex(rnd, 40)},
+        {'alg': 'SHA-256', 'content': _hex(rnd, 64)},
+        {'alg': 'SHA-512', 'content': _hex(rnd, 128)},
+    ]
+
+
+def _licenses(rnd: random.Random) -> List[Dict[str, Any]]:
+    roll = rnd.random()
+    if roll < 0.1:
+        return [{'expression': f'{rnd.choice(LICENSES)} OR {rnd.choice(LICENSES)}'}]
+    if roll < 0.2:
+        return [{'license': {'name': f'Custom License {rnd.randrange(100)}'}}]
+    return [{'license': {'id': rnd.choice(LICENSES)}}]
+
+
+def _component(rnd: random.Random, index: int) -> Dict[str, Any]:
+    purl_type, language, extension = rnd.choice(ECOSYSTEMS)
+    group = f'org.{rnd.choice(WORDS)}.{rnd.choice(WORDS)}'
+    name = f'{rnd.choice(WORDS)}-{rnd.choice(WORDS)}-{index}'
+    version = f'{rnd.randrange(10)}.{rnd.randrange(30)}.{rnd.randrange(100)}'
+    purl = f'pkg:{purl_type}/{group}/{name}@{version}'
+    filename = f'{name}-{version}.{extension}'
+    binary_hash = _hex(rnd, 40)
+    source_hash = _hex(rnd, 40)
+    properties = [
+        {'name': 'siemens:direct', 'value': 'true' if rnd.random() < 0.2 else 'false'},
+        {'name': 'siemens:filename', 'value': filename},
+        {'name': 'siemens:primaryLanguage', 'value': language},
+    ]
+    if rnd.random() < 0.1:
+        properties.append({'name': 'siemens:internal', 'value': 'true'})
+    if rnd.random() < 0.3:
+        properties.append({'name': 'siemens:thirdPartyNotices',
+                           'value': f'{name}\nCopyright {rnd.randrange(1995, 2025)} The {group} authors'})
+    return {
+        'type': 'library',
+        'bom-ref': purl,
+        'supplier': {'name': f'{rnd.choice(WORDS).title()} Foundation'},
+        'authors': [{'name': f'Author {rnd.randrange(10_000)}', 'email': f'author{index}@example.com'}],
+        'group': group,
+        'name': name,
+        'version': version,
+        'description': f'The {name} library for {rnd.choice(WORDS)} and {rnd.choice(WORDS)} handling.',
+        'scope': rnd.choice(['required', 'required', 'required', 'optional', 'excluded']),
+        'hashes': _hashes(rnd),
+        'licenses': _licenses(rnd),
+        'copyright': f'Copyright {rnd.randrange(1995, 2025)} The {group} authors',
+        'purl': purl,
+        'externalReferences': [
+            {'type': 'distribution', 'url': f'file:///binaries/{binary_hash}/{filename}', 'comment': 'relativePath'},
+            {'type': 'distribution', 'url': f'file:///sources/{source_hash}/{name}-{version}-sources.zip',
+             'comment': 'source archive (local copy)', 'hashes': _hashes(rnd)},
+            {'type': 'source-distribution',
+             'url': f'https://repo.example.com/{purl_type}/{group}/{name}/{version}/{name}-{version}-sources.zip',
+             'hashes': _hashes(rnd)},
+            {'type': 'website', 'url': f'https://{name}.example.org/'},
+            {'type': 'vcs', 'url': f'https://git.example.com/{group}/{name}'},
+        ],
+        'properties': properties,
+    }
+
+
+def _dependencies(rnd: random.Random, root_ref: str, refs: List[str]) -> List[Dict[str, Any]]:
+    direct = refs[:max(1, len(refs) // 10)]
+    dependencies = [{'ref': root_ref, 'dependsOn': direct}]
+    for position, ref in enumerate(refs):
+        # only later components are used as dependencies, so the graph is acyclic
+        later = len(refs) - position - 1
+        count = min(later, rnd.randrange(4))
+        targets = sorted({refs[position + 1 + rnd.randrange(later)] for _ in range(count)}) if later else []
+        dependencies.append({'ref': ref, 'dependsOn': targets})
+    return dependencies
+
+
+def generate_document(components: int, seed: int = 42) -> Dict[str, Any]:
+    """
+    Generates a Standard BOM document with the given number of components as JSON data.
+
+    Equal arguments always produce equal documents.
+    """
+    rnd = random.Random(seed)
+    root_ref = 'pkg:maven/com.example/generated-product@1.0.0'
+    comps = [_component(rnd, index) for index in range(components)]
+    return {
+        'bomFormat': 'CycloneDX',
+        'specVersion': '1.6',
+        'serialNumber': f'urn:uuid:{uuid.UUID(int=rnd.getrandbits(128), version=4)}',
+        'version': 1,
+        'metadata': {
+            'timestamp': '2025-01-01T00:00:00Z',
+            'tools': {'components': [{
+                'type': 'application',
+                'supplier': {'name': 'Siemens AG'},
+                'name': 'benchmark-generator',
+                'version': '1.0.0',
+            }]},
+            'component': {
+                'type': 'application',
+                'bom-ref': root_ref,
+                'group': 'com.example',
+                'name': 'generated-product',
+                'version': '1.0.0',
+                'purl': root_ref,
+                'properties': [{'name': 'siemens:vcsRevision', 'value': _hex(rnd, 40)},
+                               {'name': 'siemens:vcsClean', 'value': 'true'}],
+            },
+            'properties': [{'name': 'siemens:profile', 'value': 'clearing'},
+                           {'name': 'siemens:sbomNature', 'value': 'binary'}],
+        },
+        'components': comps,
+        'dependencies': _dependencies(rnd, root_ref, [c['bom-ref'] for c in comps]),
+    }
+
+
+def write_document(filename: str | Path, components: int, seed: int = 42) -> Path:
+    path = Path(filename)
+    path.parent.mkdir(exist_ok=True, parents=True)
+    path.write_text(json.dumps(generate_document(components, seed), indent=4), encoding='utf-8')
+    return path
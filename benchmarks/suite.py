@@ -0,0 +1,133 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Benchmark suite for the Standard BOM library.
+
+Every case runs against documents from the seeded generator and reports wall-clock time and the peak of
+Python memory allocations. The results are written as JSON, so that runs of different releases can be compared::
+
+    python -m benchmarks.suite --sizes 1000 10000 100000 --output benchmark-results.json
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.generator import write_document
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+DEFAULT_SIZES = [1_000, 10_000]
+Case = Callable[[], Any]
+
+
+def _component_access(sbom: StandardBom) -> int:
+    return sum(1 for c in sbom.components if c.name and c.version is not None and c.purl is not None)
+
+
+def _property_access(sbom: StandardBom) -> int:
+    return sum(1 for c in sbom.components
+               if c.direct_dependency or c.internal or c.primary_language or c.filename)
+
+
+def _cases(filename: Path, workdir: Path) -> Dict[str, Case]:
+    sbom = StandardBomParser.parse(str(filename))
+    output = workdir / 'output.cdx.json'
+
+    def round_trip() -> StandardBom:
+        StandardBomParser.save(sbom, str(output))
+        return StandardBomParser.parse(str(output))
+
+    return {
+        'parse': lambda: StandardBomParser.parse(str(filename)),
+        'serialize': lambda: StandardBomParser.serialize(sbom),
+        'save': lambda: StandardBomParser.save(sbom, str(output)),
+        'component_access': lambda: _component_access(sbom),
+        'property_access': lambda: _property_access(sbom),
+        'round_trip': round_trip,
+    }
+
+
+def _measure(case: Case, repeat: int) -> Dict[str, Any]:
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        case()
+        durations.append(time.perf_counter() - start)
+
+    # tracing allocations slows the code down, so memory is measured in a separate run
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds': {'min': min(durations), 'median': statistics.median(durations), 'max': max(durations)},
+        'peak_bytes': peak,
+    }
+
+
+def run(sizes: List[int], repeat: int = 3, seed: int = 42, cases: Optional[List[str]] = None) -> Dict[str, Any]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for size in sizes:
+            filename = write_document(workdir / f'generated-{size}.cdx.json', size, seed)
+            for name, case in _cases(filename, workdir).items():
+                if cases and name not in cases:
+                    continue
+                result: Dict[str, Any] = {'case': name, 'components': size, 'file_bytes': filename.stat().st_size}
+                result.update(_measure(case, repeat))
+                results.append(result)
+                print(f"{name:<18} {size:>9} components {result['seconds']['min']:10.3f} s "
+                      f"{result['peak_bytes'] / 1024 / 1024:10.1f} MiB", file=sys.stderr)
+
+    return {
+        'environment': {
+            'library_version': version('siemens-standard-bom'),
+            'cyclonedx_version': version('cyclonedx-python-lib'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'system': platform.system(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+        },
+        'parameters': {'sizes': sizes, 'repeat': repeat, 'seed': seed},
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='component counts of the generated documents, from 1000 up to 1000000')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case')
+    parser.add_argument('--seed', type=int, default=42, help='seed of the document generator')
+    parser.add_argument('--case', dest='cases', action='append', help='run only the given case, may be repeated')
+    parser.add_argument('--output', type=Path, help='JSON file for the results, stdout if omitted')
+    args = parser.parse_args(argv)
+
+    report = json.dumps(run(args.sizes, args.repeat, args.seed, args.cases), indent=2)
+    if args.output:
+        args.output.write_text(report, encoding='utf-8')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
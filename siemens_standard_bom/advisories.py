@@ -0,0 +1,224 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Offline matching of Standard BOM components against a local dump of OSV advisories.
+
+An ``AdvisoryIndex`` is loaded once from a directory of OSV JSON files and keyed by package, so that every
+component is looked up instead of being compared with every advisory. Versions are compared with a generic
+ordering that agrees with semantic versioning, Maven and PEP 440 for the common cases; ``GIT`` ranges cannot be
+evaluated against component versions and are ignored.
+"""
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from cyclonedx.model.vulnerability import BomTarget, Vulnerability, VulnerabilityReference, VulnerabilitySource
+from packageurl import PackageURL
+
+from siemens_standard_bom.model import SbomComponent, StandardBom
+
+# OSV ecosystem names and the purl types of their packages
+ECOSYSTEM_PURL_TYPES: Dict[str, str] = {
+    'Maven': 'maven',
+    'npm': 'npm',
+    'PyPI': 'pypi',
+    'Go': 'golang',
+    'NuGet': 'nuget',
+    'crates.io': 'cargo',
+    'RubyGems': 'gem',
+    'Packagist': 'composer',
+    'Hex': 'hex',
+    'Pub': 'pub',
+    'SwiftURL': 'swift',
+}
+
+OSV_SOURCE = VulnerabilitySource(name='OSV')
+
+_logger = logging.getLogger(__name__)
+
+_VERSION_TOKEN = re.compile(r'\d+|[a-z]+')
+_PRE_RELEASES = {'dev': 0, 'alpha': 1, 'a': 1, 'beta': 2, 'b': 2, 'milestone': 3, 'm': 3, 'rc': 4, 'cr': 4, 'pre': 4,
+                 'preview': 4, 'snapshot': 5}
+_RELEASES = ('final', 'ga', 'release')
+_POST_RELEASES = ('post', 'sp', 'patch', 'pl')
+_END = (2, 0, '')
+_ZERO = (4, 0, '')
+
+VersionKey = Tuple[Tuple[int, int, str], ...]
+
+
+def version_key(version: str) -> VersionKey:
+    """
+    Sort key of a version: numbers compare numerically, pre-releases sort before and post-releases after the
+    release, and trailing zeros and build metadata are ignored, so ``1.0-rc1 < 1.0 == 1.0.0 < 1.0-sp1 < 1.0.1``.
+    """
+    key: List[Tuple[int, int, str]] = []
+    for token in _VERSION_TOKEN.findall(version.lower().lstrip('v').split('+', 1)[0]):
+        if token.isdigit():
+            key.append((4, int(token), ''))
+            continue
+        # trailing zeros of a release number are insignificant, so 1.0-rc1 is 1-rc1
+        while key and key[-1] == _ZERO:
+            key.pop()
+        if token in _POST_RELEASES:
+            key.append((3, 0, token))
+        elif token not in _RELEASES:
+            key.append((1, _PRE_RELEASES.get(token, len(_PRE_RELEASES)), token))
+    while key and key[-1] == _ZERO:
+        key.pop()
+    return tuple(key) + (_END,)
+
+
+def _normalize(purl_type: str, namespace: Optional[str], name: str) -> str:
+    if purl_type == 'pypi':
+        name = re.sub(r'[-_.]+', '-', name)
+    return f"{purl_type}/{namespace or ''}/{name}".lower()
+
+
+def _package_key(package: Dict[str, Any]) -> Optional[str]:
+    if package.get('purl'):
+        purl = PackageURL.from_string(package['purl'])
+        return _normalize(purl.type, purl.namespace, purl.name)
+    purl_type = ECOSYSTEM_PURL_TYPES.get(package.get('ecosystem', '').split(':', 1)[0])
+    name: str = package.get('name', '')
+    if purl_type is None or not name:
+        return None
+    separator = ':' if purl_type == 'maven' else '/'
+    namespace, _, name = name.rpartition(separator)
+    return _normalize(purl_type, namespace, name)
+
+
+def _in_range(version: VersionKey, events: Iterable[Tuple[VersionKey, str]]) -> bool:
+    # the state at the version is decided by the last event at or below it
+    affected = False
+    for event_version, kind in events:
+        if kind == 'last_affected':
+            if version > event_version:
+                affected = False
+        elif version >= event_version:
+            affected = kind == 'introduced'
+        else:
+            break
+    return affected
+
+
+class Advisory(NamedTuple):
+    """The fields of an OSV advisory used for matching and annotation."""
+
+    id: str
+    summary: Optional[str]
+    aliases: Tuple[str, ...]
+    data: Dict[str, Any]
+
+
+class AdvisoryMatch(NamedTuple):
+    component: SbomComponent
+    advisory: Advisory
+
+
+class _Affected(NamedTuple):
+    advisory: Advisory
+    versions: frozenset[str]
+    # per range, the events sorted by version
+    ranges: Tuple[Tuple[Tuple[VersionKey, str], ...], ...]
+
+    def affects(self, version: str) -> bool:
+        if version in self.versions:
+            return True
+        key = version_key(version)
+        return any(_in_range(key, events) for events in self.ranges)
+
+
+def _affected(advisory: Advisory, affected: Dict[str, Any]) -> _Affected:
+    ranges = []
+    for affected_range in affected.get('ranges', ()):
+        if affected_range.get('type') == 'GIT':
+            continue
+        events = []
+        for event in affected_range.get('events', ()):
+            for kind in ('introduced', 'fixed', 'last_affected', 'limit'):
+                if kind in event:
+                    value = event[kind]
+                    events.append(((), kind) if kind == 'introduced' and value == '0' else (version_key(value), kind))
+        # an introduction sorts before a fix of the same version, which then wins
+        ranges.append(tuple(sorted(events, key=lambda e: (e[0], e[1] != 'introduced'))))
+    return _Affected(advisory, frozenset(affected.get('versions', ())), tuple(ranges))
+
+
+class AdvisoryIndex:
+    """
+    OSV advisories keyed by purl type, namespace and name.
+
+    Withdrawn advisories are skipped. A component is affected if its version is listed explicitly or lies in
+    one of the ``SEMVER`` or ``ECOSYSTEM`` ranges of an affected package. Affected packages with a malformed purl
+    are skipped as well; they are logged and kept in ``errors`` by advisory id.
+    """
+
+    def __init__(self, advisories: Iterable[Dict[str, Any]] = ()) -> None:
+        self._packages: Dict[str, List[_Affected]] = {}
+        self.count = 0
+        self.errors: Dict[str, List[str]] = {}
+        for data in advisories:
+            self.add(data)
+
+    @staticmethod
+    def load(directory: str | Path) -> 'AdvisoryIndex':
+        """Loads all ``*.json`` files below a directory, one OSV advisory per file."""
+        paths = sorted(Path(directory).rglob('*.json'))
+        return AdvisoryIndex(json.loads(path.read_bytes()) for path in paths)
+
+    def add(self, data: Dict[str, Any]) -> None:
+        if data.get('withdrawn'):
+            return
+        advisory = Advisory(data['id'], data.get('summary'), tuple(data.get('aliases', ())), data)
+        for affected in data.get('affected', ()):
+            try:
+                key = _package_key(affected.get('package', {}))
+            except ValueError as e:
+                # one broken entry must not stop the loading of the dump
+                _logger.warning('%s: %s', advisory.id, e)
+                self.errors.setdefault(advisory.id, []).append(str(e))
+                continue
+            if key is not None:
+                self._packages.setdefault(key, []).append(_affected(advisory, affected))
+        self.count += 1
+
+    def advisories_for(self, purl: PackageURL, version: Optional[str] = None) -> List[Advisory]:
+        """The advisories affecting a package, in the version of the purl unless ``version`` is given."""
+        version = version or purl.version
+        if version is None:
+            return []
+        found: Dict[str, Advisory] = {}
+        for affected in self._packages.get(_normalize(purl.type, purl.namespace, purl.name), ()):
+            if affected.advisory.id not in found and affected.affects(version):
+                found[affected.advisory.id] = affected.advisory
+        return list(found.values())
+
+    def match(self, sbom: StandardBom, annotate: bool = False) -> List[AdvisoryMatch]:
+        """
+        Matches all components of the SBOM in a single pass.
+
+        With ``annotate``, every advisory that was found is added to the vulnerabilities of the SBOM, affecting
+        the bom-refs of the matching components. Components without a bom-ref cannot be referenced and are left
+        out of the annotations.
+        """
+        matches = [AdvisoryMatch(component, advisory) for component in sbom.components if component.purl is not None
+                   for advisory in self.advisories_for(component.purl, component.version)]
+        if annotate:
+            affected: Dict[str, Tuple[Advisory, List[str]]] = {}
+            for component, advisory in matches:
+                if component.bom_ref.value:
+                    affected.setdefault(advisory.id, (advisory, []))[1].append(component.bom_ref.value)
+            for advisory, refs in affected.values():
+                sbom.add_vulnerability(_vulnerability(advisory, refs))
+        return matches
+
+
+def _vulnerability(advisory: Advisory, refs: Iterable[str]) -> Vulnerability:
+    return Vulnerability(id=advisory.id, source=OSV_SOURCE, description=advisory.summary,
+                         references=[VulnerabilityReference(id=alias, source=OSV_SOURCE) for alias in advisory.aliases],
+                         affects=[BomTarget(ref=ref) for ref in refs])
@@ -0,0 +1,45 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+import weakref
+from typing import Any, Dict, Generic, Optional, TypeVar
+
+V = TypeVar('V')
+
+
+class IdentityCache(Generic[V]):
+    """
+    Associates values with objects by identity, without keeping the objects alive.
+
+    The cyclonedx model classes are mutable but hashable by value, so they cannot be used as keys of a
+    ``WeakKeyDictionary``. Entries are dropped automatically once the keyed object is garbage collected.
+    """
+
+    __slots__ = ('_values', '_finalizers')
+
+    def __init__(self) -> None:
+        self._values: Dict[int, V] = {}
+        self._finalizers: Dict[int, 'weakref.finalize[..., Any]'] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, obj: object) -> Optional[V]:
+        return self._values.get(id(obj))
+
+    def set(self, obj: object, value: V) -> None:
+        key = id(obj)
+        if key not in self._finalizers:
+            self._finalizers[key] = weakref.finalize(obj, self._forget, key)
+        self._values[key] = value
+
+    def discard(self, obj: object) -> None:
+        self._values.pop(id(obj), None)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def _forget(self, key: int) -> None:
+        self._values.pop(key, None)
+        self._finalizers.pop(key, None)
@@ -0,0 +1,228 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Inverted index over a directory tree of Standard BOM files.
+
+``SbomCorpusIndex`` answers "which SBOMs contain X" by purl, by coordinates and by license without parsing the
+files again. The components of every file are persisted as JSON together with the size, the modification time
+and the SHA-256 digest of the file; ``update`` re-parses only new and changed files, on a process pool.
+"""
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from cyclonedx.exception import CycloneDxException
+from cyclonedx.model import HashAlgorithm
+
+from siemens_standard_bom.cpe import CpeIndex
+from siemens_standard_bom.hashing import hash_file
+from siemens_standard_bom.parser import StandardBomParser
+from siemens_standard_bom.purl import purl_key
+
+INDEX_VERSION = 2
+DEFAULT_PATTERN = '*.cdx.json'
+
+_FIELDS = ('bom_ref', 'purl', 'group', 'name', 'version', 'licenses', 'cpe')
+_SHA_256 = (HashAlgorithm.SHA_256,)
+# errors of a broken file: invalid JSON or values, and a structure the deserializer trips over with a TypeError,
+# AttributeError or KeyError; other errors, e.g. of the environment, are raised
+_PARSE_ERRORS = (ValueError, TypeError, AttributeError, KeyError, CycloneDxException)
+
+
+class CorpusHit(NamedTuple):
+    """A component found in the corpus: the file relative to the root directory and the bom-ref."""
+
+    file: str
+    bom_ref: Optional[str]
+
+
+class CorpusUpdate(NamedTuple):
+    """Files handled by ``SbomCorpusIndex.update``, relative to the root directory."""
+
+    parsed: List[str]
+    unchanged: List[str]
+    removed: List[str]
+    failed: Dict[str, str]
+
+
+def _sha256(path: Path) -> str:
+    return hash_file(path, _SHA_256)[HashAlgorithm.SHA_256]
+
+
+def _index_file(path: Path) -> Dict[str, Any]:
+    # runs in the worker processes, so it must be a module level function with picklable arguments and results;
+    # the file is hashed before it is parsed, so that a change while parsing is noticed by the next update
+    entry: Dict[str, Any] = {'sha256': _sha256(path)}
+    try:
+        columns = StandardBomParser.parse(str(path)).to_columns(_FIELDS)
+    except _PARSE_ERRORS as e:  # a broken file must not stop the indexing of the other files
+        entry['error'] = f"{type(e).__name__}: {e}"
+        return entry
+    entry['components'] = [list(row) for row in zip(*(columns[name] for name in _FIELDS))]
+    return entry
+
+
+def _coordinates(group: Optional[str], name: str, version: Optional[str]) -> str:
+    return f"{group or ''}:{name}:{version or ''}"
+
+
+class SbomCorpusIndex:
+    """
+    Index from purls, coordinates (``group:name:version``) and licenses to the components of the SBOM files
+    below a root directory.
+
+    ``filename`` is the JSON file the index is persisted to; without it, the index is kept in memory only. A file
+    is re-parsed by ``update`` when its size changed, or when its modification time changed and so did its
+    SHA-256 digest. Files that cannot be parsed are recorded with their error and retried by every ``update``.
+    """
+
+    root: Path
+    filename: Optional[Path]
+
+    def __init__(self, root: str | Path, filename: Optional[str | Path] = None, pattern: str = DEFAULT_PATTERN) -> None:
+        self.root = Path(root)
+        self.filename = Path(filename) if filename is not None else None
+        self.pattern = pattern
+        self._files: Dict[str, Dict[str, Any]] = {}
+        if self.filename is not None and self.filename.is_file():
+            try:
+                data = json.loads(self.filename.read_text(encoding='utf-8'))
+            except ValueError:
+                # a corrupt index only costs a full parse sweep
+                data = {}
+            if data.get('version') == INDEX_VERSION:
+                self._files = data['files']
+        self._postings: Dict[Tuple[str, str], Set[CorpusHit]] = {}
+        self._cpes: Optional[CpeIndex[CorpusHit]] = None
+        for file, entry in self._files.items():
+            self._add_postings(file, entry)
+
+    def _add_postings(self, file: str, entry: Dict[str, Any]) -> None:
+        self._cpes = None
+        for bom_ref, purl, group, name, version, licenses, _ in entry.get('components', ()):
+            hit = CorpusHit(file, bom_ref)
+            keys = [('coordinates', _coordinates(group, name, version))]
+            keys += [('license', label) for label in licenses]
+            if purl is not None:
+                keys.append(('purl', purl))
+            for key in keys:
+                self._postings.setdefault(key, set()).add(hit)
+
+    def _remove_postings(self, file: str, entry: Dict[str, Any]) -> None:
+        self._cpes = None
+        for bom_ref, purl, group, name, version, licenses, _ in entry.get('components', ()):
+            hit = CorpusHit(file, bom_ref)
+            keys = [('coordinates', _coordinates(group, name, version)), ('purl', purl)]
+            keys += [('license', label) for label in licenses]
+            for key in keys:
+                hits = self._postings.get(key)
+                if hits is not None:
+                    hits.discard(hit)
+                    if not hits:
+                        del self._postings[key]
+
+    def _is_unchanged(self, path: Path, entry: Optional[Dict[str, Any]], size: int, mtime_ns: int) -> bool:
+        if entry is None or 'error' in entry or entry['size'] != size:
+            return False
+        if entry['mtime_ns'] == mtime_ns:
+            return True
+        # touched, but possibly with the same content
+        if _sha256(path) != entry['sha256']:
+            return False
+        entry['mtime_ns'] = mtime_ns
+        return True
+
+    def _scan(self) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
+        unchanged: List[str] = []
+        changed: Dict[str, Dict[str, Any]] = {}
+        for path in sorted(self.root.rglob(self.pattern)):
+            if not path.is_file():
+                continue
+            file = path.relative_to(self.root).as_posix()
+            stat = path.stat()
+            if self._is_unchanged(path, self._files.get(file), stat.st_size, stat.st_mtime_ns):
+                unchanged.append(file)
+            else:
+                changed[file] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        return unchanged, changed
+
+    def update(self, workers: Optional[int] = None) -> CorpusUpdate:
+        """
+        Brings the index up to date with the files below the root directory and saves it.
+
+        New and changed files are parsed on a process pool with ``workers`` processes; ``workers=1`` parses on
+        the calling process.
+        """
+        unchanged, changed = self._scan()
+        removed = sorted(set(self._files) - set(unchanged) - set(changed))
+
+        # parsed before the index is touched, so that an error other than a broken file leaves it as it was
+        paths = [self.root / file for file in changed]
+        if workers == 1 or len(paths) <= 1:
+            results = list(map(_index_file, paths))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_index_file, paths, chunksize=max(1, len(paths) // 256)))
+
+        for file in [*removed, *changed]:
+            if file in self._files:
+                self._remove_postings(file, self._files.pop(file))
+        for (file, entry), result in zip(changed.items(), results):
+            entry.update(result)
+            self._files[file] = entry
+            self._add_postings(file, entry)
+
+        self.save()
+        failed = {file: entry['error'] for file, entry in changed.items() if 'error' in entry}
+        return CorpusUpdate(list(changed), unchanged, removed, failed)
+
+    def save(self) -> None:
+        if self.filename is not None:
+            self.filename.parent.mkdir(exist_ok=True, parents=True)
+            data = {'version': INDEX_VERSION, 'files': self._files}
+            self.filename.write_text(json.dumps(data, sort_keys=True), encoding='utf-8')
+
+    @property
+    def files(self) -> List[str]:
+        """The indexed files relative to the root directory, including those that could not be parsed."""
+        return sorted(self._files)
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """The files that could not be parsed, with their error."""
+        return {file: entry['error'] for file, entry in self._files.items() if 'error' in entry}
+
+    def _cpe_index(self) -> CpeIndex[CorpusHit]:
+        if self._cpes is None:
+            self._cpes = CpeIndex((cpe, CorpusHit(file, bom_ref)) for file, entry in self._files.items()
+                                  for bom_ref, *_, cpe in entry.get('components', ()) if cpe)
+        return self._cpes
+
+    def find(self, purl: Optional[str] = None, coordinates: Optional[str] = None,
+             license: Optional[str] = None, cpe: Optional[str] = None) -> List[CorpusHit]:
+        """
+        Components matching all of the given criteria, sorted by file and bom-ref.
+
+        ``purl`` is compared by its canonical key, see ``purl_key``, ``coordinates`` is ``group:name:version`` with
+        empty parts for a missing group or version, and ``license`` is an SPDX id, a license name or an
+        expression. ``cpe`` is a CPE pattern that may contain wildcards, see ``CpeIndex.match``.
+        """
+        if purl is not None:
+            purl = purl_key(purl)
+        keys = [(kind, value) for kind, value in (('purl', purl), ('coordinates', coordinates), ('license', license))
+                if value is not None]
+        if not keys and cpe is None:
+            raise ValueError("At least one of purl, coordinates, license and cpe is required")
+        hits: Optional[Set[CorpusHit]] = set(self._cpe_index().match(cpe)) if cpe is not None else None
+        for key in sorted(keys, key=lambda k: len(self._postings.get(k, ()))):
+            found = self._postings.get(key, set())
+            hits = set(found) if hits is None else hits & found
+        return sorted(hits or (), key=lambda hit: (hit.file, hit.bom_ref or ''))
+
+    def files_containing(self, purl: Optional[str] = None, coordinates: Optional[str] = None,
+                         license: Optional[str] = None, cpe: Optional[str] = None) -> List[str]:
+        """The files with at least one component matching all of the given criteria, see ``find``."""
+        return sorted({hit.file for hit in self.find(purl, coordinates, license, cpe)})
@@ -0,0 +1,200 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Parsed CPE names and an index for wildcard CPE queries.
+
+CPE 2.3 formatted strings and CPE 2.2 URIs are parsed into ``Cpe`` tuples once per distinct string. The values
+are kept in the escaped form of the formatted string binding and lower-cased, ``*`` is ANY and ``-`` is NA.
+"""
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, Iterator, List, NamedTuple, Optional, \
+    Tuple, TypeVar
+from urllib.parse import unquote
+
+if TYPE_CHECKING:  # pragma: no cover
+    from cyclonedx.model.component import Component
+    from siemens_standard_bom.model import SbomComponent
+
+T = TypeVar('T')
+
+ANY = '*'
+NA = '-'
+
+_FS_UNQUOTED = re.compile(r'[^0-9a-z._-]')
+_WILDCARD = re.compile(r'(?<!\\)[*?]')
+
+
+class Cpe(NamedTuple):
+    part: str = ANY
+    vendor: str = ANY
+    product: str = ANY
+    version: str = ANY
+    update: str = ANY
+    edition: str = ANY
+    language: str = ANY
+    sw_edition: str = ANY
+    target_sw: str = ANY
+    target_hw: str = ANY
+    other: str = ANY
+
+    def __str__(self) -> str:
+        return ':'.join(('cpe', '2.3') + self)
+
+
+def _split_fs(value: str) -> List[str]:
+    # a backslash escapes the following character, so separators are the colons after an even number of them
+    fields, start, escaped = [], 0, False
+    for position, char in enumerate(value):
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == ':':
+            fields.append(value[start:position])
+            start = position + 1
+    fields.append(value[start:])
+    return fields
+
+
+def _from_uri_value(value: str) -> str:
+    if value in ('', '*'):
+        return ANY
+    if value == NA:
+        return NA
+    return _FS_UNQUOTED.sub(lambda m: '\\' + m.group(), unquote(value))
+
+
+@lru_cache(maxsize=65536)
+def parse_cpe(value: str) -> Cpe:
+    """
+    Parses a CPE 2.3 formatted string or a CPE 2.2 URI; missing trailing attributes are ANY.
+
+    Raises ``ValueError`` for other strings.
+    """
+    lowered = value.strip().lower()
+    if lowered.startswith('cpe:2.3:'):
+        fields = _split_fs(lowered)[2:]
+        if len(fields) > len(Cpe._fields) or not all(fields):
+            raise ValueError(f"Malformed CPE 2.3 name: {value}")
+        return Cpe(*fields)
+    if lowered.startswith('cpe:/'):
+        fields = lowered[len('cpe:/'):].split(':')
+        if len(fields) > 7:
+            raise ValueError(f"Malformed CPE 2.2 URI: {value}")
+        return Cpe(*map(_from_uri_value, fields))
+    raise ValueError(f"Not a CPE name: {value}")
+
+
+def _value_matcher(pattern: str) -> Callable[[str], bool]:
+    if pattern == ANY:
+        return lambda _: True
+    if pattern == NA or not _WILDCARD.search(pattern):
+        return lambda value: value == pattern or value == ANY
+    regex = re.compile(''.join('.*' if part == '*' else '.' if part == '?' else re.escape(part)
+                               for part in re.split(r'((?<!\\)[*?])', pattern) if part))
+    return lambda value: value == ANY or (value != NA and regex.fullmatch(value) is not None)
+
+
+def cpe_matcher(pattern: str | Cpe) -> Callable[[Cpe], bool]:
+    """
+    Predicate telling whether a CPE name is matched by a pattern.
+
+    ANY and unescaped ``*`` and ``?`` wildcards in the pattern match any value; an ANY value of the tested name
+    matches every pattern value, as the two names are then not disjoint.
+    """
+    parsed = parse_cpe(pattern) if isinstance(pattern, str) else pattern
+    matchers = [(position, _value_matcher(value)) for position, value in enumerate(parsed) if value != ANY]
+    return lambda cpe: all(matcher(cpe[position]) for position, matcher in matchers)
+
+
+class _Level:
+    """Children of one level of the index, by attribute value, with the values sorted for prefix lookups."""
+
+    __slots__ = ('children', '_keys')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, Any] = {}
+        self._keys: Optional[List[str]] = None
+
+    def child(self, key: str, factory: Callable[[], Any]) -> Any:
+        if key not in self.children:
+            self.children[key] = factory()
+            self._keys = None
+        return self.children[key]
+
+    def _sorted_keys(self) -> List[str]:
+        if self._keys is None:
+            self._keys = sorted(self.children)
+        return self._keys
+
+    def lookup(self, pattern: str) -> Iterator[Any]:
+        if pattern == ANY:
+            yield from self.children.values()
+            return
+        if ANY in self.children:
+            yield self.children[ANY]
+        wildcard = _WILDCARD.search(pattern)
+        if pattern == NA or wildcard is None:
+            if pattern in self.children:
+                yield self.children[pattern]
+            return
+        matches = _value_matcher(pattern)
+        keys = self._sorted_keys()
+        prefix = pattern[:wildcard.start()]
+        for key in keys[bisect_left(keys, prefix):]:
+            if not key.startswith(prefix):
+                break
+            if key != ANY and matches(key):
+                yield self.children[key]
+
+
+class CpeIndex(Generic[T]):
+    """
+    Items keyed by CPE name in a vendor, product and version tree.
+
+    A query descends only into the branches whose values can match the pattern: exact values are dictionary
+    lookups and values with a literal prefix before a wildcard are found by bisection. The remaining attributes
+    are tested on the candidates. Malformed CPE names are skipped.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str | Cpe, T]] = ()) -> None:
+        self._root = _Level()
+        self._size = 0
+        for cpe, item in entries:
+            self.add(cpe, item)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def of_components(components: Iterable['Component | SbomComponent']) -> 'CpeIndex[SbomComponent]':
+        """Index of the components with a CPE, for example ``CpeIndex.of_components(sbom.components)``."""
+        from siemens_standard_bom.model import SbomComponent
+
+        wrapped = (c if isinstance(c, SbomComponent) else SbomComponent(c) for c in components)
+        return CpeIndex((c.cpe, c) for c in wrapped if c.cpe)
+
+    def add(self, cpe: str | Cpe, item: T) -> None:
+        try:
+            parsed = parse_cpe(cpe) if isinstance(cpe, str) else cpe
+        except ValueError:
+            return
+        products = self._root.child(parsed.vendor, _Level)
+        versions = products.child(parsed.product, _Level)
+        versions.child(parsed.version, list).append((self._size, parsed, item))
+        self._size += 1
+
+    def match(self, pattern: str | Cpe) -> List[T]:
+        """The items whose CPE is matched by the pattern, see ``cpe_matcher``, in the order they were added."""
+        parsed = parse_cpe(pattern) if isinstance(pattern, str) else pattern
+        matches = cpe_matcher(parsed)
+        found: List[Tuple[int, Cpe, T]] = []
+        for products in self._root.lookup(parsed.vendor):
+            for versions in products.lookup(parsed.product):
+                for entries in versions.lookup(parsed.version):
+                    found.extend(entry for entry in entries if matches(entry[1]))
+        return [item for _, _, item in sorted(found, key=lambda entry: entry[0])]
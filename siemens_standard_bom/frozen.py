@@ -0,0 +1,239 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+import copy
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NoReturn, Optional, TypeVar
+
+from cyclonedx.model import ExternalReference, HashAlgorithm
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.contact import OrganizationalContact, OrganizationalEntity
+from cyclonedx.model.definition import Definitions
+from cyclonedx.model.license import License, LicenseRepository
+from cyclonedx.model.vulnerability import Vulnerability
+from sortedcontainers import SortedSet
+
+from siemens_standard_bom.hashing import HashResult
+from siemens_standard_bom.immutable import ImmutableList
+from siemens_standard_bom.model import ExternalComponent, SbomComponent, SourceArtifact, StandardBom, _Sharing, \
+    _detached_copy
+from siemens_standard_bom.query import ComponentIndex, ComponentQuery
+
+T = TypeVar('T')
+
+
+def _read_only(obj: object) -> NoReturn:
+    raise AttributeError(f"{type(obj).__name__} is read-only")
+
+
+class _ReadOnly:
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        _read_only(self)
+
+    def __delattr__(self, name: str) -> None:
+        _read_only(self)
+
+
+def _copy(obj: T) -> T:
+    # the getters hand out copies of the mutable model objects, so that callers cannot change the snapshot
+    return copy.deepcopy(obj)
+
+
+class FrozenExternalComponent(_ReadOnly, ExternalComponent):
+    def __init__(self, external_ref: ExternalReference) -> None:
+        object.__setattr__(self, 'reference', _copy(external_ref))
+
+
+class FrozenSourceArtifact(_ReadOnly, SourceArtifact):
+    def __init__(self, external_ref: ExternalReference) -> None:
+        object.__setattr__(self, 'external_ref', _copy(external_ref))
+
+
+class FrozenSbomComponent(_ReadOnly, SbomComponent):
+    """
+    Component wrapper of a ``FrozenStandardBom``; setters and ``add_*`` methods raise ``AttributeError``, and the
+    getters of nested model objects return copies.
+    """
+
+    def __init__(self, component: Component) -> None:
+        object.__setattr__(self, 'component', component)
+
+    def _change(self) -> NoReturn:
+        _read_only(self)
+
+    @property
+    def authors(self) -> ImmutableList[OrganizationalContact]:
+        return ImmutableList(*map(_copy, super().authors))
+
+    @authors.setter
+    def authors(self, authors: Iterable[OrganizationalContact]) -> None:
+        _read_only(self)
+
+    @property
+    def supplier(self) -> Optional[OrganizationalEntity]:
+        return _copy(self.component.supplier)
+
+    @supplier.setter
+    def supplier(self, value: OrganizationalEntity) -> None:
+        _read_only(self)
+
+    @property
+    def licenses(self) -> LicenseRepository:
+        return _copy(self.component.licenses)
+
+    @licenses.setter
+    def licenses(self, licenses: Iterable[License]) -> None:
+        _read_only(self)
+
+    @property
+    def sources(self) -> List[SourceArtifact]:
+        return [FrozenSourceArtifact(s.external_ref) for s in super().sources]
+
+    @property
+    def local_sources(self) -> List[SourceArtifact]:
+        return [FrozenSourceArtifact(s.external_ref) for s in super().local_sources]
+
+    @property
+    def remote_sources(self) -> List[SourceArtifact]:
+        return [FrozenSourceArtifact(s.external_ref) for s in super().remote_sources]
+
+    @property
+    def external_components(self) -> ImmutableList[ExternalComponent]:
+        return ImmutableList(*map(FrozenExternalComponent, self.component.external_references))
+
+
+class FrozenStandardBom(_ReadOnly, StandardBom):
+    """
+    Read-only snapshot of a ``StandardBom``, created by ``StandardBom.freeze()``.
+
+    Component wrappers, tools and the query index are built once, so the getters do not change any state and the
+    view can be shared between threads without locks; serializing it does not change it either. Every setter and
+    ``add_*`` method raises ``AttributeError``. The snapshot has its own copy of the document; ``bom`` and the
+    getters of nested model objects, such as ``supplier`` or the licenses of a component, return copies.
+    """
+
+    _frozen_components: ImmutableList[SbomComponent]
+    _wrappers: Dict[int, SbomComponent]
+    _index: ComponentIndex
+    _frozen_tools: ImmutableList[SbomComponent]
+    _frozen_component: Optional[SbomComponent]
+
+    def __init__(self, bom: Bom) -> None:
+        object.__setattr__(self, '_bom', bom)
+        object.__setattr__(self, '_build', None)
+        components = ImmutableList[SbomComponent](*map(FrozenSbomComponent, bom.components))
+        metadata_component = bom.metadata.component
+        # set up here, as clone() cannot set it on the snapshot
+        sharing = _Sharing({})
+        weakref.finalize(self, sharing.release_all)
+        attributes: Dict[str, Any] = {
+            '_ref': None,
+            '_sharing': sharing,
+            '_batch': None,
+            '_frozen_components': components,
+            '_wrappers': {id(c.component): c for c in components},
+            '_index': ComponentIndex(components),
+            '_frozen_tools': ImmutableList(*(FrozenSbomComponent(t.component) for t in super().tools)),
+            '_frozen_component': FrozenSbomComponent(metadata_component) if metadata_component is not None else None,
+        }
+        for name, value in attributes.items():
+            object.__setattr__(self, name, value)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        sharing = _Sharing({})
+        weakref.finalize(self, sharing.release_all)
+        self.__dict__.update(state, _ref=None, _sharing=sharing, _batch=None)
+
+    def _wrap(self, component: Component) -> SbomComponent:
+        return self._wrappers[id(component)]
+
+    @property
+    def bom(self) -> Bom:
+        return _detached_copy(self._bom)
+
+    @bom.setter
+    def bom(self, bom: Bom) -> None:
+        _read_only(self)
+
+    def freeze(self) -> 'FrozenStandardBom':
+        return self
+
+    def normalize_v2(self) -> NoReturn:
+        _read_only(self)
+
+    @property
+    def components(self) -> ImmutableList[SbomComponent]:
+        return self._frozen_components
+
+    @components.setter
+    def components(self, components: Iterable[Component]) -> None:
+        _read_only(self)
+
+    def query(self, index: Optional[ComponentIndex] = None) -> ComponentQuery:
+        return ComponentQuery(self._index.components, index or self._index, wrap=self._wrap)
+
+    @property
+    def external_components(self) -> ImmutableList[ExternalComponent]:
+        return ImmutableList(*map(FrozenExternalComponent, self._bom.external_references))
+
+    @property
+    def vulnerabilities(self) -> ImmutableList[Vulnerability]:
+        return ImmutableList(*map(_copy, self._bom.vulnerabilities))
+
+    @property
+    def tools(self) -> ImmutableList[SbomComponent]:
+        return self._frozen_tools
+
+    @property
+    def component(self) -> Optional[SbomComponent]:
+        return self._frozen_component
+
+    @component.setter
+    def component(self, component: Component | SbomComponent) -> None:
+        _read_only(self)
+
+    @property
+    def authors(self) -> 'SortedSet[OrganizationalContact]':
+        return _copy(self._bom.metadata.authors)
+
+    @authors.setter
+    def authors(self, authors: Iterable[OrganizationalContact]) -> None:
+        _read_only(self)
+
+    @property
+    def supplier(self) -> Optional[OrganizationalEntity]:
+        return _copy(self._bom.metadata.supplier)
+
+    @property
+    def definitions(self) -> Optional[Definitions]:
+        return _copy(self._bom.definitions)
+
+    @definitions.setter
+    def definitions(self, definitions: Definitions) -> None:
+        _read_only(self)
+
+    def add_component(self, component: Component | SbomComponent) -> None:
+        _read_only(self)
+
+    def add_external_component(self, external: ExternalReference | ExternalComponent) -> None:
+        _read_only(self)
+
+    def add_author(self, author: OrganizationalContact) -> None:
+        _read_only(self)
+
+    def add_vulnerability(self, vulnerability: Vulnerability) -> None:
+        _read_only(self)
+
+    def add_tool(self, tool: Component | SbomComponent) -> None:
+        _read_only(self)
+
+    def compute_hashes(self, base_dir: str | Path,
+                       algorithms: Iterable[HashAlgorithm] = (HashAlgorithm.SHA_256,),
+                       workers: Optional[int] = None,
+                       cache_file: Optional[str | Path] = None) -> Dict[Path, HashResult]:
+        _read_only(self)
@@ -0,0 +1,135 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from cyclonedx.model import HashAlgorithm
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_HASH_FACTORIES: Dict[HashAlgorithm, Callable[[], Any]] = {
+    HashAlgorithm.MD5: hashlib.md5,
+    HashAlgorithm.SHA_1: hashlib.sha1,
+    HashAlgorithm.SHA_256: hashlib.sha256,
+    HashAlgorithm.SHA_384: hashlib.sha384,
+    HashAlgorithm.SHA_512: hashlib.sha512,
+    HashAlgorithm.SHA3_256: hashlib.sha3_256,
+    HashAlgorithm.SHA3_384: hashlib.sha3_384,
+    HashAlgorithm.SHA3_512: hashlib.sha3_512,
+    HashAlgorithm.BLAKE2B_256: lambda: hashlib.blake2b(digest_size=32),
+    HashAlgorithm.BLAKE2B_384: lambda: hashlib.blake2b(digest_size=48),
+    HashAlgorithm.BLAKE2B_512: lambda: hashlib.blake2b(digest_size=64),
+}
+
+SUPPORTED_ALGORITHMS = frozenset(_HASH_FACTORIES)
+
+HashResult = Dict[HashAlgorithm, str] | OSError
+
+_buffers = threading.local()
+
+
+def _read_buffer(size: int) -> bytearray:
+    buffer: Optional[bytearray] = getattr(_buffers, 'buffer', None)
+    if buffer is None or len(buffer) != size:
+        buffer = bytearray(size)
+        _buffers.buffer = buffer
+    return buffer
+
+
+def hash_file(path: Path, algorithms: Iterable[HashAlgorithm],
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[HashAlgorithm, str]:
+    """
+    Computes the hex digests of a file for all given algorithms in a single read pass.
+
+    The file is read into a buffer that is reused by all calls on the same thread, and every chunk is passed to
+    every hash object. Unsupported algorithms raise a ``ValueError``.
+    """
+    unsupported = [str(alg.value) for alg in algorithms if alg not in _HASH_FACTORIES]
+    if unsupported:
+        raise ValueError(f"Unsupported hash algorithms: {', '.join(unsupported)}")
+
+    hashers = {alg: _HASH_FACTORIES[alg]() for alg in algorithms}
+    buffer = _read_buffer(chunk_size)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as file:
+        while read := file.readinto(buffer):
+            chunk = view[:read]
+            for hasher in hashers.values():
+                hasher.update(chunk)
+    return {alg: hasher.hexdigest() for alg, hasher in hashers.items()}
+
+
+def hash_files(jobs: Mapping[Path, Iterable[HashAlgorithm]], workers: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[Path, HashResult]:
+    """
+    Hashes several files on a thread pool, each file once for all of its algorithms.
+
+    ``hashlib`` releases the GIL while digesting large buffers, so threads hash in parallel. Files that cannot
+    be read are reported with their ``OSError`` instead of failing the whole batch. ``workers=1`` hashes
+    sequentially on the calling thread.
+    """
+    def run(job: Tuple[Path, Iterable[HashAlgorithm]]) -> Tuple[Path, HashResult]:
+        path, algorithms = job
+        try:
+            return path, hash_file(path, algorithms, chunk_size)
+        except OSError as e:
+            return path, e
+
+    if workers == 1 or len(jobs) <= 1:
+        return dict(map(run, jobs.items()))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(run, jobs.items()))
+
+
+class HashCache:
+    """
+    Digests of files keyed by path, persisted as JSON.
+
+    An entry is only used while the size and the modification time of the file are unchanged.
+    """
+
+    filename: Optional[Path]
+
+    def __init__(self, filename: Optional[str | Path] = None) -> None:
+        self.filename = Path(filename) if filename is not None else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.filename is not None and self.filename.is_file():
+            try:
+                self._entries = json.loads(self.filename.read_text(encoding='utf-8'))
+            except ValueError:
+                # a corrupt cache only costs a rehash
+                self._entries = {}
+
+    def lookup(self, path: Path, algorithms: Iterable[HashAlgorithm]) -> Optional[Dict[HashAlgorithm, str]]:
+        entry = self._entries.get(str(path))
+        if entry is None:
+            return None
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+            return None
+        digests: Dict[str, str] = entry['hashes']
+        if not all(alg.value in digests for alg in algorithms):
+            return None
+        return {alg: digests[alg.value] for alg in algorithms}
+
+    def store(self, path: Path, digests: Dict[HashAlgorithm, str]) -> None:
+        stat = path.stat()
+        entry = self._entries.get(str(path))
+        if entry is None or entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hashes': {}}
+            self._entries[str(path)] = entry
+        entry['hashes'].update({alg.value: value for alg, value in digests.items()})
+
+    def save(self) -> None:
+        if self.filename is not None:
+            self.filename.parent.mkdir(exist_ok=True, parents=True)
+            self.filename.write_text(json.dumps(self._entries, sort_keys=True), encoding='utf-8')
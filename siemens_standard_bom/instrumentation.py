@@ -0,0 +1,113 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+
+class StageEvent(NamedTuple):
+    """
+    Timing of one stage of a parser operation, e.g. the ``decode`` stage of ``parse``.
+
+    ``bytes`` is the size of the data a stage read or produced; for text this is the number of characters.
+    """
+
+    operation: str
+    stage: str
+    seconds: float
+    bytes: Optional[int] = None
+    components: Optional[int] = None
+    filename: Optional[str] = None
+
+
+StageObserver = Callable[[StageEvent], None]
+
+
+class StageMetrics:
+    """
+    Observer that keeps the reported events, e.g. to inspect them in tests or to export them to a metrics system.
+    """
+
+    events: List[StageEvent]
+
+    def __init__(self) -> None:
+        self.events = []
+
+    def __call__(self, event: StageEvent) -> None:
+        self.events.append(event)
+
+    def seconds_by_stage(self) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for event in self.events:
+            key = f'{event.operation}.{event.stage}'
+            totals[key] = totals.get(key, 0.0) + event.seconds
+        return totals
+
+
+class LoggingObserver:
+    """
+    Observer that writes every event to a stdlib logger.
+    """
+
+    logger: logging.Logger
+    level: int
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger if logger is not None else logging.getLogger('siemens_standard_bom.parser')
+        self.level = level
+
+    def __call__(self, event: StageEvent) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, '%s.%s took %.6f s (bytes=%s, components=%s, file=%s)',
+                            event.operation, event.stage, event.seconds, event.bytes, event.components,
+                            event.filename)
+
+
+class StageRecorder:
+    """
+    Measures the stages of one parser operation and reports them to the given observers.
+    """
+
+    def __init__(self, operation: str, observers: Sequence[StageObserver], filename: Optional[str] = None) -> None:
+        self.operation = operation
+        self.observers = observers
+        self.filename = filename
+        self.bytes: Optional[int] = None
+        self.components: Optional[int] = None
+
+    @contextmanager
+    def _measure(self, stage: str) -> Iterator['StageRecorder']:
+        self.bytes = None
+        self.components = None
+        start = time.perf_counter()
+        yield self
+        event = StageEvent(self.operation, stage, time.perf_counter() - start, self.bytes, self.components,
+                           self.filename)
+        for observer in self.observers:
+            observer(event)
+
+    def stage(self, stage: str) -> ContextManager['StageRecorder']:
+        """
+        Context manager timing one stage. Byte and component counts can be set on the recorder inside the block.
+        """
+        return self._measure(stage)
+
+
+class _DisabledRecorder(StageRecorder):
+    # without observers there is nothing to measure, so every stage is a shared no-op context
+    def __init__(self) -> None:
+        super().__init__('', ())
+        self._context = nullcontext(self)
+
+    def stage(self, stage: str) -> ContextManager[StageRecorder]:
+        return self._context
+
+
+_DISABLED = _DisabledRecorder()
+
+
+def recorder(operation: str, observers: Sequence[StageObserver], filename: Optional[str] = None) -> StageRecorder:
+    return StageRecorder(operation, observers, filename) if observers else _DISABLED
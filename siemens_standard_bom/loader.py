@@ -0,0 +1,188 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Specialized deserializer for CycloneDX JSON with the structures used by Standard BOMs.
+
+``Bom.from_json`` looks up the metadata of every property of every object, decodes the key names and copies the
+data before it calls the constructor. ``from_json`` calls the constructors of ``Bom``, ``Component``,
+``ExternalReference``, ``Property``, ``HashType`` and the license classes directly for the keys that Standard BOMs
+use. Every object with another key or a value of an unexpected type is given to the ``from_json`` of its class
+instead, so that the result is the same as with ``Bom.from_json``.
+
+The garbage collector is paused while the objects are built, see ``siemens_standard_bom.memory.paused_gc``. The
+components of the document are sorted by a key computed once per component and filled into the component set in
+that order, instead of being compared again and again by the ``SortedSet`` constructor.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, Property, XsUri
+from cyclonedx.model.bom import Bom, BomMetaData
+from cyclonedx.model.bom_ref import BomRef
+from cyclonedx.model.component import Component, ComponentScope, ComponentType
+from cyclonedx.model.contact import OrganizationalContact, OrganizationalEntity
+from cyclonedx.model.definition import Definitions
+from cyclonedx.model.dependency import Dependency, _DependencyRepositorySerializationHelper
+from cyclonedx.model.license import DisjunctiveLicense, License, LicenseExpression, \
+    _LicenseRepositorySerializationHelper
+from cyclonedx.model.service import Service
+from cyclonedx.model.vulnerability import Vulnerability
+from cyclonedx.serialization import UrnUuidHelper
+
+from siemens_standard_bom.memory import paused_gc
+from siemens_standard_bom.model import _fill_components
+from siemens_standard_bom.purl import PURLS
+
+# JSON key: the constructor argument and the conversion of the value, or None for keys that are ignored
+Keys = Dict[str, Optional[Tuple[str, Callable[[Any], Any]]]]
+
+# the errors of a value of an unexpected type, which the generic deserializer then handles or reports
+_FALLBACK_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+
+def _raw(value: Any) -> Any:
+    return value
+
+
+def _each(convert: Callable[[Any], Any]) -> Callable[[Any], List[Any]]:
+    return lambda items: [convert(item) for item in items]
+
+
+def _generic(klass: Any) -> Callable[[Any], Any]:
+    return lambda data: klass.from_json(data=data)
+
+
+def _load(klass: Any, keys: Keys, data: Any) -> Any:
+    if not isinstance(data, dict) or not data.keys() <= keys.keys():
+        return klass.from_json(data=data)
+    try:
+        arguments = {}
+        for key, value in data.items():
+            argument = keys[key]
+            if argument is not None:
+                arguments[argument[0]] = argument[1](value)
+        return klass(**arguments)
+    except _FALLBACK_ERRORS:
+        return klass.from_json(data=data)
+
+
+def _loader(klass: Any, keys: Keys) -> Callable[[Any], Any]:
+    return lambda data: _load(klass, keys, data)
+
+
+_hash = _loader(HashType, {
+    'alg': ('alg', HashAlgorithm),
+    'content': ('content', _raw),
+})
+
+_property = _loader(Property, {
+    'name': ('name', _raw),
+    'value': ('value', _raw),
+})
+
+_contact = _loader(OrganizationalContact, {
+    'name': ('name', _raw),
+    'email': ('email', _raw),
+    'phone': ('phone', _raw),
+})
+
+_external_reference = _loader(ExternalReference, {
+    'type': ('type', ExternalReferenceType),
+    'url': ('url', lambda url: XsUri(uri=url)),
+    'comment': ('comment', _raw),
+    'hashes': ('hashes', _each(_hash)),
+})
+
+_LICENSE_KEYS: Keys = {
+    'id': ('id', _raw),
+    'name': ('name', _raw),
+    'url': ('url', lambda url: XsUri(uri=url)),
+}
+
+
+def _license(data: Dict[str, Any]) -> License:
+    if data.keys() == {'expression'}:
+        return LicenseExpression(value=data['expression'])
+    if data.keys() == {'license'} and isinstance(data['license'], dict) and data['license'].keys() <= _LICENSE_KEYS.keys():
+        disjunctive: DisjunctiveLicense = _load(DisjunctiveLicense, _LICENSE_KEYS, data['license'])
+        return disjunctive
+    raise ValueError('Not a Standard BOM license')
+
+
+def _licenses(data: Any) -> Any:
+    try:
+        return [_license(item) for item in data]
+    except _FALLBACK_ERRORS:
+        return _LicenseRepositorySerializationHelper.json_denormalize(data)
+
+
+def _component(data: Any) -> Any:
+    return _load(Component, _COMPONENT_KEYS, data)
+
+
+_COMPONENT_KEYS: Keys = {
+    'type': ('type', ComponentType),
+    'bom-ref': ('bom_ref', BomRef.deserialize),
+    'supplier': ('supplier', _generic(OrganizationalEntity)),
+    'author': ('author', _raw),
+    'authors': ('authors', _each(_contact)),
+    'publisher': ('publisher', _raw),
+    'group': ('group', _raw),
+    'name': ('name', _raw),
+    'version': ('version', _raw),
+    'description': ('description', _raw),
+    'scope': ('scope', ComponentScope),
+    'hashes': ('hashes', _each(_hash)),
+    'licenses': ('licenses', _licenses),
+    'copyright': ('copyright', _raw),
+    'cpe': ('cpe', _raw),
+    # equal purls share one object, see siemens_standard_bom.purl
+    'purl': ('purl', PURLS.intern),
+    'externalReferences': ('external_references', _each(_external_reference)),
+    'properties': ('properties', _each(_property)),
+    'components': ('components', _each(_component)),
+}
+
+_dependency = _loader(Dependency, {
+    'ref': ('ref', BomRef.deserialize),
+    'dependsOn': ('dependencies', _DependencyRepositorySerializationHelper.deserialize),
+})
+
+_BOM_KEYS: Keys = {
+    '$schema': None,
+    'bomFormat': None,
+    'specVersion': None,
+    'serialNumber': ('serial_number', UrnUuidHelper.deserialize),
+    'version': ('version', _raw),
+    'metadata': ('metadata', _generic(BomMetaData)),
+    'components': ('components', _each(_component)),
+    'services': ('services', _each(_generic(Service))),
+    'externalReferences': ('external_references', _each(_external_reference)),
+    'dependencies': ('dependencies', _each(_dependency)),
+    'properties': ('properties', _each(_property)),
+    'vulnerabilities': ('vulnerabilities', _each(_generic(Vulnerability))),
+    'definitions': ('definitions', _generic(Definitions)),
+}
+
+
+def _bom(data: Any) -> Bom:
+    components = data.get('components') if isinstance(data, dict) else None
+    bom: Bom
+    if not isinstance(components, list) or not data.keys() <= _BOM_KEYS.keys():
+        bom = _load(Bom, _BOM_KEYS, data)
+        return bom
+    try:
+        loaded = [_component(component) for component in components]
+    except _FALLBACK_ERRORS:
+        bom = _generic(Bom)(data)
+        return bom
+    bom = _load(Bom, _BOM_KEYS, {key: value for key, value in data.items() if key != 'components'})
+    _fill_components(bom.components, loaded)
+    return bom
+
+
+def from_json(data: Dict[str, Any]) -> Bom:
+    """Builds the ``Bom`` of a decoded CycloneDX JSON document, equal to ``Bom.from_json(data=data)``."""
+    with paused_gc():
+        return _bom(data)
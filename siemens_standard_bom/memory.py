@@ -0,0 +1,135 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+import gc
+import sys
+from contextlib import contextmanager
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple
+
+from cyclonedx.model import HashType, Property, XsUri
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.license import DisjunctiveLicense, LicenseExpression
+
+SECTIONS = ('components', 'licenses', 'external_references', 'properties', 'hashes', 'dependencies', 'metadata')
+
+# value objects that are worth sharing between components when they are equal
+_VALUE_TYPES = (str, XsUri, Property, HashType, DisjunctiveLicense, LicenseExpression)
+_SHARED_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, Enum, type(None), bool)
+_COMPONENT_SECTIONS = (('licenses', '_licenses'), ('external_references', '_external_references'),
+                       ('properties', '_properties'), ('hashes', '_hashes'))
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Disables the cyclic garbage collector while many long-lived objects are created, e.g. the model of a document.
+
+    None of them is garbage, but the many allocations make the collector scan all of them again and again.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+class DuplicateStats(NamedTuple):
+    objects: int
+    bytes: int
+
+
+class MemoryReport(NamedTuple):
+    """
+    Approximate memory retained by the sections of an SBOM.
+
+    Objects shared between sections are counted once, for the section that is measured first. ``duplicates``
+    counts, per type, the objects that are equal to another object of the report but not the same object, and
+    the bytes they occupy; interning or sharing them would save that memory.
+    """
+
+    sections: Dict[str, int]
+    duplicates: Dict[str, DuplicateStats]
+
+    @property
+    def total(self) -> int:
+        return sum(self.sections.values())
+
+
+class _Walker:
+    def __init__(self) -> None:
+        self.seen: Set[int] = set()
+        self.values: Dict[Tuple[type, Any], int] = {}
+        self.duplicates: Dict[str, DuplicateStats] = {}
+
+    def _track_value(self, obj: Any, size: int) -> None:
+        try:
+            key = (type(obj), obj)
+            first = self.values.setdefault(key, id(obj))
+        except TypeError:
+            return
+        if first != id(obj):
+            name = type(obj).__name__
+            objects, total = self.duplicates.get(name, DuplicateStats(0, 0))
+            self.duplicates[name] = DuplicateStats(objects + 1, total + size)
+
+    def size(self, roots: Iterable[Any]) -> int:
+        total = 0
+        stack: List[Any] = list(roots)
+        while stack:
+            obj = stack.pop()
+            if id(obj) in self.seen or isinstance(obj, _SHARED_TYPES):
+                continue
+            self.seen.add(id(obj))
+            size = sys.getsizeof(obj)
+            total += size
+            if isinstance(obj, _VALUE_TYPES):
+                self._track_value(obj, size)
+            stack.extend(_referents(obj))
+        return total
+
+
+def _referents(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, (str, bytes, int, float, complex)):
+        return ()
+    if isinstance(obj, dict):
+        return [*obj.keys(), *obj.values()]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return obj
+    referents: List[Any] = []
+    if hasattr(obj, '__dict__'):
+        referents.append(obj.__dict__)
+    for slot in getattr(type(obj), '__slots__', ()):
+        if hasattr(obj, slot):
+            referents.append(getattr(obj, slot))
+    return referents
+
+
+def _all_components(components: Iterable[Component]) -> Iterable[Component]:
+    stack = list(components)
+    while stack:
+        component = stack.pop()
+        yield component
+        stack.extend(component.components)
+
+
+def memory_report(bom: Bom) -> MemoryReport:
+    walker = _Walker()
+    sections = dict.fromkeys(SECTIONS, 0)
+
+    components = list(_all_components(bom.components))
+    for section, attribute in _COMPONENT_SECTIONS:
+        sections[section] += walker.size(getattr(c, attribute) for c in components)
+    sections['components'] += walker.size([bom.components])
+    sections['dependencies'] += walker.size([bom.dependencies])
+    sections['external_references'] += walker.size([bom.external_references])
+    sections['properties'] += walker.size([bom.properties])
+    sections['metadata'] += walker.size([bom])
+
+    return MemoryReport(sections, dict(sorted(walker.duplicates.items())))
@@ -2,10 +2,19 @@
 # Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
 # SPDX-License-Identifier: MIT
 #
+import copy
+import hashlib
+import json
+import weakref
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from importlib import import_module
 from importlib.metadata import version as library_version
-from typing import Iterable, List, Optional, Any
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Any, Set, Tuple
 from uuid import UUID
 
 from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, Property, XsUri
@@ -14,14 +23,29 @@ from cyclonedx.model.bom_ref import BomRef
 from cyclonedx.model.component import Component, ComponentType, ComponentScope
 from cyclonedx.model.contact import OrganizationalEntity, OrganizationalContact
 from cyclonedx.model.definition import Definitions, Standard
-from cyclonedx.model.license import License, LicenseRepository
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.model.license import DisjunctiveLicense, License, LicenseExpression, LicenseRepository
 from cyclonedx.model.tool import Tool
+from cyclonedx.model.vulnerability import Vulnerability
+from cyclonedx.schema.schema import SchemaVersion1Dot6
 from packageurl import PackageURL
 from sortedcontainers import SortedSet
 
+from siemens_standard_bom.cache import IdentityCache
+from siemens_standard_bom.cpe import Cpe, parse_cpe
+from siemens_standard_bom.hashing import SUPPORTED_ALGORITHMS, HashCache, HashResult, hash_files
 from siemens_standard_bom.immutable import ImmutableList
+from siemens_standard_bom.memory import MemoryReport, memory_report, paused_gc
+from siemens_standard_bom.purl import PURLS, purl_key
+
+if TYPE_CHECKING:  # pragma: no cover
+    import sqlite3
+
+    from siemens_standard_bom.frozen import FrozenStandardBom
+    from siemens_standard_bom.query import ComponentIndex, ComponentQuery
 
 STANDARD_BOM_MODULE: str = 'siemens-standard-bom'
+UNKNOWN_TOOL_NAME: str = '(unknown tool)'
 
 PROPERTY_DIRECT_DEPENDENCY = "siemens:direct"
 PROPERTY_FILENAME = "siemens:filename"
@@ -66,13 +90,44 @@ def _set_hash_value(hashes: SortedSet[HashType], algorithm: HashAlgorithm, value
         hashes.add(HashType(alg=algorithm, content=value))
 
 
+def _strip_file_scheme(url: str) -> str:
+    if url.startswith("file:///"):
+        return url[len("file:///"):]
+    if url.startswith("file:"):
+        return url[len("file:"):]
+    return url
+
+
 def _is_true_value(value: Optional[str]) -> bool:
     return value in ("True", "true")
 
 
+_component_fingerprints: IdentityCache[bytes] = IdentityCache()
+
+
+def _digest(obj: Any) -> bytes:
+    """
+    Digest over the CycloneDX 1.6 JSON form of a model object. Collections of the model are sorted sets, so the
+    result does not depend on the order in which their entries were added.
+    """
+    return hashlib.sha256(obj.as_json(view_=SchemaVersion1Dot6).encode('utf-8')).digest()
+
+
+def _merkle_root(leaves: List[bytes]) -> bytes:
+    if not leaves:
+        return hashlib.sha256(b'').digest()
+    level = sorted(leaves)
+    while len(level) > 1:
+        level = [hashlib.sha256(b''.join(level[i:i + 2])).digest() for i in range(0, len(level), 2)]
+    return level[0]
+
+
 class ExternalComponent:
     reference: ExternalReference
 
+    # the component wrapper that handed out this object, which prepares the component for changes
+    _owner: Optional['SbomComponent'] = None
+
     def __init__(self, external_ref: Optional[ExternalReference] = None) -> None:
         if external_ref is None:
             self.reference = ExternalReference(
@@ -87,7 +142,8 @@ class ExternalComponent:
 
     @url.setter
     def url(self, value: str) -> None:
-        self.reference.url = XsUri(value)
+        with self._change():
+            self.reference.url = XsUri(value)
 
     @property
     def type(self) -> ExternalReferenceType:
@@ -95,7 +151,17 @@ class ExternalComponent:
 
     @type.setter
     def type(self, value: ExternalReferenceType) -> None:
-        self.reference.type = value
+        with self._change():
+            self.reference.type = value
+
+    @contextmanager
+    def _change(self) -> Iterator[None]:
+        if self._owner is None:
+            yield
+            return
+        with self._owner._change_reference(self.reference) as reference:
+            self.reference = reference
+            yield
 
 
 class SbomComponent:
@@ -105,11 +171,64 @@ class SbomComponent:
 
     component: Component
 
+    # a weak reference to the document that handed out this wrapper, which prepares its components for changes
+    _owner: Optional['weakref.ref[StandardBom]'] = None
+
     def __init__(self, component: Component) -> None:
         self.component = component
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # a copy or an unpickled wrapper belongs to no document
+        state = self.__dict__.copy()
+        state.pop('_owner', None)
+        return state
+
     def __lt__(self, other: Any) -> bool:
-        return self.component < other.component if isinstance(other, SbomComponent) else False
+        if not isinstance(other, SbomComponent):
+            return False
+        return _ComponentSortKey(self.component) < _ComponentSortKey(other.component)
+
+    @contextmanager
+    def _change(self) -> Iterator[None]:
+        """
+        Prepares the wrapped component for a change by a setter or ``add_*`` method.
+        """
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner._before_change(self)
+        _component_fingerprints.discard(self.component)
+        yield
+
+    @contextmanager
+    def _change_reference(self, reference: ExternalReference) -> Iterator[ExternalReference]:
+        """
+        Prepares the wrapped component for a change of one of its external references by a ``SourceArtifact`` or
+        ``ExternalComponent``. Yields the reference to change, which is the equal one of the copy if the component
+        was copied on write.
+        """
+        with self._change():
+            references = self.component.external_references
+            if not any(r is reference for r in references):
+                reference = next((r for r in references if r == reference), reference)
+            yield reference
+
+    def _fingerprint_digest(self) -> bytes:
+        digest = _component_fingerprints.get(self.component)
+        if digest is None:
+            digest = _digest(self.component)
+            _component_fingerprints.set(self.component, digest)
+        return digest
+
+    def fingerprint(self) -> str:
+        """
+        Stable SHA-256 digest over the content of this component.
+
+        The digest is memoized per wrapped ``Component``. It is reset by the setters and ``add_*`` methods of this
+        class, by the setters of the ``SourceArtifact`` and ``ExternalComponent`` objects handed out by it, and
+        whenever ``licenses`` is read, as the returned repository can be changed. Changes made on the ``Component``
+        object or its other nested objects directly are not tracked.
+        """
+        return self._fingerprint_digest().hex()
 
     @property
     def name(self) -> str:
@@ -117,7 +236,8 @@ class SbomComponent:
 
     @name.setter
     def name(self, value: str) -> None:
-        self.component.name = value
+        with self._change():
+            self.component.name = value
 
     @property
     def type(self) -> ComponentType:
@@ -125,7 +245,8 @@ class SbomComponent:
 
     @type.setter
     def type(self, value: ComponentType) -> None:
-        self.component.type = value
+        with self._change():
+            self.component.type = value
 
     @property
     def bom_ref(self) -> BomRef:
@@ -133,7 +254,8 @@ class SbomComponent:
 
     @bom_ref.setter
     def bom_ref(self, value: BomRef) -> None:
-        self.component._bom_ref = value
+        with self._change():
+            self.component._bom_ref = value
 
     @property
     def group(self) -> Optional[str]:
@@ -141,7 +263,8 @@ class SbomComponent:
 
     @group.setter
     def group(self, value: str) -> None:
-        self.component.group = value
+        with self._change():
+            self.component.group = value
 
     @property
     def version(self) -> Optional[str]:
@@ -149,7 +272,8 @@ class SbomComponent:
 
     @version.setter
     def version(self, value: str) -> None:
-        self.component.version = value
+        with self._change():
+            self.component.version = value
 
     @property
     def purl(self) -> Optional[PackageURL]:
@@ -157,7 +281,8 @@ class SbomComponent:
 
     @purl.setter
     def purl(self, value: PackageURL) -> None:
-        self.component.purl = value
+        with self._change():
+            self.component.purl = PURLS.intern(value) if value is not None else value
 
     @property
     def scope(self) -> Optional[ComponentScope]:
@@ -165,7 +290,8 @@ class SbomComponent:
 
     @scope.setter
     def scope(self, value: ComponentScope) -> None:
-        self.component.scope = value
+        with self._change():
+            self.component.scope = value
 
     @property
     def authors(self) -> ImmutableList[OrganizationalContact]:
@@ -181,12 +307,25 @@ class SbomComponent:
 
     @authors.setter
     def authors(self, authors: Iterable[OrganizationalContact]) -> None:
-        self.component.authors = SortedSet(authors)
+        with self._change():
+            self.component.authors = SortedSet(authors)
 
     def add_author(self, author: OrganizationalContact) -> None:
-        if self.component.authors is None:
-            self.component.authors = SortedSet()
-        self.component.authors.add(author)
+        with self._change():
+            if self.component.authors is None:
+                self.component.authors = SortedSet()
+            self.component.authors.add(author)
+
+    def _normalize_author(self) -> bool:
+        # moves the legacy v2 author into the authors; False if it was listed there already
+        with self._change():
+            contact = OrganizationalContact(name=self.component.author)
+            self.component.author = None
+            if self.component.authors is None:
+                self.component.authors = SortedSet()
+            known = contact in self.component.authors
+            self.component.authors.add(contact)
+        return not known
 
     @property
     def supplier(self) -> Optional[OrganizationalEntity]:
@@ -194,7 +333,8 @@ class SbomComponent:
 
     @supplier.setter
     def supplier(self, value: OrganizationalEntity) -> None:
-        self.component.supplier = value
+        with self._change():
+            self.component.supplier = value
 
     @property
     def description(self) -> Optional[str]:
@@ -202,7 +342,8 @@ class SbomComponent:
 
     @description.setter
     def description(self, value: str) -> None:
-        self.component.description = value
+        with self._change():
+            self.component.description = value
 
     @property
     def copyright(self) -> Optional[str]:
@@ -210,7 +351,8 @@ class SbomComponent:
 
     @copyright.setter
     def copyright(self, value: str) -> None:
-        self.component.copyright = value
+        with self._change():
+            self.component.copyright = value
 
     @property
     def cpe(self) -> Optional[str]:
@@ -218,20 +360,32 @@ class SbomComponent:
 
     @cpe.setter
     def cpe(self, value: str) -> None:
-        self.component.cpe = value
+        with self._change():
+            self.component.cpe = value
+
+    @property
+    def parsed_cpe(self) -> Optional[Cpe]:
+        """
+        The CPE split into its attributes, parsed once per distinct CPE string. Raises ``ValueError`` if malformed.
+        """
+        return parse_cpe(self.component.cpe) if self.component.cpe else None
 
     @property
     def licenses(self) -> LicenseRepository:
+        # the live repository, which the caller may change
+        _component_fingerprints.discard(self.component)
         return self.component.licenses
 
     @licenses.setter
     def licenses(self, licenses: Iterable[License]) -> None:
-        self.component.licenses = LicenseRepository(licenses)
+        with self._change():
+            self.component.licenses = LicenseRepository(licenses)
 
     def add_license(self, lic: License) -> None:
-        if self.licenses is None:
-            self.licenses = []
-        self.licenses.add(lic)
+        with self._change():
+            if self.licenses is None:
+                self.licenses = []
+            self.licenses.add(lic)
 
     @property
     def third_party_notices(self) -> Optional[str]:
@@ -239,7 +393,8 @@ class SbomComponent:
 
     @third_party_notices.setter
     def third_party_notices(self, value: str) -> None:
-        self.set_custom_property(self.component, PROPERTY_THIRD_PARTY_NOTICES, value)
+        with self._change():
+            self.set_custom_property(self.component, PROPERTY_THIRD_PARTY_NOTICES, value)
 
     @property
     def direct_dependency(self) -> bool:
@@ -247,7 +402,8 @@ class SbomComponent:
 
     @direct_dependency.setter
     def direct_dependency(self, value: str) -> None:
-        self.set_custom_property(self.component, PROPERTY_DIRECT_DEPENDENCY, value)
+        with self._change():
+            self.set_custom_property(self.component, PROPERTY_DIRECT_DEPENDENCY, value)
 
     @property
     def internal(self) -> bool:
@@ -255,7 +411,8 @@ class SbomComponent:
 
     @internal.setter
     def internal(self, value: bool) -> None:
-        self.set_custom_property(self.component, PROPERTY_INTERNAL, f"{value}")
+        with self._change():
+            self.set_custom_property(self.component, PROPERTY_INTERNAL, f"{value}")
 
     @property
     def primary_language(self) -> Optional[str]:
@@ -263,7 +420,8 @@ class SbomComponent:
 
     @primary_language.setter
     def primary_language(self, value: str) -> None:
-        self.set_custom_property(self.component, PROPERTY_PRIMARY_LANGUAGE, value)
+        with self._change():
+            self.set_custom_property(self.component, PROPERTY_PRIMARY_LANGUAGE, value)
 
     @property
     def legal_remark(self) -> Optional[str]:
@@ -271,7 +429,8 @@ class SbomComponent:
 
     @legal_remark.setter
     def legal_remark(self, value: str) -> None:
-        self.set_custom_property(self.component, PROPERTY_LEGAL_REMARK, value)
+        with self._change():
+            self.set_custom_property(self.component, PROPERTY_LEGAL_REMARK, value)
 
     @property
     def filename(self) -> Optional[str]:
@@ -279,7 +438,8 @@ class SbomComponent:
 
     @filename.setter
     def filename(self, value: str) -> None:
-        self.set_custom_property(self.component, PROPERTY_FILENAME, value)
+        with self._change():
+            self.set_custom_property(self.component, PROPERTY_FILENAME, value)
 
     @staticmethod
     def get_custom_property(component: Optional[Component], custom_property_key: str) -> Optional[str]:
@@ -305,7 +465,8 @@ class SbomComponent:
 
     @website.setter
     def website(self, value: str) -> None:
-        self._set_external_reference(ExternalReferenceType.WEBSITE, value)
+        with self._change():
+            self._set_external_reference(ExternalReferenceType.WEBSITE, value)
 
     @property
     def repo_url(self) -> Optional[str]:
@@ -314,60 +475,62 @@ class SbomComponent:
 
     @repo_url.setter
     def repo_url(self, value: str) -> None:
-        self._set_external_reference(ExternalReferenceType.VCS, value)
+        with self._change():
+            self._set_external_reference(ExternalReferenceType.VCS, value)
 
     @property
     def relative_path(self) -> Optional[str]:
         ref = next(filter(lambda er: er.type == ExternalReferenceType.DISTRIBUTION and er.comment == RELATIVE_PATH,
                           self.component.external_references), None)
-        if ref:
-            ref_str = str(ref.url)
-            if ref_str.startswith("file:///"):
-                return ref_str[len("file:///"):]
-            if ref_str.startswith("file:"):
-                return ref_str[len("file:"):]
-            return ref_str
-        return None
+        return _strip_file_scheme(str(ref.url)) if ref else None
 
     @relative_path.setter
     def relative_path(self, value: str) -> None:
-        reference = next(
-            filter(lambda ex_ref: ex_ref.type == ExternalReferenceType.DISTRIBUTION and ex_ref.comment == RELATIVE_PATH,
-                   self.component.external_references), None)
-        if not reference:
-            reference = ExternalReference(type=ExternalReferenceType.DISTRIBUTION,
-                                          url=XsUri(value),
-                                          comment=RELATIVE_PATH)
-            self.component.external_references.add(reference)
-        else:
-            reference.url = XsUri(value)
+        with self._change():
+            reference = next(
+                filter(lambda ex_ref: ex_ref.type == ExternalReferenceType.DISTRIBUTION and ex_ref.comment == RELATIVE_PATH,
+                       self.component.external_references), None)
+            if not reference:
+                reference = ExternalReference(type=ExternalReferenceType.DISTRIBUTION,
+                                              url=XsUri(value),
+                                              comment=RELATIVE_PATH)
+                self.component.external_references.add(reference)
+            else:
+                reference.url = XsUri(value)
+
+    def _source(self, external_ref: ExternalReference) -> 'SourceArtifact':
+        source = SourceArtifact(external_ref)
+        source._owner = self
+        return source
 
     @property
     def sources(self) -> List['SourceArtifact']:
-        return list(map(lambda er: SourceArtifact(er),
+        return list(map(self._source,
                         filter(is_source_artifact,
                                self.component.external_references)))
 
     @property
     def local_sources(self) -> List['SourceArtifact']:
-        return list(map(lambda er: SourceArtifact(er),
+        return list(map(self._source,
                         filter(is_local_source_archive,
                                self.component.external_references)))
 
     def add_local_source(self, url: str, hashes: Optional[Iterable[HashType]] = None) -> None:
-        ex_ref = ExternalReference(type=ExternalReferenceType.DISTRIBUTION, comment=SOURCE_ARCHIVE_LOCAL,
-                                   url=XsUri(url), hashes=hashes)
-        self.component.external_references.add(ex_ref)
+        with self._change():
+            ex_ref = ExternalReference(type=ExternalReferenceType.DISTRIBUTION, comment=SOURCE_ARCHIVE_LOCAL,
+                                       url=XsUri(url), hashes=hashes)
+            self.component.external_references.add(ex_ref)
 
     @property
     def remote_sources(self) -> List['SourceArtifact']:
-        return list(map(lambda er: SourceArtifact(er),
+        return list(map(self._source,
                         filter(is_remote_source_archive,
                                self.component.external_references)))
 
     def add_remote_source(self, url: str, hashes: Optional[Iterable[HashType]] = None) -> None:
-        ex_ref = ExternalReference(type=ExternalReferenceType.SOURCE_DISTRIBUTION, url=XsUri(url), hashes=hashes)
-        self.component.external_references.add(ex_ref)
+        with self._change():
+            ex_ref = ExternalReference(type=ExternalReferenceType.SOURCE_DISTRIBUTION, url=XsUri(url), hashes=hashes)
+            self.component.external_references.add(ex_ref)
 
     def _get_external_reference(self, ex_ref_type: ExternalReferenceType) -> Optional[ExternalReference]:
         external_reference = next(filter(lambda ex_ref: ex_ref is not None and ex_ref.type == ex_ref_type,
@@ -381,15 +544,21 @@ class SbomComponent:
             self.component.external_references.add(reference)
         return reference
 
+    def _external_component(self, external_ref: ExternalReference) -> ExternalComponent:
+        external = ExternalComponent(external_ref)
+        external._owner = self
+        return external
+
     @property
     def external_components(self) -> ImmutableList[ExternalComponent]:
         references = self.component.external_references
-        return ImmutableList(*map(lambda er: ExternalComponent(er), references))
+        return ImmutableList(*map(self._external_component, references))
 
     def add_external_component(self, external: ExternalComponent | ExternalReference) -> None:
-        self.component.external_references.add(external
-                                               if isinstance(external, ExternalReference)
-                                               else external.reference)
+        with self._change():
+            self.component.external_references.add(external
+                                                   if isinstance(external, ExternalReference)
+                                                   else external.reference)
 
     @property
     def md5(self) -> Optional[str]:
@@ -397,7 +566,8 @@ class SbomComponent:
 
     @md5.setter
     def md5(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.MD5, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.MD5, value)
 
     @property
     def sha1(self) -> Optional[str]:
@@ -405,7 +575,8 @@ class SbomComponent:
 
     @sha1.setter
     def sha1(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.SHA_1, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.SHA_1, value)
 
     @property
     def sha256(self) -> Optional[str]:
@@ -413,7 +584,8 @@ class SbomComponent:
 
     @sha256.setter
     def sha256(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.SHA_256, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.SHA_256, value)
 
     @property
     def sha512(self) -> Optional[str]:
@@ -421,7 +593,8 @@ class SbomComponent:
 
     @sha512.setter
     def sha512(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.SHA_512, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.SHA_512, value)
 
     def _get_hash(self, algorithm: HashAlgorithm) -> Optional[str]:
         return _get_hash_value(self.component.hashes, algorithm)
@@ -433,6 +606,9 @@ class SbomComponent:
 class SourceArtifact:
     external_ref: ExternalReference
 
+    # the component wrapper that handed out this object, which prepares the component for changes
+    _owner: Optional[SbomComponent] = None
+
     def __init__(self, external_ref: Optional[ExternalReference] = None,
                  download_url: Optional[str] = None, local_file: Optional[str] = None,
                  hashes: Optional[Iterable[HashType]] = None) -> None:
@@ -465,7 +641,8 @@ class SourceArtifact:
 
     @type.setter
     def type(self, value: ExternalReferenceType) -> None:
-        self.external_ref.type = value
+        with self._change():
+            self.external_ref.type = value
 
     @property
     def url(self) -> Optional[str]:
@@ -473,7 +650,8 @@ class SourceArtifact:
 
     @url.setter
     def url(self, value: str) -> None:
-        self.external_ref.url = XsUri(value)
+        with self._change():
+            self.external_ref.url = XsUri(value)
 
     @property
     def md5(self) -> Optional[str]:
@@ -481,7 +659,8 @@ class SourceArtifact:
 
     @md5.setter
     def md5(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.MD5, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.MD5, value)
 
     @property
     def sha1(self) -> Optional[str]:
@@ -489,7 +668,8 @@ class SourceArtifact:
 
     @sha1.setter
     def sha1(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.SHA_1, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.SHA_1, value)
 
     @property
     def sha256(self) -> Optional[str]:
@@ -497,7 +677,8 @@ class SourceArtifact:
 
     @sha256.setter
     def sha256(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.SHA_256, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.SHA_256, value)
 
     @property
     def sha512(self) -> Optional[str]:
@@ -505,15 +686,60 @@ class SourceArtifact:
 
     @sha512.setter
     def sha512(self, value: str) -> None:
-        self._set_hash(HashAlgorithm.SHA_512, value)
+        with self._change():
+            self._set_hash(HashAlgorithm.SHA_512, value)
 
     def _get_hash(self, algorithm: HashAlgorithm) -> Optional[str]:
         return _get_hash_value(self.external_ref.hashes, algorithm)
 
+    @contextmanager
+    def _change(self) -> Iterator[None]:
+        if self._owner is None:
+            yield
+            return
+        with self._owner._change_reference(self.external_ref) as reference:
+            self.external_ref = reference
+            yield
+
     def _set_hash(self, algorithm: HashAlgorithm, value: str) -> None:
         _set_hash_value(self.external_ref.hashes, algorithm, value)
 
 
+class SourceVerificationStatus(str, Enum):
+    VERIFIED = "verified"
+    MISMATCH = "mismatch"
+    MISSING = "missing"
+    UNVERIFIABLE = "unverifiable"
+
+
+class SourceVerification(NamedTuple):
+    """
+    Outcome of checking one local source archive against its recorded hashes.
+    """
+
+    component: SbomComponent
+    source: SourceArtifact
+    path: Path
+    status: SourceVerificationStatus
+    expected: Dict[HashAlgorithm, str]
+    actual: Dict[HashAlgorithm, str]
+
+    @property
+    def ok(self) -> bool:
+        return self.status == SourceVerificationStatus.VERIFIED
+
+
+def _verification_status(expected: Dict[HashAlgorithm, str],
+                         actual: Dict[HashAlgorithm, str] | OSError | None) -> SourceVerificationStatus:
+    if not expected:
+        return SourceVerificationStatus.UNVERIFIABLE
+    if actual is None or isinstance(actual, OSError):
+        return SourceVerificationStatus.MISSING
+    if all(actual[alg] == value.lower() for alg, value in expected.items()):
+        return SourceVerificationStatus.VERIFIED
+    return SourceVerificationStatus.MISMATCH
+
+
 class SbomNature(str, Enum):
     SOURCE = "source"
     BINARY = "binary"
@@ -529,6 +755,34 @@ class SbomNature(str, Enum):
         return str(self.value)
 
 
+@lru_cache(maxsize=None)
+def _standard_bom_library_version() -> str:
+    # reading the installed distribution metadata is by far the most expensive step of creating a StandardBom
+    return library_version(STANDARD_BOM_MODULE)
+
+
+def _new_standard_bom_tools_entry() -> Component:
+    return Component(
+        name=STANDARD_BOM_MODULE,
+        version=_standard_bom_library_version(),
+        supplier=OrganizationalEntity(name='Siemens AG'),
+        external_references=[ExternalReference(type=ExternalReferenceType.WEBSITE,
+                                               url=XsUri('https://sbom.siemens.io/'))]
+    )
+
+
+def _new_standard_bom_definition() -> Standard:
+    return Standard(
+        bom_ref='standard-bom',
+        name='Standard BOM',
+        version='3.0.0',
+        description='The Standard for Software Bills of Materials in Siemens',
+        owner='Siemens AG',
+        external_references=[
+            ExternalReference(type=ExternalReferenceType.WEBSITE, url=XsUri('https://sbom.siemens.io/'))]
+    )
+
+
 def is_standardbom_component_entry(component: Component) -> bool:
     return component.supplier is not None \
         and component.supplier.name == 'Siemens AG' \
@@ -540,133 +794,733 @@ def is_standardbom_tool_entry(tool: Tool) -> bool:
         and tool.name == STANDARD_BOM_MODULE
 
 
+def _bom_refs(components: Iterable[Component]) -> Iterator[BomRef]:
+    stack = list(components)
+    while stack:
+        component = stack.pop()
+        yield component.bom_ref
+        stack.extend(component.components)
+
+
+class ConversionLoss(NamedTuple):
+    """A part of a Standard BOM v2 document that ``StandardBom.normalize_v2`` could not convert exactly."""
+
+    location: str
+    detail: str
+
+
+def _tool_component(tool: Tool) -> Component:
+    return Component(name=tool.name if tool.name else UNKNOWN_TOOL_NAME,
+                     version=tool.version, supplier=OrganizationalEntity(name=tool.vendor),
+                     hashes=tool.hashes, external_references=tool.external_references)
+
+
+class _Batch(NamedTuple):
+    changed: Dict[int, Component]
+
+
+class _Sharing:
+    """
+    The components a document shares with its clones, see ``StandardBom.clone``.
+    """
+
+    __slots__ = ('holders', 'held', 'copies')
+
+    def __init__(self, holders: Dict[int, int]) -> None:
+        # the number of live documents that hold a shared component, by its id; common to all clones of a document
+        self.holders = holders
+        # the ids of the shared components that this document still holds
+        self.held: Set[int] = set()
+        # the own copies of this document that replaced shared components, for wrappers that still point to them
+        self.copies: IdentityCache[Component] = IdentityCache()
+
+    def hold(self, components: Iterable[Component]) -> None:
+        for component in components:
+            key = id(component)
+            if key not in self.held:
+                self.held.add(key)
+                self.holders[key] = self.holders.get(key, 0) + 1
+
+    def is_shared(self, component: Component) -> bool:
+        key = id(component)
+        return key in self.held and self.holders.get(key, 0) > 1
+
+    def release(self, component: Component) -> None:
+        key = id(component)
+        if key in self.held:
+            self.held.discard(key)
+            self._drop(key)
+
+    def release_all(self) -> None:
+        # also the finalizer of the document, so it must not refer to the document
+        for key in self.held:
+            self._drop(key)
+        self.held.clear()
+
+    def _drop(self, key: int) -> None:
+        remaining = self.holders.get(key, 0) - 1
+        if remaining > 0:
+            self.holders[key] = remaining
+        else:
+            self.holders.pop(key, None)
+
+
+def _resort_component(component: Component) -> None:
+    # members changed in place keep their old position and hash, so the nested sets are rebuilt
+    for reference in component.external_references:
+        reference.hashes = list(reference.hashes)
+    component.external_references = list(component.external_references)
+    component.hashes = list(component.hashes)
+    component.properties = list(component.properties)
+    component.licenses = list(component.licenses)
+
+
+class _ComponentSortKey:
+    """
+    Orders components as ``Component.__lt__`` does, which compares a tuple of all fields. The leading fields of that
+    tuple are read once per key; only components that agree on all of them are compared by ``Component.__lt__``.
+    """
+
+    __slots__ = ('component', 'fields')
+
+    def __init__(self, component: Component) -> None:
+        self.component = component
+        # None sorts after every value, as in the comparison of cyclonedx
+        self.fields = tuple((value is None, '' if value is None else value) for value in (
+            component.type, component.group, component.name, component.version, component.bom_ref.value))
+
+    def __lt__(self, other: '_ComponentSortKey') -> bool:
+        if self.fields != other.fields:
+            return self.fields < other.fields
+        return bool(self.component < other.component)
+
+
+def _fill_sorted_set(target: 'SortedSet[Any]', items: List[Any], hashed: Optional[Dict[Any, None]] = None) -> None:
+    # replaces the content of the set by unique items in sorted order, without comparing them again; the chunks are
+    # filled as SortedList.update does. Only valid for sets without a key function. This writes the internals of
+    # sortedcontainers, so its version is pinned and the layout is checked by a test. ``hashed`` holds the same
+    # items as dict keys, whose stored hashes set.update takes over instead of hashing the items again.
+    target.clear()
+    source: Any = target
+    source._set.update(hashed if hashed is not None else items)
+    sorted_list = source._list
+    sorted_list._lists = [items[pos:pos + sorted_list._load] for pos in range(0, len(items), sorted_list._load)]
+    sorted_list._maxes = [chunk[-1] for chunk in sorted_list._lists]
+    sorted_list._len = len(items)
+
+
+def _fill_components(target: 'SortedSet[Component]', components: Iterable[Component]) -> None:
+    # of equal components the first one is kept, as with single inserts; the keys are computed from the current
+    # fields and dropped after the sort, so components changed directly are sorted by their new values
+    with paused_gc():
+        unique = dict.fromkeys(components)
+        _fill_sorted_set(target, sorted(unique, key=_ComponentSortKey), unique)
+
+
+def _merge_components(target: 'SortedSet[Component]', added: List[Component]) -> None:
+    if 4 * len(added) <= len(target):
+        # few inserts into a large set, as SortedSet.update decides
+        target.update(added)
+        return
+    _fill_components(target, chain(target, added))
+
+
+def _copy_sorted_set(items: 'SortedSet[Any]', copy_item: Optional[Callable[[Any], Any]] = None) -> 'SortedSet[Any]':
+    # SortedSet.copy() and deepcopy() sort again, which compares the (costly) items although the order is already
+    # known; the items are filled in their order instead. Only valid for sets without a key function.
+    result: 'SortedSet[Any]' = SortedSet()
+    _fill_sorted_set(result, list(items) if copy_item is None else [copy_item(item) for item in items])
+    return result
+
+
+def _detached_copy(bom: Bom) -> Bom:
+    # a deep copy of the document; the large sorted sets are copied without sorting them again
+    memo: Dict[int, Any] = {}
+    components = _copy_sorted_set(bom.components, lambda c: copy.deepcopy(c, memo))
+    dependencies = _copy_sorted_set(bom.dependencies, lambda d: copy.deepcopy(d, memo))
+    memo.update({id(bom.components): components, id(bom.dependencies): dependencies})
+    return copy.deepcopy(bom, memo)
+
+
+def _copy_dependency(dependency: Dependency) -> Dependency:
+    result = Dependency.__new__(Dependency)
+    vars(result).update(vars(dependency))
+    result._dependencies = _copy_sorted_set(dependency.dependencies, _copy_dependency)
+    return result
+
+
+def _copy_component(component: Component) -> Component:
+    # bom-refs keep their identity, so that the dependencies still point to the copy
+    memo: Dict[int, Any] = {id(ref): ref for ref in _bom_refs([component])}
+    return copy.deepcopy(component, memo)
+
+
+def _license_label(lic: License) -> Optional[str]:
+    if isinstance(lic, LicenseExpression):
+        return lic.value
+    if isinstance(lic, DisjunctiveLicense):
+        return lic.id or lic.name
+    return None
+
+
+def _enum_value(value: Optional[Enum]) -> Optional[str]:
+    return str(value.value) if value is not None else None
+
+
+_ColumnSource = Tuple[Component, Dict[str, str], Dict[HashAlgorithm, str]]
+
+_COLUMN_EXTRACTORS: Dict[str, Callable[[_ColumnSource], Any]] = {
+    'bom_ref': lambda src: src[0].bom_ref.value,
+    'type': lambda src: _enum_value(src[0].type),
+    'group': lambda src: src[0].group,
+    'name': lambda src: src[0].name,
+    'version': lambda src: src[0].version,
+    'purl': lambda src: purl_key(src[0].purl) if src[0].purl is not None else None,
+    'cpe': lambda src: src[0].cpe,
+    'scope': lambda src: _enum_value(src[0].scope),
+    'description': lambda src: src[0].description,
+    'copyright': lambda src: src[0].copyright,
+    'licenses': lambda src: [label for label in map(_license_label, src[0].licenses) if label is not None],
+    'direct': lambda src: _is_true_value(src[1].get(PROPERTY_DIRECT_DEPENDENCY)),
+    'internal': lambda src: _is_true_value(src[1].get(PROPERTY_INTERNAL)),
+    'primary_language': lambda src: src[1].get(PROPERTY_PRIMARY_LANGUAGE),
+    'third_party_notices': lambda src: src[1].get(PROPERTY_THIRD_PARTY_NOTICES),
+    'legal_remark': lambda src: src[1].get(PROPERTY_LEGAL_REMARK),
+    'filename': lambda src: src[1].get(PROPERTY_FILENAME),
+    'md5': lambda src: src[2].get(HashAlgorithm.MD5),
+    'sha1': lambda src: src[2].get(HashAlgorithm.SHA_1),
+    'sha256': lambda src: src[2].get(HashAlgorithm.SHA_256),
+    'sha512': lambda src: src[2].get(HashAlgorithm.SHA_512),
+    'hashes': lambda src: {str(alg.value): content for alg, content in src[2].items()},
+}
+
+COLUMN_FIELDS: Tuple[str, ...] = tuple(_COLUMN_EXTRACTORS)
+
+_PROPERTY_COLUMNS = frozenset(('direct', 'internal', 'primary_language', 'third_party_notices', 'legal_remark', 'filename'))
+_HASH_COLUMNS = frozenset(('md5', 'sha1', 'sha256', 'sha512', 'hashes'))
+_BOOLEAN_COLUMNS = frozenset(('direct', 'internal'))
+
+
+def _first_values(entries: Iterable[Any], key: Callable[[Any], Any], value: Callable[[Any], Any]) -> Dict[Any, Any]:
+    result: Dict[Any, Any] = {}
+    for entry in entries:
+        result.setdefault(key(entry), value(entry))
+    return result
+
+
+def _to_array(library: str, name: str, values: List[Any]) -> Any:
+    if library == 'numpy':
+        numpy = import_module('numpy')
+        return numpy.array(values, dtype=bool if name in _BOOLEAN_COLUMNS else object)
+    return import_module('pyarrow').array(values)
+
+
 class StandardBom:
     """
     Main DTO for the complete "Standard BOM" JSON structure.
     """
 
-    bom: Bom
+    _bom: Bom
 
     def __init__(self, bom: Optional[Bom] = None) -> None:
+        # the same reference for all wrappers, so that handing out a wrapper costs no additional object
+        self._ref = weakref.ref(self)
+        self._sharing: Optional[_Sharing] = None
+        self._batch: Optional[_Batch] = None
+        self._build: Optional[List[Component]] = None
         if bom is None:
-            self.bom = Bom()
+            # a new Bom has none of the Standard BOM entries, so there is nothing to look up
+            self.bom = Bom(definitions=Definitions(standards=[_new_standard_bom_definition()]))
+            self._model.metadata.tools.components.add(_new_standard_bom_tools_entry())
+            self._model.metadata.supplier = OrganizationalEntity(name='Siemens or its Affiliates')
         else:
             self.bom = bom
-        self._insert_standard_bom_tools_entry_if_missing()
-        self._insert_standard_bom_definitions_entry_if_missing()
-        self._set_supplier_if_missing()
+            self._insert_standard_bom_tools_entry_if_missing()
+            self._insert_standard_bom_definitions_entry_if_missing()
+            self._set_supplier_if_missing()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the weak reference, the copy-on-write state and a running batch belong to this instance, not to a copy
+        state = self.__dict__.copy()
+        for name in ('_ref', '_sharing', '_batch'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state, _ref=weakref.ref(self), _sharing=None, _batch=None)
+
+    @property
+    def bom(self) -> Bom:
+        """
+        The CycloneDX document; components collected by ``build`` are merged into it first.
+        """
+        return self._model
+
+    @bom.setter
+    def bom(self, bom: Bom) -> None:
+        self._bom = bom
+
+    @property
+    def _model(self) -> Bom:
+        # the document as read by the methods of this class, which a read-only snapshot does not hand out
+        self._merge_build()
+        return self._bom
 
     def _insert_standard_bom_tools_entry_if_missing(self) -> None:
         standard_bom_tools_entry: Tool | Component | None = None
-        for comp in self.bom.metadata.tools.components:
+        for comp in self._model.metadata.tools.components:
             if is_standardbom_component_entry(comp):
                 standard_bom_tools_entry = comp
 
         # checking tools entry for backward compatibility with v2
         if standard_bom_tools_entry is None:
-            for tool in self.bom.metadata.tools.tools:
+            for tool in self._model.metadata.tools.tools:
                 if is_standardbom_tool_entry(tool):
                     standard_bom_tools_entry = tool
 
         if standard_bom_tools_entry is None:
-            component = Component(
-                name=STANDARD_BOM_MODULE,
-                version=library_version(STANDARD_BOM_MODULE),
-                supplier=OrganizationalEntity(name='Siemens AG'),
-                external_references=[ExternalReference(type=ExternalReferenceType.WEBSITE,
-                                                       url=XsUri('https://sbom.siemens.io/'))]
-            )
-            self.bom.metadata.tools.components.add(component)
+            self._model.metadata.tools.components.add(_new_standard_bom_tools_entry())
 
     def _insert_standard_bom_definitions_entry_if_missing(self) -> None:
-        definitions_entry = self.bom.definitions
+        definitions_entry = self._model.definitions
         if (definitions_entry is None
             or definitions_entry.standards is None
             or not any((standard.name == 'Standard BOM'
                         and standard.owner == 'Siemens AG') for standard in definitions_entry.standards)):
-            standard = Standard(
-                bom_ref='standard-bom',
-                name='Standard BOM',
-                version='3.0.0',
-                description='The Standard for Software Bills of Materials in Siemens',
-                owner='Siemens AG',
-                external_references=[
-                    ExternalReference(type=ExternalReferenceType.WEBSITE, url=XsUri('https://sbom.siemens.io/'))]
-            )
+            standard = _new_standard_bom_definition()
             if definitions_entry is None:
                 definitions_entry = Definitions(standards=[standard])
             else:
                 definitions_entry.standards.add(standard)
-            self.bom.definitions = definitions_entry
+            self._model.definitions = definitions_entry
 
     def _set_supplier_if_missing(self) -> None:
-        if not self.bom.metadata.supplier:
-            self.bom.metadata.supplier = OrganizationalEntity(name='Siemens or its Affiliates')
+        if not self._model.metadata.supplier:
+            self._model.metadata.supplier = OrganizationalEntity(name='Siemens or its Affiliates')
 
     def _set_metadata_property(self, property_name: str, value: Optional[str | None]) -> None:
         existing = next(filter(lambda p: p.name == property_name,
-                               self.bom.metadata.properties), None)
+                               self._model.metadata.properties), None)
         if existing:
             if value:
                 # update existing
                 existing.value = value
             else:
                 # remove existing
-                self.bom.metadata.properties.remove(existing)
+                self._model.metadata.properties.remove(existing)
         else:
             if value:
                 # add new
                 prop = Property(name=property_name, value=value)
-                self.bom.metadata.properties.add(prop)
+                self._model.metadata.properties.add(prop)
             else:
                 # nothing to do
                 pass
 
+    def _wrap(self, component: Component) -> SbomComponent:
+        wrapper = SbomComponent(component)
+        wrapper._owner = self._ref
+        return wrapper
+
+    def _before_change(self, wrapper: SbomComponent) -> None:
+        component = self._own_component(wrapper.component)
+        wrapper.component = component
+        if self._batch is not None:
+            self._batch.changed[id(component)] = component
+
+    def _own_component(self, component: Component) -> Component:
+        # the component of this document that a wrapper refers to, copied first if it is shared with a clone
+        sharing = self._sharing
+        if sharing is None:
+            return component
+        origin = component
+        while (copied := sharing.copies.get(component)) is not None:
+            component = copied
+        if sharing.is_shared(component):
+            own = _copy_component(component)
+            sharing.release(component)
+            sharing.copies.set(component, own)
+            if self._batch is None:
+                self._model.components.discard(component)
+                self._model.components.add(own)
+            # otherwise the order of the set may already be broken by other changes, so it is replaced at the end
+            component = own
+        if component is not origin:
+            sharing.copies.set(origin, component)
+        return component
+
+    def _share(self, other: 'StandardBom', components: List[Component]) -> None:
+        if self._sharing is None:
+            self._sharing = _Sharing({})
+            weakref.finalize(self, self._sharing.release_all)
+        other._sharing = _Sharing(self._sharing.holders)
+        weakref.finalize(other, other._sharing.release_all)
+        self._sharing.hold(components)
+        other._sharing.hold(components)
+
+    def _copy_bom(self) -> Bom:
+        # a copy of the document that refers to the same components
+        components = list(self._model.components)
+        memo: Dict[int, Any] = {
+            id(self._model.components): _copy_sorted_set(self._model.components),
+            id(self._model.dependencies): _copy_sorted_set(self._model.dependencies, _copy_dependency),
+        }
+        memo.update((id(c), c) for c in components)
+        memo.update((id(ref), ref) for ref in _bom_refs(components))
+        return copy.deepcopy(self._model, memo)
+
+    def clone(self) -> 'StandardBom':
+        """
+        Creates a copy of this SBOM that shares the components with this one until they are changed.
+
+        Metadata, dependencies and the other parts of the document are copied. A shared component is copied by
+        whichever document first changes it through a setter or ``add_*`` method of the ``SbomComponent`` wrappers
+        handed out by ``components`` or ``query``, including wrappers obtained before the clone; changes made on the
+        ``Component`` objects directly affect both documents, as do changes through wrappers that outlive their
+        document. Once a clone is garbage collected, its components are no longer copied by the other documents.
+        """
+        clone = StandardBom(self._copy_bom())
+        self._share(clone, list(clone.bom.components))
+        return clone
+
+    @contextmanager
+    def batch(self) -> Iterator['StandardBom']:
+        """
+        Groups many component changes, e.g. to rename or re-version thousands of components.
+
+        Setters of the components change the sort keys of objects inside sorted sets. Within the batch, the changes
+        are only recorded; when the batch ends, the nested sets of the changed components and the component set of
+        the SBOM are sorted once. Changes are tracked for the ``SbomComponent`` wrappers handed out by
+        ``components`` or ``query`` of this SBOM, also for those obtained before the batch. Nested calls join the
+        outer batch.
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = _Batch({})
+        try:
+            yield self
+        finally:
+            batch, self._batch = self._batch, None
+            self._commit_batch(batch)
+
+    @contextmanager
+    def build(self) -> Iterator['StandardBom']:
+        """
+        Collects the components of ``add_component``, e.g. while generating an SBOM with thousands of components.
+
+        Every insert into the sorted component set compares the costly comparison tuples of cyclonedx O(log n) times.
+        Within the build, added components are only collected; they are sorted once, by a key computed once per
+        component, when the build ends or when ``bom`` is read, e.g. by ``components``, ``query`` or the serializer.
+        The order is the same as with single inserts. Nested calls join the outer build.
+        """
+        if self._build is not None:
+            yield self
+            return
+        self._build = []
+        try:
+            yield self
+        finally:
+            self._merge_build()
+            self._build = None
+
+    def _merge_build(self) -> None:
+        if self._build:
+            _merge_components(self._bom.components, self._build)
+            self._build.clear()
+
+    def _commit_batch(self, batch: '_Batch') -> None:
+        self._model.metadata.properties = list(self._model.metadata.properties)
+        if self._model.metadata.component is not None:
+            _resort_component(self._model.metadata.component)
+        # also sorted without recorded changes, as components may have been changed in other ways
+        for component in batch.changed.values():
+            _resort_component(component)
+        copies = self._sharing.copies if self._sharing is not None else None
+        _fill_components(self._model.components,
+                         [copies.get(c) or c for c in self._model.components] if copies is not None else self._model.components)
+
+    def freeze(self) -> 'FrozenStandardBom':
+        """
+        Creates a read-only snapshot of this SBOM that can be shared between threads, see ``FrozenStandardBom``.
+
+        The snapshot is built on a copy of the whole document, so no change of this SBOM or of its wrappers reaches
+        it. Missing dependency entries are added to the copy, and components without a unique bom-ref are given one,
+        as the serializer would do on every call.
+        """
+        from siemens_standard_bom.frozen import FrozenStandardBom
+        from siemens_standard_bom.serializer import prepare
+
+        bom = _detached_copy(self._model)
+        # done once here, so that serializing the snapshot does not change it
+        prepare(bom)
+        return FrozenStandardBom(bom)
+
+    def normalize_v2(self) -> List[ConversionLoss]:
+        """
+        Upgrades the structures of Standard BOM v2 to the v3 model once, so that the getters no longer convert them
+        on every access; see also ``StandardBomParser.parse(..., normalize=True)``.
+
+        The legacy ``author`` of the components and of the metadata component is moved into their ``authors``, and
+        the legacy tools of the metadata become tool components. Returns what could not be converted exactly.
+        """
+        losses: List[ConversionLoss] = []
+        with self.batch():
+            wrappers = list(self.components)
+            if self.component is not None:
+                wrappers.append(self.component)
+            for component in wrappers:
+                if component.component.author is not None and not component._normalize_author():
+                    losses.append(ConversionLoss(component.bom_ref.value or component.name,
+                                                 'legacy author merged with an equal entry of the authors'))
+
+        tools = self._model.metadata.tools
+        if tools.tools:
+            for tool in tools.tools:
+                if not tool.name:
+                    losses.append(ConversionLoss('metadata.tools', f"tool without a name, named '{UNKNOWN_TOOL_NAME}'"))
+            tools.components = [*tools.components, *map(_tool_component, tools.tools)]
+            tools.tools = []
+        return losses
+
+    def fingerprint(self) -> str:
+        """
+        Stable SHA-256 digest over the content of this SBOM.
+
+        The serial number, the BOM version and the metadata timestamp identify a document rather than describe its
+        content, so they are not part of the digest. The component digests are combined as Merkle tree leaves,
+        hence only components changed since the previous call are hashed again.
+        """
+        metadata = json.loads(self._model.metadata.as_json(view_=SchemaVersion1Dot6))  # type: ignore[attr-defined]
+        metadata.pop('timestamp', None)
+        sections = [
+            _merkle_root([SbomComponent(c)._fingerprint_digest() for c in self._model.components]),
+            hashlib.sha256(json.dumps(metadata, sort_keys=True).encode('utf-8')).digest(),
+            _merkle_root([_digest(ref) for ref in self._model.external_references]),
+            _merkle_root([_digest(dep) for dep in self._model.dependencies]),
+            _digest(self._model.definitions) if self._model.definitions is not None else b'',
+        ]
+        return hashlib.sha256(b''.join(sections)).hexdigest()
+
+    def to_columns(self, fields: Optional[Iterable[str]] = None,
+                   array_library: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Exports the components as a dict of equal-length columns, one entry per component.
+
+        ``fields`` selects columns from ``COLUMN_FIELDS`` and defaults to all of them. Every component is visited
+        once; its properties and hashes are indexed once instead of being searched per field. With
+        ``array_library`` set to ``'numpy'`` or ``'arrow'``, the columns are returned as arrays of that library,
+        which must be installed.
+        """
+        names = list(fields) if fields is not None else list(COLUMN_FIELDS)
+        unknown = [name for name in names if name not in _COLUMN_EXTRACTORS]
+        if unknown:
+            raise ValueError(f"Unknown column fields: {', '.join(unknown)}")
+        if array_library not in (None, 'numpy', 'arrow'):
+            raise ValueError(f"Unsupported array library: {array_library}")
+
+        extractors = [_COLUMN_EXTRACTORS[name] for name in names]
+        columns: List[List[Any]] = [[] for _ in names]
+        with_properties = not _PROPERTY_COLUMNS.isdisjoint(names)
+        with_hashes = not _HASH_COLUMNS.isdisjoint(names)
+        for component in self._model.components:
+            properties = _first_values(component.properties, lambda p: p.name, lambda p: p.value) \
+                if with_properties else {}
+            hashes = _first_values(component.hashes, lambda h: h.alg, lambda h: h.content) if with_hashes else {}
+            source = (component, properties, hashes)
+            for column, extractor in zip(columns, extractors):
+                column.append(extractor(source))
+
+        if array_library is not None:
+            return {name: _to_array(array_library, name, column) for name, column in zip(names, columns)}
+        return dict(zip(names, columns))
+
+    def verify_local_sources(self, base_dir: str | Path, workers: Optional[int] = None) -> List[SourceVerification]:
+        """
+        Checks the local source archives of all components against their recorded hashes.
+
+        Archive URLs are resolved relative to ``base_dir``. Each file is read once for all of its recorded
+        algorithms, and files are hashed in parallel on ``workers`` threads. Hashes with algorithms that
+        ``hashlib`` does not provide are ignored; an archive without any other hash is reported as unverifiable.
+        """
+        base = Path(base_dir)
+        entries: List[Tuple[SbomComponent, SourceArtifact, Path, Dict[HashAlgorithm, str]]] = []
+        jobs: Dict[Path, set[HashAlgorithm]] = {}
+        for component in self._model.components:
+            for ex_ref in filter(is_local_source_archive, component.external_references):
+                path = base / _strip_file_scheme(str(ex_ref.url))
+                expected = {h.alg: h.content for h in ex_ref.hashes if h.alg in SUPPORTED_ALGORITHMS}
+                entries.append((SbomComponent(component), SourceArtifact(ex_ref), path, expected))
+                if expected:
+                    jobs.setdefault(path, set()).update(expected)
+
+        results = hash_files(jobs, workers=workers)
+        report = []
+        for sbom_component, source, path, expected in entries:
+            actual = results.get(path)
+            report.append(SourceVerification(sbom_component, source, path, _verification_status(expected, actual),
+                                             expected, actual if isinstance(actual, dict) else {}))
+        return report
+
+    def _hash_targets(self, base: Path) -> List[Tuple[SbomComponent, Path]]:
+        targets = []
+        for component in self._model.components:
+            sbom_component = self._wrap(component)
+            location = sbom_component.relative_path or sbom_component.filename
+            if location is not None:
+                targets.append((sbom_component, base / _strip_file_scheme(location)))
+        return targets
+
+    def compute_hashes(self, base_dir: str | Path,
+                       algorithms: Iterable[HashAlgorithm] = (HashAlgorithm.SHA_256,),
+                       workers: Optional[int] = None,
+                       cache_file: Optional[str | Path] = None) -> Dict[Path, HashResult]:
+        """
+        Sets the hashes of all components from the files at their ``relative_path``, or at their ``filename``
+        if no relative path is recorded, resolved against ``base_dir``.
+
+        Each file is read once for all algorithms, and files are hashed in parallel on ``workers`` threads.
+        With a ``cache_file``, files whose size and modification time match the cache are not read again.
+        Returns the digests, or the ``OSError`` for unreadable files, per path.
+        """
+        wanted = list(dict.fromkeys(algorithms))
+        cache = HashCache(cache_file)
+        targets = self._hash_targets(Path(base_dir))
+        results: Dict[Path, HashResult] = {}
+        jobs: Dict[Path, List[HashAlgorithm]] = {}
+        for path in dict.fromkeys(path for _, path in targets):
+            cached = cache.lookup(path, wanted)
+            if cached is not None:
+                results[path] = cached
+            else:
+                jobs[path] = wanted
+
+        for path, result in hash_files(jobs, workers=workers).items():
+            results[path] = result
+            if not isinstance(result, OSError):
+                cache.store(path, result)
+        cache.save()
+
+        # the hashes are part of the sort keys of the components, so the component set is sorted once at the end
+        with self.batch():
+            for sbom_component, path in targets:
+                digests = results[path]
+                if isinstance(digests, OSError):
+                    continue
+                with sbom_component._change():
+                    for alg, value in digests.items():
+                        _set_hash_value(sbom_component.component.hashes, alg, value)
+        return results
+
+    def to_sqlite(self, conn: 'sqlite3.Connection') -> int:
+        """
+        Stores this SBOM in normalized tables of a SQLite database and returns its id there, see
+        ``siemens_standard_bom.sqlite``.
+        """
+        from siemens_standard_bom.sqlite import to_sqlite
+        return to_sqlite(self, conn)
+
+    @staticmethod
+    def from_sqlite(conn: 'sqlite3.Connection', sbom_id: int) -> 'StandardBom':
+        from siemens_standard_bom.sqlite import from_sqlite
+        return from_sqlite(conn, sbom_id)
+
+    def memory_report(self) -> MemoryReport:
+        """
+        Approximates the memory retained by each section of this SBOM and counts duplicated value objects.
+        """
+        return memory_report(self._model)
+
     def _get_metadata_property(self, property_name: str) -> Optional[str]:
         prop = next(filter(lambda p: p.name == property_name,
-                           self.bom.metadata.properties), None)
+                           self._model.metadata.properties), None)
         return prop.value if prop else None
 
     @property
     def serial_number(self) -> UUID:
-        return self.bom.serial_number
+        return self._model.serial_number
 
     @serial_number.setter
     def serial_number(self, serial_number: UUID) -> None:
-        self.bom.serial_number = serial_number
+        self._model.serial_number = serial_number
 
     @property
     def version(self) -> int:
-        return self.bom.version
+        return self._model.version
 
     @version.setter
     def version(self, version: int) -> None:
-        self.bom.version = version
+        self._model.version = version
 
     @property
     def components(self) -> ImmutableList[SbomComponent]:
-        comps = self.bom.components
-        sbom_comps = map(lambda c: SbomComponent(c), comps)
+        comps = self._model.components
+        sbom_comps = map(self._wrap, comps)
         return ImmutableList(*sbom_comps)
 
     @components.setter
     def components(self, components: Iterable[Component]) -> None:
-        self.bom.components = SortedSet(components)
+        if self._build:
+            # replaced together with the components of the document
+            self._build.clear()
+        if self._sharing is not None:
+            self._sharing.release_all()
+        # a new set, as the caller may still hold the old one
+        self._model.components = ()
+        _fill_components(self._model.components, components)
+
+    def query(self, index: Optional['ComponentIndex'] = None) -> 'ComponentQuery':
+        """
+        Starts a lazily evaluated query over the components, e.g.
+        ``sbom.query().where(scope=ComponentScope.REQUIRED, internal=False).license_in(['MIT'])``.
+        """
+        from siemens_standard_bom.query import ComponentQuery
+        return ComponentQuery(self._model.components, index, wrap=self._wrap)
+
+    def components_by_purl(self) -> Dict[str, List[SbomComponent]]:
+        """
+        Groups the components by the canonical key of their purl, see ``siemens_standard_bom.purl``.
+        """
+        groups: Dict[str, List[SbomComponent]] = {}
+        for component in self._model.components:
+            if component.purl is not None:
+                groups.setdefault(purl_key(component.purl), []).append(self._wrap(component))
+        return groups
 
     def add_component(self, component: Component | SbomComponent) -> None:
-        self.bom.components.add(component
-                                if isinstance(component, Component)
-                                else component.component)
+        component = component if isinstance(component, Component) else component.component
+        if self._build is not None:
+            self._build.append(component)
+        else:
+            self._model.components.add(component)
 
     @property
     def external_components(self) -> ImmutableList[ExternalComponent]:
-        references = self.bom.external_references
+        references = self._model.external_references
         return ImmutableList(*map(lambda er: ExternalComponent(er), references))
 
     def add_external_component(self, external: ExternalReference | ExternalComponent) -> None:
-        self.bom.external_references.add(external
-                                         if isinstance(external, ExternalReference)
-                                         else external.reference)
+        self._model.external_references.add(external
+                                            if isinstance(external, ExternalReference)
+                                            else external.reference)
+
+    @property
+    def vulnerabilities(self) -> ImmutableList[Vulnerability]:
+        return ImmutableList(*self._model.vulnerabilities)
+
+    def add_vulnerability(self, vulnerability: Vulnerability) -> None:
+        """
+        Adds a vulnerability; if one with the same id and source is present, its affected targets are extended.
+        """
+        existing = next((v for v in self._model.vulnerabilities
+                         if v.id is not None and v.id == vulnerability.id and v.source == vulnerability.source), None)
+        if existing is None:
+            self._model.vulnerabilities.add(vulnerability)
+            return
+        # the affected targets are part of the sort key of the vulnerability
+        self._model.vulnerabilities.discard(existing)
+        existing.affects.update(vulnerability.affects)
+        self._model.vulnerabilities.add(existing)
 
     @property
     def profile(self) -> Optional[str]:
@@ -678,19 +1532,19 @@ class StandardBom:
 
     @property
     def vcs_clean(self) -> bool:
-        return _is_true_value(SbomComponent.get_custom_property(self.bom.metadata.component, PROPERTY_VCS_CLEAN))
+        return _is_true_value(SbomComponent.get_custom_property(self._model.metadata.component, PROPERTY_VCS_CLEAN))
 
     @vcs_clean.setter
     def vcs_clean(self, value: bool) -> None:
-        SbomComponent.set_custom_property(self.bom.metadata.component, PROPERTY_VCS_CLEAN, f"{value}")
+        SbomComponent.set_custom_property(self._model.metadata.component, PROPERTY_VCS_CLEAN, f"{value}")
 
     @property
     def vcs_revision(self) -> Optional[str]:
-        return SbomComponent.get_custom_property(self.bom.metadata.component, PROPERTY_VCS_REVISION)
+        return SbomComponent.get_custom_property(self._model.metadata.component, PROPERTY_VCS_REVISION)
 
     @vcs_revision.setter
     def vcs_revision(self, value: str) -> None:
-        SbomComponent.set_custom_property(self.bom.metadata.component, PROPERTY_VCS_REVISION, value)
+        SbomComponent.set_custom_property(self._model.metadata.component, PROPERTY_VCS_REVISION, value)
 
     @property
     def sbom_nature(self) -> Optional[SbomNature]:
@@ -703,71 +1557,68 @@ class StandardBom:
 
     @property
     def internal(self) -> bool:
-        return _is_true_value(SbomComponent.get_custom_property(self.bom.metadata.component, PROPERTY_INTERNAL))
+        return _is_true_value(SbomComponent.get_custom_property(self._model.metadata.component, PROPERTY_INTERNAL))
 
     @internal.setter
     def internal(self, value: bool) -> None:
-        SbomComponent.set_custom_property(self.bom.metadata.component, PROPERTY_INTERNAL, f"{value}")
+        SbomComponent.set_custom_property(self._model.metadata.component, PROPERTY_INTERNAL, f"{value}")
 
     @property
     def timestamp(self) -> datetime:
-        return self.bom.metadata.timestamp
+        return self._model.metadata.timestamp
 
     @timestamp.setter
     def timestamp(self, timestamp: datetime) -> None:
-        self.bom.metadata.timestamp = timestamp
+        self._model.metadata.timestamp = timestamp
 
     @property
     def authors(self) -> SortedSet[OrganizationalContact]:
-        return self.bom.metadata.authors
+        return self._model.metadata.authors
 
     @authors.setter
     def authors(self, authors: Iterable[OrganizationalContact]) -> None:
-        self.bom.metadata.authors = SortedSet(authors)
+        self._model.metadata.authors = SortedSet(authors)
 
     def add_author(self, author: OrganizationalContact) -> None:
-        if self.bom.metadata.authors is None:
-            self.bom.metadata.authors = SortedSet()
-        self.bom.metadata.authors.add(author)
+        if self._model.metadata.authors is None:
+            self._model.metadata.authors = SortedSet()
+        self._model.metadata.authors.add(author)
 
     @property
     def tools(self) -> ImmutableList[SbomComponent]:
-        tools = self.bom.metadata.tools.components
+        tools = self._model.metadata.tools.components
 
         # checking tools entry for backward compatibility with v2
-        tools_list = self.bom.metadata.tools.tools
+        tools_list = self._model.metadata.tools.tools
         if tools_list is not None and len(tools_list) > 0:
-            m = map(lambda t: Component(name=t.name if t.name else "(unknown tool)",
-                                        version=t.version, supplier=OrganizationalEntity(name=t.vendor),
-                                        external_references=t.external_references), tools_list)
-            comps: SortedSet[Component] = SortedSet(m)
+            comps: SortedSet[Component] = SortedSet(map(_tool_component, tools_list))
             tools = tools.union(comps)
 
         return ImmutableList(*map(lambda c: SbomComponent(c), tools))
 
     def add_tool(self, tool: Component | SbomComponent) -> None:
-        self.bom.metadata.tools.components.add(tool
-                                               if isinstance(tool, Component)
-                                               else tool.component)
+        self._model.metadata.tools.components.add(tool
+                                                  if isinstance(tool, Component)
+                                                  else tool.component)
 
     @property
     def component(self) -> Optional[SbomComponent]:
-        return SbomComponent(self.bom.metadata.component) if self.bom.metadata.component is not None else None
+        return SbomComponent(self._model.metadata.component) if self._model.metadata.component is not None else None
 
     @component.setter
     def component(self, component: Component | SbomComponent) -> None:
-        self.bom.metadata.component = component.component \
+        self._model.metadata.component = component.component \
             if isinstance(component, SbomComponent) \
             else component
 
     @property
     def supplier(self) -> Optional[OrganizationalEntity]:
-        return self.bom.metadata.supplier
+        return self._model.metadata.supplier
 
     @property
     def definitions(self) -> Optional[Definitions]:
-        return self.bom.definitions
+        return self._model.definitions
 
     @definitions.setter
     def definitions(self, definitions: Definitions) -> None:
-        self.bom.definitions = definitions
+        self._model.definitions = definitions
@@ -5,46 +5,168 @@
 
 import errno
 import json
+import logging
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from cyclonedx.model.bom import Bom
-from cyclonedx.output.json import JsonV1Dot6
+from siemens_standard_bom.instrumentation import StageObserver, StageRecorder, recorder
+from siemens_standard_bom.projection import Projection, projection_for
+from siemens_standard_bom.sidecar import build_index, index_filename, read_slice
 
-from siemens_standard_bom.model import StandardBom
+if TYPE_CHECKING:  # pragma: no cover
+    from siemens_standard_bom.model import SbomComponent, StandardBom
+
+_logger = logging.getLogger(__name__)
+
+# The cyclonedx model and serializer stack takes the largest part of the import time of this library. It is
+# imported by the methods that need it, so that callers which never build a model object do not pay for it.
+
+
+def _read_bytes(filename: str) -> bytes:
+    path = Path(filename)
+    if not path.is_file():
+        raise FileNotFoundError(
+            errno.ENOENT, os.strerror(errno.ENOENT), filename)
+
+    with open(filename, 'rb') as json_file:
+        return json_file.read()
+
+
+def _observers(observer: Optional[StageObserver]) -> List[StageObserver]:
+    return StandardBomParser.observers + [observer] if observer is not None else StandardBomParser.observers
 
 
 class StandardBomParser:
+    observers: List[StageObserver] = []
+    """
+    Observers notified about the stages of every parser operation, see ``siemens_standard_bom.instrumentation``.
+    Observers can also be passed to a single call.
+    """
+
     @staticmethod
-    def parse(filename: str) -> StandardBom:
-        path = Path(filename)
-        if not path.is_file():
-            raise FileNotFoundError(
-                errno.ENOENT, os.strerror(errno.ENOENT), filename)
+    def parse(filename: str, observer: Optional[StageObserver] = None, normalize: bool = False) -> 'StandardBom':
+        """
+        Reads a Standard BOM JSON file.
+
+        With ``normalize``, the structures of Standard BOM v2 are upgraded to the v3 model once after reading, see
+        ``StandardBom.normalize_v2``; what could not be converted exactly is logged as a warning.
+        """
+        from cyclonedx.model.bom import Bom
+        from siemens_standard_bom.loader import from_json
+        from siemens_standard_bom.model import StandardBom
+        from siemens_standard_bom.purl import intern_purls
 
-        with open(filename, 'r', encoding='utf-8') as json_file:
-            json_content = json.loads(json_file.read())
+        stages = recorder('parse', _observers(observer), filename)
+        with stages.stage('read'):
+            raw = _read_bytes(filename)
+            stages.bytes = len(raw)
+        with stages.stage('decode'):
+            json_content = json.loads(raw)
+        with stages.stage('deserialize'):
+            bom: Bom = from_json(json_content)
+            # the purls of components left to the generic deserializer
+            intern_purls(bom.components)
+            stages.components = len(bom.components)
+        with stages.stage('wrap'):
+            sbom = StandardBom(bom)
+        if normalize:
+            with stages.stage('normalize'):
+                for loss in sbom.normalize_v2():
+                    _logger.warning('%s: %s: %s', filename, loss.location, loss.detail)
+        return sbom
 
-            bom: Bom = Bom.from_json(data=json_content)  # type: ignore[attr-defined]
-            return StandardBom(bom)
+    @staticmethod
+    def read_profile(filename: str) -> Optional[str]:
+        """
+        Reads the ``siemens:profile`` of a Standard BOM file without building the model.
+        """
+        json_content: Any = json.loads(_read_bytes(filename))
+        properties = json_content.get('metadata', {}).get('properties', [])
+        return next((p.get('value') for p in properties if p.get('name') == 'siemens:profile'), None)
 
     @staticmethod
-    def save(sbom: StandardBom, output_filename: str, indent: int = 4, with_dependencies: bool = True) -> None:
+    def save(sbom: 'StandardBom', output_filename: str, indent: int = 4, with_dependencies: bool = True,
+             observer: Optional[StageObserver] = None, projection: Optional[str | Projection] = None,
+             index: bool = False) -> None:
+        """
+        Writes the SBOM to a file. See ``serialize`` for the ``projection``.
+
+        With ``index``, a sidecar index with the byte offsets of the components is written next to the file, see
+        ``load_component``.
+        """
+        stages = recorder('save', _observers(observer), output_filename)
         output_file = Path(output_filename)
         output_file.parent.mkdir(exist_ok=True, parents=True)
 
-        output = StandardBomParser.serialize(sbom, indent=indent, with_dependencies=with_dependencies)
+        output = StandardBomParser._serialize(sbom, indent, with_dependencies, projection, stages)
+
+        # encoded first, so that the write stage reports the size of the file rather than the number of characters;
+        # the offsets of an index refer to these exact bytes, so they are written without newline translation
+        data = output.encode('utf-8')
+        with stages.stage('write'):
+            stages.bytes = output_file.write_bytes(data)
+        if not index:
+            return
 
-        output_file.write_text(output, encoding='utf-8')
+        with stages.stage('index'):
+            sidecar = json.dumps(build_index(output, data, output_file.stat().st_mtime_ns))
+            stages.bytes = index_filename(output_file).write_bytes(sidecar.encode('utf-8'))
 
     @staticmethod
-    def serialize(sbom: StandardBom, indent: int = 4, with_dependencies: bool = True) -> str:
-        writer = JsonV1Dot6(bom=sbom.bom)
-        output = writer.output_as_string(indent=indent)
-
-        if not with_dependencies:
-            data = json.loads(output)
-            data.pop('dependencies', None)
-            output = json.dumps(data, indent=indent)
+    def load_component(filename: str, key: str) -> Optional['SbomComponent']:
+        """
+        Reads a single component, given by its bom-ref or purl, using the sidecar index written by
+        ``save(..., index=True)``. Only the bytes of that component are decoded.
+
+        Returns ``None`` if there is no such component. Raises ``ValueError`` if the file was changed after the
+        index was written.
+        """
+        raw = read_slice(filename, key)
+        if raw is None:
+            return None
+
+        from cyclonedx.model.component import Component
+        from siemens_standard_bom.model import SbomComponent
+        from siemens_standard_bom.purl import intern_purls
+
+        component: Component = Component.from_json(data=json.loads(raw))  # type: ignore[attr-defined]
+        intern_purls([component])
+        return SbomComponent(component)
+
+    @staticmethod
+    def serialize(sbom: 'StandardBom', indent: int = 4, with_dependencies: bool = True,
+                  observer: Optional[StageObserver] = None, projection: Optional[str | Projection] = None) -> str:
+        """
+        Serializes the SBOM to JSON.
+
+        A ``projection``, given by a profile name such as ``'external'`` or as a ``Projection``, leaves components
+        and fields out of the output; the SBOM itself is neither copied nor changed.
+        """
+        return StandardBomParser._serialize(sbom, indent, with_dependencies, projection,
+                                            recorder('serialize', _observers(observer)))
+
+    @staticmethod
+    def _serialize(sbom: 'StandardBom', indent: int, with_dependencies: bool,
+                   projection: Optional[str | Projection], stages: StageRecorder) -> str:
+        from siemens_standard_bom.serializer import to_json
+
+        # resolved first, so that an unknown profile fails before the costly serialization
+        resolved = projection_for(projection) if projection is not None else None
+        if resolved is not None and not with_dependencies:
+            resolved = resolved._replace(document_fields=resolved.document_fields | {'dependencies'})
+
+        with stages.stage('serialize'):
+            # the document itself, also of a read-only snapshot
+            output = to_json(sbom._model, indent=indent, projection=resolved)
+            stages.bytes = len(output)
+            stages.components = len(sbom._model.components)
+
+        if resolved is None and not with_dependencies:
+            with stages.stage('strip_dependencies'):
+                data = json.loads(output)
+                data.pop('dependencies', None)
+                output = json.dumps(data, indent=indent)
+                stages.bytes = len(output)
 
         return output
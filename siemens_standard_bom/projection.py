@@ -0,0 +1,123 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Set
+
+if TYPE_CHECKING:  # pragma: no cover
+    from cyclonedx.model.component import Component
+    from siemens_standard_bom.model import SbomComponent
+
+# This module is imported by the parser, so it must not import the cyclonedx stack at module level.
+
+
+class Projection(NamedTuple):
+    """
+    Parts of an SBOM that are left out when it is written, see ``StandardBomParser.serialize``.
+
+    ``include_component`` decides for every component whether it is written at all; dependency entries of the
+    left out components are dropped as well. The other fields name JSON fields of the components and of the
+    document, and properties by their name. ``local_files`` drops external references to ``file:`` URLs.
+    """
+
+    include_component: Optional[Callable[['SbomComponent'], bool]] = None
+    component_fields: FrozenSet[str] = frozenset()
+    properties: FrozenSet[str] = frozenset()
+    document_fields: FrozenSet[str] = frozenset()
+    local_files: bool = False
+
+
+def _not_internal(component: 'SbomComponent') -> bool:
+    return not component.internal
+
+
+PROFILE_PROJECTIONS: Dict[str, Projection] = {
+    'clearing': Projection(include_component=_not_internal),
+    'external': Projection(include_component=_not_internal,
+                           properties=frozenset({'siemens:legalRemark'}),
+                           document_fields=frozenset({'dependencies'}),
+                           local_files=True),
+}
+
+
+def projection_for(spec: str | Projection) -> Projection:
+    if isinstance(spec, Projection):
+        return spec
+    if spec not in PROFILE_PROJECTIONS:
+        raise ValueError(f"No projection for profile '{spec}', expected one of: {', '.join(PROFILE_PROJECTIONS)}")
+    return PROFILE_PROJECTIONS[spec]
+
+
+def includes(projection: Projection, component: 'Component') -> bool:
+    from siemens_standard_bom.model import SbomComponent
+
+    return projection.include_component is None or projection.include_component(SbomComponent(component))
+
+
+def project_fields(entry: Dict[str, Any], projection: Projection) -> Dict[str, Any]:
+    """
+    Removes the fields, properties and local file references left out by the projection from the JSON object of a
+    component.
+    """
+    for field in projection.component_fields:
+        entry.pop(field, None)
+    if projection.properties and 'properties' in entry:
+        entry['properties'] = [p for p in entry['properties'] if p.get('name') not in projection.properties]
+        if not entry['properties']:
+            del entry['properties']
+    if projection.local_files and 'externalReferences' in entry:
+        entry['externalReferences'] = [r for r in entry['externalReferences']
+                                       if not str(r.get('url', '')).startswith('file:')]
+        if not entry['externalReferences']:
+            del entry['externalReferences']
+    return entry
+
+
+def project_dependencies(dependencies: List[Dict[str, Any]], excluded: Set[str]) -> List[Dict[str, Any]]:
+    """
+    Removes the dependency entries of the left out components, given by their bom-refs, and the references to them.
+    """
+    kept = []
+    for dependency in dependencies:
+        if dependency.get('ref') in excluded:
+            continue
+        if 'dependsOn' in dependency:
+            dependency['dependsOn'] = [ref for ref in dependency['dependsOn'] if ref not in excluded]
+            if not dependency['dependsOn']:
+                del dependency['dependsOn']
+        kept.append(dependency)
+    return kept
+
+
+def _project_components(entries: List[Dict[str, Any]], components: Dict[str, 'Component'], projection: Projection,
+                        excluded: Set[str]) -> List[Dict[str, Any]]:
+    kept = []
+    for entry in entries:
+        component = components.get(entry.get('bom-ref', ''))
+        if component is not None and not includes(projection, component):
+            excluded.update(ref for ref in (c.bom_ref.value for c in component.get_all_nested_components(True)) if ref)
+            continue
+        project_fields(entry, projection)
+        if 'components' in entry:
+            entry['components'] = _project_components(entry['components'], components, projection, excluded)
+            if not entry['components']:
+                del entry['components']
+        kept.append(entry)
+    return kept
+
+
+def project(data: Dict[str, Any], components: Dict[str, 'Component'], projection: Projection) -> None:
+    """
+    Removes the parts left out by the projection from JSON data written by the generic cyclonedx writer, for a
+    model that ``siemens_standard_bom.serializer`` does not know. The components are given by their unique bom-refs.
+    """
+    for field in projection.document_fields:
+        data.pop(field, None)
+
+    excluded: Set[str] = set()
+    if 'components' in data:
+        data['components'] = _project_components(data['components'], components, projection, excluded)
+    if 'component' in data.get('metadata', {}):
+        project_fields(data['metadata']['component'], projection)
+    if excluded and 'dependencies' in data:
+        data['dependencies'] = project_dependencies(data['dependencies'], excluded)
@@ -0,0 +1,90 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Memoized package URL parsing and canonical purl keys.
+
+``PackageURL`` hashes and compares by rendering itself as a string, and ``to_string`` normalizes every part on
+each call, so grouping components by purl is dominated by string building. ``PURLS`` is a cache shared by all
+components and documents: every distinct purl is parsed and rendered once, and equal purls are interned to a
+single ``PackageURL`` object, so that they compare by identity. Interned objects are shared, so their
+qualifiers must not be changed in place.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+
+from cyclonedx.model.component import Component
+from packageurl import PackageURL
+
+DEFAULT_MAXSIZE = 1 << 18
+
+
+class PurlCache:
+    """
+    Canonical keys and interned ``PackageURL`` objects by purl string and by ``PackageURL`` object.
+
+    The key of a purl is its normalized string form as defined by the purl specification: lower-case type,
+    type-specific case and name rules, and sorted qualifiers with empty values removed. The cache keeps the
+    objects it has seen alive to recognize them by identity, so it is cleared once it holds ``maxsize`` entries.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._by_string: Dict[str, str] = {}
+        self._by_object: Dict[int, Tuple[PackageURL, str]] = {}
+        self._interned: Dict[str, PackageURL] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_string) + len(self._by_object)
+
+    def clear(self) -> None:
+        self._by_string.clear()
+        self._by_object.clear()
+        self._interned.clear()
+
+    def _make_room(self) -> None:
+        if len(self) >= self.maxsize:
+            self.clear()
+
+    def key(self, purl: PackageURL | str) -> str:
+        """The canonical key of a purl. Raises ``ValueError`` for a malformed purl string."""
+        if isinstance(purl, str):
+            key = self._by_string.get(purl)
+            if key is None:
+                self._make_room()
+                key = self._by_string[purl] = self.key(self.intern(PackageURL.from_string(purl)))
+            return key
+        entry = self._by_object.get(id(purl))
+        if entry is None:
+            self._make_room()
+            # the entry holds the object, so that its id cannot be reused by another object while it is cached
+            entry = self._by_object[id(purl)] = (purl, purl.to_string())
+        return entry[1]
+
+    def intern(self, purl: PackageURL | str) -> PackageURL:
+        """The shared ``PackageURL`` object equal to the given purl."""
+        key = self.key(purl)
+        interned = self._interned.get(key)
+        if interned is None:
+            interned = self._interned[key] = PackageURL.from_string(key) if isinstance(purl, str) else purl
+        return interned
+
+
+PURLS = PurlCache()
+
+
+def purl_key(purl: PackageURL | str) -> str:
+    """The canonical key of a purl, memoized in the shared ``PURLS`` cache."""
+    return PURLS.key(purl)
+
+
+def intern_purls(components: Iterable[Component], cache: Optional[PurlCache] = None) -> None:
+    """Replaces the purls of the components and their nested components by the interned objects."""
+    cache = cache if cache is not None else PURLS
+    pending = list(components)
+    while pending:
+        component = pending.pop()
+        if component.purl is not None:
+            # equal purls do not change the sort order of the components
+            component.purl = cache.intern(component.purl)
+        pending.extend(component.components)
@@ -0,0 +1,171 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom.model import PROPERTY_DIRECT_DEPENDENCY, PROPERTY_FILENAME, PROPERTY_INTERNAL, \
+    PROPERTY_PRIMARY_LANGUAGE, SbomComponent, _is_true_value, _license_label
+from siemens_standard_bom.purl import purl_key
+
+_ATTRIBUTE_FIELDS: Dict[str, Callable[[Component], Any]] = {
+    'name': attrgetter('name'),
+    'group': attrgetter('group'),
+    'version': attrgetter('version'),
+    'type': attrgetter('type'),
+    'scope': attrgetter('scope'),
+    'cpe': attrgetter('cpe'),
+    'purl_type': lambda c: c.purl.type if c.purl is not None else None,
+    'purl': lambda c: purl_key(c.purl) if c.purl is not None else None,
+}
+
+_PROPERTY_FIELDS: Dict[str, Tuple[str, bool]] = {
+    'internal': (PROPERTY_INTERNAL, True),
+    'direct_dependency': (PROPERTY_DIRECT_DEPENDENCY, True),
+    'primary_language': (PROPERTY_PRIMARY_LANGUAGE, False),
+    'filename': (PROPERTY_FILENAME, False),
+}
+
+_TRUE_VALUES = ('true', 'True')
+
+
+class _Predicate(NamedTuple):
+    test: Callable[[Component, Dict[str, Optional[str]]], bool]
+    uses_properties: bool
+    # index lookups whose union contains every match, or None if the predicate cannot be answered from an index
+    lookups: Optional[List[Tuple[str, Any]]]
+
+
+def _first_property_values(component: Component) -> Dict[str, Optional[str]]:
+    values: Dict[str, Optional[str]] = {}
+    for prop in component.properties:
+        values.setdefault(prop.name, prop.value)
+    return values
+
+
+def _compile_criterion(field: str, expected: Any) -> _Predicate:
+    if field == 'purl' and expected is not None:
+        # purls are compared by their canonical keys, so equivalent spellings match
+        expected = purl_key(expected)
+    if field in _ATTRIBUTE_FIELDS:
+        getter = _ATTRIBUTE_FIELDS[field]
+        # components without a value have no index entry, so None is matched by a scan
+        lookups = [(field, expected)] if field in ('purl_type', 'purl') and expected is not None else None
+        return _Predicate(lambda c, _: bool(getter(c) == expected), False, lookups)
+
+    if field in _PROPERTY_FIELDS:
+        name, is_flag = _PROPERTY_FIELDS[field]
+        if is_flag:
+            flag = bool(expected)
+            return _Predicate(lambda _, props: _is_true_value(props.get(name)) == flag, True,
+                              [('property', (name, value)) for value in _TRUE_VALUES] if flag else None)
+        return _Predicate(lambda _, props: props.get(name) == expected, True,
+                          [('property', (name, expected))] if expected is not None else None)
+
+    raise ValueError(f"Unknown query field: {field}")
+
+
+class ComponentIndex:
+    """
+    Lookup tables from purl type, purl, license and property values to components.
+
+    The index is a snapshot of the components it was built from; build a new one after the SBOM was changed.
+    """
+
+    components: List[Component]
+
+    def __init__(self, components: Iterable[Component | SbomComponent]) -> None:
+        self.components = [c.component if isinstance(c, SbomComponent) else c for c in components]
+        self._positions: Dict[Tuple[str, Any], List[int]] = {}
+        for position, component in enumerate(self.components):
+            if component.purl is not None:
+                self._add(('purl_type', component.purl.type), position)
+                self._add(('purl', purl_key(component.purl)), position)
+            for label in map(_license_label, component.licenses):
+                if label is not None:
+                    self._add(('license', label), position)
+            for prop in component.properties:
+                self._add(('property', (prop.name, prop.value)), position)
+
+    def _add(self, key: Tuple[str, Any], position: int) -> None:
+        positions = self._positions.setdefault(key, [])
+        if not positions or positions[-1] != position:
+            positions.append(position)
+
+    def lookup(self, keys: Iterable[Tuple[str, Any]]) -> List[int]:
+        """Sorted positions of the components matching any of the given keys."""
+        found: set[int] = set()
+        for key in keys:
+            found.update(self._positions.get(key, ()))
+        return sorted(found)
+
+
+class ComponentQuery:
+    """
+    Lazily evaluated filter over the components of an SBOM.
+
+    Criteria are compiled once when they are added. Each component is tested against plain ``Component``
+    attributes first, and its properties are looked up at most once. With a ``ComponentIndex``, only the
+    components found by the most selective indexed criterion are tested at all.
+    """
+
+    def __init__(self, components: Iterable[Component | SbomComponent],
+                 index: Optional[ComponentIndex] = None,
+                 predicates: Tuple[_Predicate, ...] = (),
+                 wrap: Callable[[Component], SbomComponent] = SbomComponent) -> None:
+        self._components = components
+        self._index = index
+        self._predicates = predicates
+        self._wrap = wrap
+
+    def _with(self, predicate: _Predicate) -> 'ComponentQuery':
+        # attribute checks are cheaper than building the property lookup, so they are evaluated first
+        predicates = sorted(self._predicates + (predicate,), key=lambda p: p.uses_properties)
+        return ComponentQuery(self._components, self._index, tuple(predicates), self._wrap)
+
+    def where(self, **criteria: Any) -> 'ComponentQuery':
+        query = self
+        for field, expected in criteria.items():
+            query = query._with(_compile_criterion(field, expected))
+        return query
+
+    def license_in(self, licenses: Iterable[str]) -> 'ComponentQuery':
+        accepted = frozenset(licenses)
+        return self._with(_Predicate(
+            lambda c, _: any(_license_label(lic) in accepted for lic in c.licenses),
+            False,
+            [('license', label) for label in accepted]))
+
+    def with_property(self, name: str, value: str) -> 'ComponentQuery':
+        return self._with(_Predicate(lambda _, props: props.get(name) == value, True, [('property', (name, value))]))
+
+    def _candidates(self) -> Iterable[Component]:
+        if self._index is None:
+            return (c.component if isinstance(c, SbomComponent) else c for c in self._components)
+
+        index = self._index
+        indexed = [index.lookup(p.lookups) for p in self._predicates if p.lookups is not None]
+        if not indexed:
+            return iter(index.components)
+        return (index.components[position] for position in min(indexed, key=len))
+
+    def _matches(self, component: Component) -> bool:
+        properties: Optional[Dict[str, Optional[str]]] = None
+        for predicate in self._predicates:
+            if predicate.uses_properties and properties is None:
+                properties = _first_property_values(component)
+            if not predicate.test(component, properties or {}):
+                return False
+        return True
+
+    def __iter__(self) -> Iterator[SbomComponent]:
+        return (self._wrap(c) for c in self._candidates() if self._matches(c))
+
+    def first(self) -> Optional[SbomComponent]:
+        return next(iter(self), None)
+
+    def count(self) -> int:
+        return sum(1 for _ in self)
@@ -0,0 +1,403 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Specialized CycloneDX 1.6 JSON writer for the structures used by Standard BOMs.
+
+``JsonV1Dot6`` serializes through the reflection of ``py_serializable``, which encodes every object to a JSON
+string and decodes it again, and ``Bom.validate`` looks up the dependency of every component with a linear scan.
+``to_json`` builds the same document directly from the model for the fields that Standard BOMs use and leaves
+all other fields to the generic encoder, so that its output is byte-identical to ``JsonV1Dot6``. If the cyclonedx
+model does not have the expected fields, e.g. after an upgrade, the whole document is written by ``JsonV1Dot6``.
+"""
+import json
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, Union
+from warnings import warn
+
+import py_serializable
+from cyclonedx.contrib.bom.utils import BomRefDiscriminator
+from cyclonedx.exception.model import LicenseExpressionAlongWithOthersException, UnknownComponentDependencyException
+from cyclonedx.model import ExternalReference, HashAlgorithm, HashType, Property, \
+    _ExternalReferenceSerializationHelper, _HashTypeRepositorySerializationHelper
+from cyclonedx.model.bom import Bom, BomMetaData
+from cyclonedx.model.bom_ref import BomRef
+from cyclonedx.model.component import Component, _ComponentScopeSerializationHelper, \
+    _ComponentTypeSerializationHelper
+from cyclonedx.model.contact import OrganizationalContact
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.model.license import DisjunctiveLicense, License, LicenseExpression
+from cyclonedx.model.service import Service
+from cyclonedx.output.json import JsonV1Dot6
+from cyclonedx.schema import SchemaVersion
+from cyclonedx.schema.schema import SchemaVersion1Dot6
+
+from siemens_standard_bom.projection import Projection, includes, project, project_dependencies, project_fields
+from siemens_standard_bom.purl import purl_key
+
+T = TypeVar('T')
+
+SCHEMA_URI = 'http://cyclonedx.org/schema/bom-1.6.schema.json'
+
+_VIEW = SchemaVersion1Dot6
+
+# the hash algorithms of CycloneDX 1.6; others are left to the generic encoder, which omits them with a warning
+_HASH_ALGORITHMS = frozenset({
+    HashAlgorithm.MD5, HashAlgorithm.SHA_1, HashAlgorithm.SHA_256, HashAlgorithm.SHA_384, HashAlgorithm.SHA_512,
+    HashAlgorithm.SHA3_256, HashAlgorithm.SHA3_384, HashAlgorithm.SHA3_512, HashAlgorithm.BLAKE2B_256,
+    HashAlgorithm.BLAKE2B_384, HashAlgorithm.BLAKE2B_512, HashAlgorithm.BLAKE3,
+})
+
+Fields = Sequence[Tuple[str, Callable[[Any], Any]]]
+
+
+def _generic(o: Any) -> Any:
+    return json.loads(o.as_json(view_=_VIEW))
+
+
+def _object(o: Any) -> Any:
+    return _generic(o) if o is not None else None
+
+
+def _array(items: Iterable[T], encode: Callable[[T], Any]) -> Optional[List[Any]]:
+    return [encode(item) for item in items] or None
+
+
+def _fields(o: Any, fields: Fields) -> Dict[str, Any]:
+    # like the generic encoder, a field without a value is left out
+    return {key: value for key, get in fields if (value := get(o)) is not None}
+
+
+def _hashes(hashes: Iterable[HashType]) -> Optional[List[Any]]:
+    if not all(h.alg in _HASH_ALGORITHMS for h in hashes):
+        return _HashTypeRepositorySerializationHelper.json_normalize(hashes, view=_VIEW) or None
+    return [{'alg': h.alg.value, 'content': h.content} for h in hashes] or None
+
+
+def _property(p: Property) -> Dict[str, Any]:
+    return {'name': p.name, 'value': p.value} if p.value is not None else {'name': p.name}
+
+
+def _enum_value(value: Any) -> Any:
+    return value.value if value is not None else None
+
+
+def _string(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+_CONTACT_FIELDS: Fields = (
+    ('bom-ref', lambda c: c.bom_ref.value),
+    ('email', lambda c: c.email),
+    ('name', lambda c: c.name),
+    ('phone', lambda c: c.phone),
+)
+
+_EXTERNAL_REFERENCE_FIELDS: Fields = (
+    ('comment', lambda r: r.comment),
+    ('hashes', lambda r: _hashes(r.hashes)),
+    ('type', lambda r: _ExternalReferenceSerializationHelper.json_normalize(r.type, view=_VIEW)),
+    ('url', lambda r: _string(r.url)),
+)
+
+_LICENSE_FIELDS: Fields = (
+    ('acknowledgement', lambda li: _enum_value(li.acknowledgement)),
+    ('bom-ref', lambda li: li.bom_ref.value),
+    ('id', lambda li: li.id),
+    ('name', lambda li: li.name),
+    ('properties', lambda li: _array(li.properties, _property)),
+    ('text', lambda li: _object(li.text)),
+    ('url', lambda li: _string(li.url)),
+)
+
+_EXPRESSION_FIELDS: Fields = (
+    ('acknowledgement', lambda li: _enum_value(li.acknowledgement)),
+    ('bom-ref', lambda li: li.bom_ref.value),
+    ('expression', lambda li: li.value),
+)
+
+
+def _external_reference(reference: ExternalReference) -> Dict[str, Any]:
+    return _fields(reference, _EXTERNAL_REFERENCE_FIELDS)
+
+
+def _licenses(licenses: Iterable[License]) -> Optional[List[Any]]:
+    # an expression wins over other licenses, as in the generic encoder
+    expression = next((li for li in licenses if isinstance(li, LicenseExpression)), None)
+    if expression is not None:
+        return [_fields(expression, _EXPRESSION_FIELDS)]
+    return [{'license': _fields(li, _LICENSE_FIELDS)} for li in licenses if isinstance(li, DisjunctiveLicense)] or None
+
+
+def _has_generic_fields(c: Component) -> bool:
+    return (c.crypto_properties is not None or c.evidence is not None or c.pedigree is not None
+            or c.release_notes is not None or c.swid is not None or bool(c.omnibor_ids or c.swhids or c.tags))
+
+
+def _component(c: Component) -> Any:
+    if _has_generic_fields(c):
+        return _generic(c)
+    return _fields(c, _COMPONENT_FIELDS)
+
+
+_COMPONENT_FIELDS: Fields = (
+    ('author', lambda c: c.author),
+    ('authors', lambda c: _array(c.authors, lambda a: _fields(a, _CONTACT_FIELDS))),
+    ('bom-ref', lambda c: c.bom_ref.value),
+    ('components', lambda c: _array(c.components, _component)),
+    ('copyright', lambda c: c.copyright),
+    ('cpe', lambda c: c.cpe),
+    ('description', lambda c: c.description),
+    ('externalReferences', lambda c: _array(c.external_references, _external_reference)),
+    ('group', lambda c: c.group),
+    ('hashes', lambda c: _hashes(c.hashes)),
+    ('licenses', lambda c: _licenses(c.licenses)),
+    ('manufacturer', lambda c: _object(c.manufacturer)),
+    ('mimeType', lambda c: c.mime_type),
+    ('name', lambda c: c.name),
+    ('properties', lambda c: _array(c.properties, _property)),
+    ('publisher', lambda c: c.publisher),
+    ('purl', lambda c: purl_key(c.purl) if c.purl is not None else None),
+    ('scope', lambda c: _ComponentScopeSerializationHelper.json_normalize(c.scope, view=_VIEW) if c.scope is not None else None),
+    ('supplier', lambda c: _object(c.supplier)),
+    ('type', lambda c: _ComponentTypeSerializationHelper.json_normalize(c.type, view=_VIEW)),
+    ('version', lambda c: c.version),
+)
+
+
+def _dependencies(bom: Bom) -> Optional[List[Any]]:
+    # the dependency graph flattened and merged as by BomDependencyGraphFlatMerger, without replacing it
+    flat: Dict[BomRef, Dict[BomRef, None]] = {}
+    pending = list(bom.dependencies)
+    seen: Set[int] = set()
+    while pending:
+        dependency = pending.pop()
+        if id(dependency) in seen:
+            continue
+        seen.add(id(dependency))
+        targets = flat.setdefault(dependency.ref, {})
+        targets.update((target.ref, None) for target in dependency.dependencies)
+        pending.extend(dependency.dependencies)
+    entries = []
+    for ref in sorted(flat, key=str):
+        entry: Dict[str, Any] = {}
+        if flat[ref]:
+            entry['dependsOn'] = [str(target) for target in sorted(flat[ref], key=str)]
+        if ref.value is not None:
+            entry['ref'] = ref.value
+        entries.append(entry)
+    return entries or None
+
+
+_BOM_FIELDS: Fields = (
+    ('components', lambda b: _array(b.components, _component)),
+    ('definitions', lambda b: _object(b.definitions)),
+    ('dependencies', _dependencies),
+    ('externalReferences', lambda b: _array(b.external_references, _external_reference)),
+    ('metadata', lambda b: _object(b.metadata)),
+    ('properties', lambda b: _array(b.properties, _property)),
+    ('serialNumber', lambda b: b.serial_number.urn if b.serial_number is not None else None),
+    ('services', lambda b: _array(b.services, _generic)),
+    ('version', lambda b: b.version),
+    ('vulnerabilities', lambda b: _array(b.vulnerabilities, _generic)),
+)
+
+# the serialized fields of the model classes written here, in the order of the generic encoder
+_LAYOUT: Dict[type, Tuple[str, ...]] = {
+    Bom: ('components', 'definitions', 'dependencies', 'external_references', 'metadata', 'properties',
+          'serial_number', 'services', 'version', 'vulnerabilities'),
+    Component: ('author', 'authors', 'bom_ref', 'components', 'copyright', 'cpe', 'crypto_properties', 'description',
+                'evidence', 'external_references', 'group', 'hashes', 'licenses', 'manufacturer', 'mime_type', 'name',
+                'omnibor_ids', 'pedigree', 'properties', 'publisher', 'purl', 'release_notes', 'scope', 'supplier',
+                'swhids', 'swid', 'tags', 'type', 'version'),
+    OrganizationalContact: ('bom_ref', 'email', 'name', 'phone'),
+    ExternalReference: ('comment', 'hashes', 'type', 'url'),
+    HashType: ('alg', 'content'),
+    Property: ('name', 'value'),
+    DisjunctiveLicense: ('acknowledgement', 'bom_ref', 'id', 'name', 'properties', 'text', 'url'),
+    LicenseExpression: ('acknowledgement', 'bom_ref', 'value'),
+    Dependency: ('dependencies', 'ref'),
+}
+
+
+@lru_cache(maxsize=None)
+def has_expected_layout() -> bool:
+    """Whether the installed cyclonedx model serializes exactly the fields this writer knows about."""
+    mappings = py_serializable.ObjectMetadataLibrary.klass_property_mappings
+    for klass, expected in _LAYOUT.items():
+        properties = mappings.get(f'{klass.__module__}.{klass.__qualname__}', {})
+        if tuple(name for name, p in properties.items() if not p.views or _VIEW in p.views) != expected:
+            return False
+    return True
+
+
+def _all_components(bom: Bom) -> List[Component]:
+    # the order of Bom._get_all_components, without hashing the components that have no nested components
+    roots = chain([bom.metadata.component] if bom.metadata.component is not None else [], bom.components)
+    return [nested for c in roots for nested in (c.get_all_nested_components(include_self=True) if c.components else [c])]
+
+
+def _register_dependencies(bom: Bom) -> None:
+    # every component and service has a dependency entry, as after Bom.validate, but found in a set
+    registered = {d.ref for d in bom.dependencies}
+    missing = []
+    roots = chain([bom.metadata.component] if bom.metadata.component is not None else [], bom.components, bom.services)
+    for target in roots:
+        if target.bom_ref not in registered:
+            registered.add(target.bom_ref)
+            missing.append(Dependency(ref=target.bom_ref))
+    if missing:
+        bom.dependencies.update(missing)
+
+
+def _validate(bom: Bom, components: List[Component]) -> None:
+    # the checks of Bom.validate, with the same exceptions and warning
+    known = {c.bom_ref for c in components} | {s.bom_ref for s in bom.services}
+    referenced = {ref for d in bom.dependencies for ref in chain([d.ref], (t.ref for t in d.dependencies))}
+    unknown = referenced - known
+    if unknown:
+        raise UnknownComponentDependencyException(
+            'One or more Components have Dependency references to Components/Services that are not known in this '
+            f'BOM. They are: {unknown}')
+
+    root = bom.metadata.component
+    if root is not None and len(bom.components) > 0 and \
+            not any(d.ref == root.bom_ref and len(d.dependencies) > 0 for d in bom.dependencies):
+        warn(f'The Component this BOM is describing {root.purl} has no defined dependencies '
+             'which means the Dependency Graph is incomplete - you should add direct dependencies to this '
+             '"root" Component to complete the Dependency Graph data.',
+             category=UserWarning, stacklevel=1)
+
+    elem: Union[BomMetaData, Component, Service]
+    for elem in chain([bom.metadata], components, bom.services):  # type: ignore[assignment]
+        if len(elem.licenses) > 1 and any(isinstance(li, LicenseExpression) for li in elem.licenses):
+            raise LicenseExpressionAlongWithOthersException(
+                f'Found LicenseExpression along with others licenses in: {elem!r}')
+
+
+class _Discriminator(BomRefDiscriminator):
+    """``BomRefDiscriminator`` that remembers the values seen in a set instead of a list."""
+
+    def discriminate(self) -> None:
+        known: Set[str] = set()
+        for bomref, _ in self._bomrefs:
+            value = bomref.value
+            if value is None or value in known:
+                value = self._make_unique()
+                bomref.value = value
+            known.add(value)
+
+
+def _bom_refs(bom: Bom, components: List[Component]) -> List[BomRef]:
+    return list(chain((c.bom_ref for c in components), (s.bom_ref for s in bom.services),
+                      (v.bom_ref for v in bom.vulnerabilities)))
+
+
+def _unique(refs: List[BomRef]) -> bool:
+    values = [ref.value for ref in refs]
+    return None not in values and len(set(values)) == len(values)
+
+
+def prepare(bom: Bom) -> None:
+    """
+    Adds the missing dependency entries and assigns generated bom-refs to the components that have none or a
+    duplicate one, for good. ``to_json`` then only reads the BOM, e.g. a snapshot shared between threads.
+    """
+    _register_dependencies(bom)
+    _Discriminator(_bom_refs(bom, _all_components(bom))).discriminate()
+
+
+class _Projector:
+    """Writes the components and dependencies of a BOM without the parts that a projection leaves out."""
+
+    def __init__(self, projection: Projection) -> None:
+        self.projection = projection
+        self.excluded: Set[str] = set()
+        self.component_fields: Fields = tuple(
+            (key, self.nested if key == 'components' else get) for key, get in _COMPONENT_FIELDS
+            if key not in projection.component_fields)
+
+    def components(self, components: Iterable[Component]) -> Optional[List[Any]]:
+        entries = []
+        for c in components:
+            if includes(self.projection, c):
+                entries.append(self.component(c))
+            else:
+                self.excluded.update(ref for ref in (n.bom_ref.value for n in c.get_all_nested_components(True)) if ref)
+        return entries or None
+
+    def nested(self, c: Component) -> Optional[List[Any]]:
+        return self.components(c.components)
+
+    def component(self, c: Component) -> Any:
+        if not _has_generic_fields(c):
+            return project_fields(_fields(c, self.component_fields), self.projection)
+        entry = _generic(c)
+        if 'components' in entry:
+            nested = self.nested(c)
+            if nested is None:
+                del entry['components']
+            else:
+                entry['components'] = nested
+        return project_fields(entry, self.projection)
+
+    def metadata(self, b: Bom) -> Any:
+        metadata = _object(b.metadata)
+        if 'component' in metadata:
+            project_fields(metadata['component'], self.projection)
+        return metadata
+
+    def dependencies(self, b: Bom) -> Optional[List[Any]]:
+        # the components are written first, so the left out ones are known here
+        entries = _dependencies(b)
+        if entries is None or not self.excluded:
+            return entries
+        return project_dependencies(entries, self.excluded) or None
+
+    def bom_fields(self) -> Fields:
+        replaced: Dict[str, Callable[[Bom], Any]] = {
+            'components': lambda b: self.components(b.components),
+            'dependencies': self.dependencies,
+            'metadata': self.metadata,
+        }
+        return tuple((key, replaced.get(key, get)) for key, get in _BOM_FIELDS
+                     if key not in self.projection.document_fields)
+
+
+def _to_json_generic(bom: Bom, indent: Optional[int], projection: Optional[Projection]) -> str:
+    if projection is None:
+        return JsonV1Dot6(bom=bom).output_as_string(indent=indent)
+    # the output of the generic writer is filtered; with unique bom-refs, its entries are matched to the components
+    _register_dependencies(bom)
+    components = _all_components(bom)
+    refs = _bom_refs(bom, components)
+    with nullcontext() if _unique(refs) else _Discriminator(refs):
+        data = json.loads(JsonV1Dot6(bom=bom).output_as_string())
+        project(data, {c.bom_ref.value: c for c in components if c.bom_ref.value}, projection)
+    return json.dumps(data, indent=indent)
+
+
+def to_json(bom: Bom, indent: Optional[int] = None, projection: Optional[Projection] = None) -> str:
+    """
+    Serializes the BOM to CycloneDX 1.6 JSON, byte for byte as ``JsonV1Dot6(bom).output_as_string(indent)``.
+
+    Like ``JsonV1Dot6``, it adds the missing dependency entries of the components to the BOM and temporarily
+    assigns generated bom-refs to the components that have none or a duplicate one; a BOM without either, e.g.
+    after ``prepare``, is not changed. A ``projection`` leaves components and fields out while the document is
+    written, see ``siemens_standard_bom.projection``.
+    """
+    if not has_expected_layout():
+        return _to_json_generic(bom, indent, projection)
+
+    _register_dependencies(bom)
+    components = _all_components(bom)
+    _validate(bom, components)
+    refs = _bom_refs(bom, components)
+    fields = _Projector(projection).bom_fields() if projection is not None else _BOM_FIELDS
+    with nullcontext() if _unique(refs) else _Discriminator(refs):
+        data = _fields(bom, fields)
+    data.update({'$schema': SCHEMA_URI, 'bomFormat': 'CycloneDX', 'specVersion': SchemaVersion.V1_6.to_version()})
+    return json.dumps(data, indent=indent)
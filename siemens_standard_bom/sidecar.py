@@ -0,0 +1,137 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Sidecar index with the byte offsets of the components of a saved Standard BOM file.
+
+The index is a JSON file next to the SBOM, named ``<file>.index.json``. It records the size, the modification time
+and the SHA-256 digest of the SBOM file it was built for, and the byte range of every top-level component keyed by
+its bom-ref and its purl, so that single components can be read without decoding the whole document.
+"""
+import hashlib
+import json
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = '.index.json'
+
+_WHITESPACE = ' \t\n\r'
+_decoder = json.JSONDecoder()
+
+# files whose digest matched their index although the modification time did not, by path, size and time
+_verified: Dict[Tuple[Path, int, int], str] = {}
+
+
+def index_filename(filename: str | Path) -> Path:
+    path = Path(filename)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def _skip(text: str, pos: int, expected: str = '') -> int:
+    while text[pos] in _WHITESPACE:
+        pos += 1
+    if expected:
+        if text[pos] != expected:
+            raise ValueError(f"Expected '{expected}' at position {pos}")
+        pos += 1
+    return pos
+
+
+def _top_level_components(text: str) -> Iterator[Tuple[Dict[str, Any], int, int]]:
+    # walks the members of the document object and decodes only the elements of the components array
+    pos = _skip(text, 0, '{')
+    while text[_skip(text, pos)] != '}':
+        key, pos = scanstring(text, _skip(text, pos, '"'))
+        pos = _skip(text, pos, ':')
+        pos = _skip(text, pos)
+        if key != 'components':
+            _, pos = _decoder.raw_decode(text, pos)
+        else:
+            pos = _skip(text, pos, '[')
+            while text[_skip(text, pos)] != ']':
+                start = _skip(text, pos)
+                component, pos = _decoder.raw_decode(text, start)
+                yield component, start, pos
+                pos = _skip(text, pos)
+                if text[pos] == ',':
+                    pos += 1
+            pos = _skip(text, pos, ']')
+        pos = _skip(text, pos)
+        if text[pos] == ',':
+            pos += 1
+
+
+def build_index(text: str, data: bytes, mtime_ns: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Builds the index for a serialized SBOM, given as text and as the UTF-8 bytes written to the file, and the
+    modification time of the file in nanoseconds.
+    """
+    components: Dict[str, List[int]] = {}
+    chars = 0
+    offset = 0
+    for component, start, end in _top_level_components(text):
+        # offsets into the text are converted to byte offsets incrementally, as the text may contain non-ASCII
+        offset += len(text[chars:start].encode('utf-8'))
+        length = len(text[start:end].encode('utf-8'))
+        chars = end
+        for key in (component.get('purl'), component.get('bom-ref')):
+            if key is not None:
+                components[key] = [offset, length]
+        offset += length
+    return {
+        'version': INDEX_VERSION,
+        'size': len(data),
+        'mtime_ns': mtime_ns,
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'components': components,
+    }
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        while chunk := file.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _matches(path: Path, index: Dict[str, Any]) -> bool:
+    # the whole file is only hashed if its modification time differs from the index, e.g. after copying it
+    stat = path.stat()
+    if stat.st_size != index['size']:
+        return False
+    if stat.st_mtime_ns == index.get('mtime_ns'):
+        return True
+    key = (path.resolve(), stat.st_size, stat.st_mtime_ns)
+    if _verified.get(key) != index['sha256']:
+        if _file_digest(path) != index['sha256']:
+            return False
+        _verified[key] = index['sha256']
+    return True
+
+
+def read_slice(filename: str | Path, key: str) -> Optional[bytes]:
+    """
+    Reads the JSON of the component with the given bom-ref or purl from an SBOM file using its sidecar index.
+
+    Returns ``None`` if the index has no such component. Raises ``ValueError`` if the index does not belong to
+    the current content of the file: a file with the size and modification time recorded in the index is taken as
+    unchanged; otherwise its digest is compared once per size and modification time.
+    """
+    path = Path(filename)
+    index = json.loads(index_filename(path).read_bytes())
+    if index.get('version') != INDEX_VERSION:
+        raise ValueError(f"Unsupported index version: {index.get('version')}")
+    if not _matches(path, index):
+        raise ValueError(f"The index {index_filename(path)} is outdated, the file {path} was changed")
+
+    entry = index['components'].get(key)
+    if entry is None:
+        return None
+    offset, length = entry
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        return file.read(length)
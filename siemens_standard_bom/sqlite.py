@@ -0,0 +1,347 @@
+#
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+#
+"""
+Normalized SQLite storage of Standard BOMs, so that questions over many SBOMs can be answered with SQL, e.g.::
+
+    SELECT s.name, s.component_version, c.version
+    FROM component c JOIN sbom s ON s.id = c.sbom_id
+    WHERE c.group_name = 'org.apache.logging.log4j' AND c.name = 'log4j-core'
+
+Components, their properties, licenses, hashes, authors and external references, and the dependencies are stored
+in their own tables. Component fields that have no column, e.g. a pedigree, are rare in Standard BOMs; such
+components additionally keep their complete CycloneDX JSON in ``component.data``. The remaining document parts
+are stored as JSON in ``sbom.data``.
+"""
+import json
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cyclonedx.model import ExternalReference, HashType
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.contact import OrganizationalEntity
+from cyclonedx.model.license import DisjunctiveLicense, License, LicenseExpression
+from cyclonedx.schema.schema import SchemaVersion1Dot6
+
+from siemens_standard_bom.model import StandardBom, _enum_value
+from siemens_standard_bom.purl import purl_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sbom (
+    id INTEGER PRIMARY KEY,
+    serial_number TEXT,
+    version INTEGER,
+    timestamp TEXT,
+    profile TEXT,
+    name TEXT,
+    component_version TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS component (
+    id INTEGER PRIMARY KEY,
+    sbom_id INTEGER NOT NULL REFERENCES sbom(id) ON DELETE CASCADE,
+    bom_ref TEXT,
+    type TEXT,
+    group_name TEXT,
+    name TEXT NOT NULL,
+    version TEXT,
+    purl TEXT,
+    scope TEXT,
+    description TEXT,
+    copyright TEXT,
+    cpe TEXT,
+    supplier TEXT,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS author (
+    component_id INTEGER NOT NULL REFERENCES component(id) ON DELETE CASCADE,
+    name TEXT,
+    email TEXT,
+    phone TEXT
+);
+CREATE TABLE IF NOT EXISTS property (
+    component_id INTEGER NOT NULL REFERENCES component(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS license (
+    component_id INTEGER NOT NULL REFERENCES component(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS external_reference (
+    id INTEGER PRIMARY KEY,
+    component_id INTEGER NOT NULL REFERENCES component(id) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    url TEXT NOT NULL,
+    comment TEXT
+);
+CREATE TABLE IF NOT EXISTS hash (
+    component_id INTEGER NOT NULL REFERENCES component(id) ON DELETE CASCADE,
+    reference_id INTEGER REFERENCES external_reference(id) ON DELETE CASCADE,
+    algorithm TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dependency (
+    sbom_id INTEGER NOT NULL REFERENCES sbom(id) ON DELETE CASCADE,
+    ref TEXT NOT NULL,
+    depends_on TEXT
+);
+CREATE INDEX IF NOT EXISTS component_purl ON component(purl);
+CREATE INDEX IF NOT EXISTS component_name_version ON component(name, version);
+CREATE INDEX IF NOT EXISTS component_sbom ON component(sbom_id);
+CREATE INDEX IF NOT EXISTS author_component ON author(component_id);
+CREATE INDEX IF NOT EXISTS property_component ON property(component_id);
+CREATE INDEX IF NOT EXISTS license_component ON license(component_id);
+CREATE INDEX IF NOT EXISTS external_reference_component ON external_reference(component_id);
+CREATE INDEX IF NOT EXISTS hash_component ON hash(component_id);
+CREATE INDEX IF NOT EXISTS dependency_sbom ON dependency(sbom_id);
+"""
+
+_SCHEMA_STATEMENTS = tuple(statement.strip() for statement in SCHEMA.split(';') if statement.strip())
+
+# fields of the model without a column; components using them keep their complete JSON
+_UNCOVERED_COMPONENT_FIELDS = ('author', 'components', 'crypto_properties', 'evidence', 'is_external',
+                               'manufacturer', 'mime_type', 'modified', 'omnibor_ids', 'pedigree', 'publisher',
+                               'release_notes', 'swhids', 'swid', 'tags')
+_UNCOVERED_FIELDS = {
+    OrganizationalEntity: ('address', 'contacts', 'urls'),
+    DisjunctiveLicense: ('acknowledgement', 'text', 'properties'),
+    LicenseExpression: ('acknowledgement',),
+    ExternalReference: ('properties',),
+}
+
+# document parts stored as JSON in sbom.data, by their JSON name
+_DOCUMENT_COLLECTIONS = (('externalReferences', 'external_references'), ('properties', 'properties'),
+                         ('services', 'services'), ('vulnerabilities', 'vulnerabilities'))
+
+_Rows = Dict[str, List[Tuple[Any, ...]]]
+
+
+def _as_data(obj: Any) -> Any:
+    return json.loads(obj.as_json(view_=SchemaVersion1Dot6))
+
+
+def _has_columns(obj: Any) -> bool:
+    if getattr(obj, 'bom_ref', None):
+        return False
+    return not any(getattr(obj, field, None) for field in _UNCOVERED_FIELDS.get(type(obj), ()))
+
+
+def _fits_columns(component: Component) -> bool:
+    if any(getattr(component, field) for field in _UNCOVERED_COMPONENT_FIELDS):
+        return False
+    parts: List[Any] = [*component.licenses, *component.external_references, *component.authors]
+    if component.supplier is not None:
+        parts.append(component.supplier)
+    return all(map(_has_columns, parts))
+
+
+def _license_row(component_id: int, lic: License) -> Tuple[Any, ...]:
+    if isinstance(lic, DisjunctiveLicense):
+        url = str(lic.url) if lic.url is not None else None
+        return (component_id, 'id', lic.id, url) if lic.id is not None else (component_id, 'name', lic.name, url)
+    return component_id, 'expression', lic.value, None
+
+
+def _hash_rows(component_id: int, reference_id: Optional[int], hashes: Iterable[HashType]) -> List[Tuple[Any, ...]]:
+    return [(component_id, reference_id, h.alg.value, h.content) for h in hashes]
+
+
+def _add_component(rows: _Rows, component_id: int, reference_id: int, sbom_id: int, component: Component) -> int:
+    supplier = component.supplier.name if component.supplier is not None else None
+    rows['component'].append((
+        component_id, sbom_id, component.bom_ref.value, _enum_value(component.type), component.group,
+        component.name, component.version, purl_key(component.purl) if component.purl is not None else None,
+        _enum_value(component.scope), component.description, component.copyright, component.cpe, supplier,
+        None if _fits_columns(component) else component.as_json(view_=SchemaVersion1Dot6),  # type: ignore[attr-defined]
+    ))
+    rows['author'].extend((component_id, a.name, a.email, a.phone) for a in component.authors)
+    rows['property'].extend((component_id, p.name, p.value) for p in component.properties)
+    rows['license'].extend(_license_row(component_id, lic) for lic in component.licenses)
+    rows['hash'].extend(_hash_rows(component_id, None, component.hashes))
+    for reference in component.external_references:
+        reference_id += 1
+        rows['external_reference'].append((reference_id, component_id, reference.type.value, str(reference.url),
+                                           reference.comment))
+        rows['hash'].extend(_hash_rows(component_id, reference_id, reference.hashes))
+    return reference_id
+
+
+def _document_data(bom: Bom) -> Dict[str, Any]:
+    data: Dict[str, Any] = {'metadata': _as_data(bom.metadata)}
+    for key, attribute in _DOCUMENT_COLLECTIONS:
+        items = getattr(bom, attribute)
+        if items:
+            data[key] = [_as_data(item) for item in items]
+    if bom.definitions is not None:
+        data['definitions'] = _as_data(bom.definitions)
+    return data
+
+
+def _next_id(conn: sqlite3.Connection, table: str) -> int:
+    row = conn.execute(f'SELECT COALESCE(MAX(id), 0) FROM {table}').fetchone()
+    return int(row[0])
+
+
+_INSERTS = {
+    'component': 'INSERT INTO component VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+    'author': 'INSERT INTO author VALUES (?, ?, ?, ?)',
+    'property': 'INSERT INTO property VALUES (?, ?, ?)',
+    'license': 'INSERT INTO license VALUES (?, ?, ?, ?)',
+    'external_reference': 'INSERT INTO external_reference VALUES (?, ?, ?, ?, ?)',
+    'hash': 'INSERT INTO hash VALUES (?, ?, ?, ?)',
+}
+
+
+@contextmanager
+def _savepoint(conn: sqlite3.Connection) -> Iterator[None]:
+    # unlike executescript and "with conn", a savepoint commits nothing but its own changes, and only if it is not
+    # nested into a transaction of the caller
+    conn.execute('SAVEPOINT to_sqlite')
+    try:
+        yield
+    except BaseException:
+        conn.execute('ROLLBACK TO to_sqlite')
+        conn.execute('RELEASE to_sqlite')
+        raise
+    conn.execute('RELEASE to_sqlite')
+
+
+def to_sqlite(sbom: StandardBom, conn: sqlite3.Connection) -> int:
+    """
+    Stores the SBOM atomically and returns the id of its ``sbom`` row. Missing tables are created.
+
+    Without an open transaction, the rows are committed. If the caller has a transaction open, they become part of
+    it and are committed or rolled back with it.
+    """
+    bom = sbom.bom
+    component = bom.metadata.component
+    with _savepoint(conn):
+        for statement in _SCHEMA_STATEMENTS:
+            conn.execute(statement)
+        cursor = conn.execute(
+            'INSERT INTO sbom (serial_number, version, timestamp, profile, name, component_version, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (bom.serial_number.urn, bom.version, bom.metadata.timestamp.isoformat(), sbom.profile,
+             component.name if component is not None else None, component.version if component is not None else None,
+             json.dumps(_document_data(bom))))
+        sbom_id = cursor.lastrowid
+        if sbom_id is None:
+            raise sqlite3.DatabaseError('The sbom row was not inserted')
+
+        rows: _Rows = {table: [] for table in _INSERTS}
+        component_id = _next_id(conn, 'component')
+        reference_id = _next_id(conn, 'external_reference')
+        for component_id, c in enumerate(bom.components, start=component_id + 1):
+            reference_id = _add_component(rows, component_id, reference_id, sbom_id, c)
+        for table, statement in _INSERTS.items():
+            conn.executemany(statement, rows[table])
+
+        conn.executemany('INSERT INTO dependency VALUES (?, ?, ?)', _dependency_rows(sbom_id, bom))
+    return sbom_id
+
+
+def _dependency_rows(sbom_id: int, bom: Bom) -> Iterable[Tuple[Any, ...]]:
+    for dependency in bom.dependencies:
+        if dependency.ref.value is None:
+            continue
+        targets: List[Optional[str]] = [d.ref.value for d in dependency.dependencies if d.ref.value is not None]
+        # an entry without targets is kept as a single row without depends_on
+        for target in targets or [None]:
+            yield sbom_id, dependency.ref.value, target
+
+
+def _grouped(conn: sqlite3.Connection, statement: str, sbom_id: int) -> Dict[int, List[Tuple[Any, ...]]]:
+    groups: Dict[int, List[Tuple[Any, ...]]] = {}
+    for row in conn.execute(statement, (sbom_id,)):
+        groups.setdefault(row[0], []).append(row[1:])
+    return groups
+
+
+def _without_none(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in data.items() if value is not None and value != []}
+
+
+def _license_data(kind: str, value: str, url: Optional[str]) -> Dict[str, Any]:
+    if kind == 'expression':
+        return {'expression': value}
+    return {'license': _without_none({kind: value, 'url': url})}
+
+
+class _ComponentRows:
+    def __init__(self, conn: sqlite3.Connection, sbom_id: int) -> None:
+        def query(table: str, columns: str) -> Dict[int, List[Tuple[Any, ...]]]:
+            return _grouped(conn, f'SELECT t.component_id, {columns} FROM {table} t '
+                                  f'JOIN component c ON c.id = t.component_id WHERE c.sbom_id = ?', sbom_id)
+
+        self.authors = query('author', 't.name, t.email, t.phone')
+        self.properties = query('property', 't.name, t.value')
+        self.licenses = query('license', 't.kind, t.value, t.url')
+        self.references = query('external_reference', 't.id, t.type, t.url, t.comment')
+        self.hashes = query('hash', 't.reference_id, t.algorithm, t.content')
+
+    def hashes_of(self, component_id: int, reference_id: Optional[int]) -> List[Dict[str, Any]]:
+        return [{'alg': alg, 'content': content}
+                for ref, alg, content in self.hashes.get(component_id, ()) if ref == reference_id]
+
+    def component_data(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        component_id, bom_ref, type_, group, name, version, purl, scope, description, copyright_, cpe, supplier = row
+        return _without_none({
+            'type': type_, 'bom-ref': bom_ref, 'group': group, 'name': name, 'version': version, 'purl': purl,
+            'scope': scope, 'description': description, 'copyright': copyright_, 'cpe': cpe,
+            'supplier': {'name': supplier} if supplier is not None else None,
+            'authors': [_without_none({'name': n, 'email': e, 'phone': p})
+                        for n, e, p in self.authors.get(component_id, ())],
+            'licenses': [_license_data(*lic) for lic in self.licenses.get(component_id, ())],
+            'hashes': self.hashes_of(component_id, None),
+            'externalReferences': [
+                _without_none({'type': t, 'url': url, 'comment': comment,
+                               'hashes': self.hashes_of(component_id, reference_id)})
+                for reference_id, t, url, comment in self.references.get(component_id, ())],
+            'properties': [_without_none({'name': n, 'value': v}) for n, v in self.properties.get(component_id, ())],
+        })
+
+
+def _dependencies_data(conn: sqlite3.Connection, sbom_id: int) -> List[Dict[str, Any]]:
+    targets: Dict[str, List[str]] = {}
+    for ref, depends_on in conn.execute('SELECT ref, depends_on FROM dependency WHERE sbom_id = ?', (sbom_id,)):
+        refs = targets.setdefault(ref, [])
+        if depends_on is not None:
+            refs.append(depends_on)
+    return [_without_none({'ref': ref, 'dependsOn': refs}) for ref, refs in targets.items()]
+
+
+def from_sqlite(conn: sqlite3.Connection, sbom_id: int) -> StandardBom:
+    """
+    Loads the SBOM stored under the given id.
+    """
+    row = None
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sbom'").fetchone() is not None:
+        row = conn.execute('SELECT serial_number, version, data FROM sbom WHERE id = ?', (sbom_id,)).fetchone()
+    if row is None:
+        raise ValueError(f"No SBOM with id {sbom_id}")
+    serial_number, version, data = row
+
+    rows = _ComponentRows(conn, sbom_id)
+    components = []
+    for component_row in conn.execute('SELECT id, bom_ref, type, group_name, name, version, purl, scope, '
+                                      'description, copyright, cpe, supplier, data '
+                                      'FROM component WHERE sbom_id = ? ORDER BY id', (sbom_id,)):
+        complete = component_row[-1]
+        components.append(json.loads(complete) if complete is not None else rows.component_data(component_row[:-1]))
+
+    document = {
+        'bomFormat': 'CycloneDX',
+        'specVersion': '1.6',
+        'serialNumber': serial_number,
+        'version': version,
+        **json.loads(data),
+        'components': components,
+        'dependencies': _dependencies_data(conn, sbom_id),
+    }
+    return StandardBom(Bom.from_json(data=document))  # type: ignore[attr-defined]
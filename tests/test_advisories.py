@@ -0,0 +1,125 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Tuple
+
+from cyclonedx.model.component import Component
+from packageurl import PackageURL
+
+from siemens_standard_bom.advisories import AdvisoryIndex, AdvisoryMatch, version_key
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+LOG4J_CORE = "pkg:maven/org.apache.logging.log4j/log4j-core@2.17.1?type=jar"
+LOG4J_JUL = "pkg:maven/org.apache.logging.log4j/log4j-jul@2.17.1?type=jar"
+COMMONS_CODEC = "pkg:maven/commons-codec/commons-codec@1.15?type=jar"
+
+
+def _pairs(matches: List[AdvisoryMatch]) -> List[Tuple[str, str]]:
+    return sorted((str(m.component.purl), m.advisory.id) for m in matches)
+
+
+class VersionKeyTestCase(unittest.TestCase):
+    def test_ordering(self) -> None:
+        ordered = ["1.0-alpha1", "1.0-beta", "1.0-rc1", "1.0", "1.0-sp1", "1.0.1", "1.2", "1.10", "2.0-beta7", "2.0"]
+        self.assertEqual(ordered, sorted(reversed(ordered), key=version_key))
+
+    def test_equal_versions(self) -> None:
+        self.assertEqual(version_key("1.0"), version_key("1.0.0"))
+        self.assertEqual(version_key("v1.2.3"), version_key("1.2.3+build.5"))
+        self.assertEqual(version_key("5.3.20.RELEASE"), version_key("5.3.20"))
+
+
+class AdvisoryIndexTestCase(unittest.TestCase):
+    index: AdvisoryIndex
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.index = AdvisoryIndex.load("tests/advisories")
+
+    def test_load_skips_withdrawn(self) -> None:
+        self.assertEqual(5, self.index.count)
+        self.assertEqual([], self.index.advisories_for(PackageURL.from_string(
+            "pkg:maven/org.apache.logging.log4j/log4j-api@2.17.1")))
+
+    def test_ranges(self) -> None:
+        def ids(purl: str) -> List[str]:
+            return sorted(a.id for a in self.index.advisories_for(PackageURL.from_string(purl)))
+
+        self.assertEqual(["TEST-2021-0001", "TEST-2022-0002"], ids("pkg:maven/org.apache.logging.log4j/log4j-core@2.15.0"))
+        self.assertEqual(["TEST-2021-0001", "TEST-2022-0002"], ids("pkg:maven/org.apache.logging.log4j/log4j-core@2.0-rc1"))
+        self.assertEqual(["TEST-2022-0002"], ids("pkg:maven/org.apache.logging.log4j/log4j-core@2.3.2"))
+        self.assertEqual(["TEST-2022-0002"], ids("pkg:maven/org.apache.logging.log4j/log4j-core@2.0-beta6"))
+        self.assertEqual([], ids("pkg:maven/org.apache.logging.log4j/log4j-core@2.17.2"))
+        self.assertEqual([], ids("pkg:maven/org.apache.logging.log4j/log4j-jul@2.16.0"))
+        self.assertEqual(["TEST-2023-0006"], ids("pkg:pypi/zope-interface@4.7.1"))
+        self.assertEqual([], ids("pkg:pypi/zope-interface"))
+
+    def test_match(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        matches = self.index.match(sbom)
+        self.assertEqual([(COMMONS_CODEC, "TEST-2020-0003"), (LOG4J_CORE, "TEST-2022-0002"),
+                          (LOG4J_JUL, "TEST-2022-0002")], _pairs(matches))
+        self.assertEqual(0, len(sbom.vulnerabilities))
+
+        matches = self.index.match(StandardBomParser.parse("tests/v3/multiple-dependencies.cdx.json"))
+        self.assertEqual([("pkg:nuget/dummy1@5.0.12", "TEST-2021-0005")], _pairs(matches))
+
+    def test_annotate(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        self.index.match(sbom, annotate=True)
+        self.index.match(sbom, annotate=True)
+
+        vulnerabilities = {v.id: v for v in sbom.vulnerabilities}
+        self.assertEqual(["TEST-2020-0003", "TEST-2022-0002"], sorted(vulnerabilities))
+        self.assertEqual([LOG4J_CORE, LOG4J_JUL], sorted(t.ref for t in vulnerabilities["TEST-2022-0002"].affects))
+        codec = vulnerabilities["TEST-2020-0003"]
+        self.assertEqual("Information disclosure in commons-codec", codec.description)
+        self.assertEqual(["CVE-2020-0003", "GHSA-test-0003"], sorted(r.id or '' for r in codec.references))
+
+        serialized = StandardBomParser.serialize(sbom)
+        self.assertIn("TEST-2022-0002", serialized)
+
+    def test_malformed_purl_is_skipped(self) -> None:
+        advisory = {"id": "TEST-2024-0007", "affected": [
+            {"package": {"purl": "not a purl"}, "versions": ["1.0"]},
+            {"package": {"purl": "pkg:npm/left-pad"}, "versions": ["1.0"]}]}
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, "bad.json").write_text(json.dumps(advisory))
+            Path(directory, "good.json").write_text(json.dumps({"id": "TEST-2024-0008", "affected": [
+                {"package": {"ecosystem": "npm", "name": "right-pad"}, "versions": ["1.0"]}]}))
+            with self.assertLogs("siemens_standard_bom.advisories", "WARNING"):
+                index = AdvisoryIndex.load(directory)
+
+        self.assertEqual(2, index.count)
+        self.assertEqual(["TEST-2024-0007"], list(index.errors))
+        self.assertEqual(["TEST-2024-0007"],
+                         [a.id for a in index.advisories_for(PackageURL.from_string("pkg:npm/left-pad@1.0"))])
+        self.assertEqual(["TEST-2024-0008"],
+                         [a.id for a in index.advisories_for(PackageURL.from_string("pkg:npm/right-pad@1.0"))])
+
+    def test_annotate_skips_components_without_bom_ref(self) -> None:
+        sbom = StandardBom()
+        sbom.add_component(Component(name="log4j-core", bom_ref="log4j", purl=PackageURL.from_string(LOG4J_CORE)))
+        sbom.add_component(Component(name="log4j-jul", purl=PackageURL.from_string(LOG4J_JUL)))
+        self.assertEqual(2, len(self.index.match(sbom, annotate=True)))
+        [vulnerability] = sbom.vulnerabilities
+        self.assertEqual(["log4j"], [t.ref for t in vulnerability.affects])
+
+        sbom = StandardBom()
+        sbom.add_component(Component(name="commons-codec", purl=PackageURL.from_string(COMMONS_CODEC)))
+        self.assertEqual(1, len(self.index.match(sbom, annotate=True)))
+        self.assertEqual(0, len(sbom.vulnerabilities))
+
+    def test_frozen_sbom_is_not_annotated(self) -> None:
+        frozen = StandardBomParser.parse("tests/v3/full-valid.cdx.json").freeze()
+        self.assertEqual(3, len(self.index.match(frozen)))
+        with self.assertRaises(AttributeError):
+            self.index.match(frozen, annotate=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+from typing import Any, List
+
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+def _is_sorted(items: List[Any]) -> bool:
+    return all(a < b for a, b in zip(items, items[1:]))
+
+
+class BatchTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+
+    def test_renames_keep_components_sorted(self) -> None:
+        with self.sbom.batch():
+            for position, component in enumerate(self.sbom.components):
+                component.name = f"renamed-{100 - position:03d}"
+
+        components = list(self.sbom.bom.components)
+        self.assertTrue(_is_sorted(components))
+        for changed in components:
+            self.assertIn(changed, self.sbom.bom.components)
+
+    def test_property_edits_keep_properties_sorted(self) -> None:
+        with self.sbom.batch():
+            for component in self.sbom.components:
+                component.primary_language = "Zig"
+                component.direct_dependency = "true"
+
+        for changed in self.sbom.bom.components:
+            properties = list(changed.properties)
+            self.assertTrue(_is_sorted(properties))
+            for prop in properties:
+                self.assertIn(prop, changed.properties)
+
+    def test_wrappers_obtained_before_the_batch(self) -> None:
+        wrappers = self.sbom.components
+        with self.sbom.batch():
+            wrappers[0].internal = False
+            wrappers[1].name = "zzz"
+
+        components = list(self.sbom.bom.components)
+        self.assertTrue(_is_sorted(components))
+        for changed in (wrappers[0].component, wrappers[1].component):
+            self.assertIn(changed, self.sbom.bom.components)
+            self.assertTrue(_is_sorted(list(changed.properties)))
+
+    def test_changes_are_applied(self) -> None:
+        with self.sbom.batch() as sbom:
+            sbom.components[0].version = "9.9.9"
+            sbom.add_component(Component(name="added", bom_ref="added"))
+        self.assertIn("9.9.9", [c.version for c in self.sbom.components])
+        self.assertIn("added", [c.name for c in self.sbom.components])
+
+    def test_nested_batches_join(self) -> None:
+        with self.sbom.batch():
+            with self.sbom.batch():
+                self.sbom.components[0].name = "zzz"
+            self.assertIsNotNone(self.sbom._batch)
+        self.assertIsNone(self.sbom._batch)
+        self.assertTrue(_is_sorted(list(self.sbom.bom.components)))
+
+    def test_batch_on_clone_copies_shared_components(self) -> None:
+        clone = self.sbom.clone()
+        names = [c.name for c in self.sbom.components]
+        with clone.batch():
+            for component in clone.components:
+                component.name = f"clone-{component.name}"
+
+        self.assertEqual(names, [c.name for c in self.sbom.components])
+        self.assertEqual(sorted(f"clone-{n}" for n in names), sorted(c.name for c in clone.components))
+        self.assertTrue(_is_sorted(list(clone.bom.components)))
+
+    def test_batch_on_new_sbom(self) -> None:
+        sbom = StandardBom()
+        for name in ("c", "a", "b"):
+            sbom.add_component(Component(name=name, bom_ref=name))
+        with sbom.batch():
+            for component in sbom.components:
+                component.name = {"a": "z", "b": "y", "c": "x"}[component.name]
+        self.assertEqual(["x", "y", "z"], [c.name for c in sbom.components])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.generator import generate_document, write_document
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class BenchmarkGeneratorTestCase(unittest.TestCase):
+    def test_generator_is_deterministic(self) -> None:
+        self.assertEqual(generate_document(20, seed=7), generate_document(20, seed=7))
+        self.assertNotEqual(generate_document(20, seed=7), generate_document(20, seed=8))
+
+    def test_generated_document_is_a_standard_bom(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = write_document(Path(tmp) / "generated.cdx.json", 25)
+            sbom = StandardBomParser.parse(str(filename))
+
+        self.assertEqual(25, len(sbom.components))
+        self.assertEqual("clearing", sbom.profile)
+        self.assertEqual(26, len(sbom.bom.dependencies))
+        for component in sbom.components:
+            self.assertIsNotNone(component.purl)
+            self.assertIsNotNone(component.sha256)
+            self.assertIsNotNone(component.primary_language)
+            self.assertEqual(1, len(component.local_sources))
+            self.assertEqual(1, len(component.remote_sources))
+            self.assertEqual(1, len(component.licenses))
+
+
+if __name__ == '__main__':
+    unittest.main()
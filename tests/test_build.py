@@ -0,0 +1,116 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import copy
+import random
+import unittest
+from typing import Any, List
+
+from cyclonedx.model.component import Component, ComponentType
+from packageurl import PackageURL
+from sortedcontainers import SortedSet
+
+from siemens_standard_bom.model import StandardBom, _fill_sorted_set
+from siemens_standard_bom.parser import StandardBomParser
+
+
+def _components(count: int) -> List[Component]:
+    components = []
+    for i in range(count):
+        components.append(Component(name=f"lib-{i % 7}", version=f"1.{i}", bom_ref=f"ref-{i}",
+                                    group=None if i % 3 else "org.example",
+                                    type=ComponentType.FILE if i % 5 == 0 else ComponentType.LIBRARY,
+                                    purl=PackageURL("maven", "org.example", f"lib-{i % 7}", f"1.{i}") if i % 2 else None))
+    # equal to components above, so that they are dropped as with single inserts
+    components.extend(copy.deepcopy(components[:5]))
+    random.Random(7).shuffle(components)
+    return components
+
+
+class BuildTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+
+    def assert_same_as_single_inserts(self, components: List[Component]) -> None:
+        expected = copy.deepcopy(self.sbom)
+        for component in components:
+            expected.add_component(component)
+        with self.sbom.build():
+            for component in components:
+                self.sbom.add_component(component)
+
+        self.assertEqual(list(expected.bom.components), list(self.sbom.bom.components))
+        # of equal components, the same one is kept
+        added = {id(c) for c in components}
+        self.assertEqual([id(c) in added and id(c) for c in expected.bom.components],
+                         [id(c) in added and id(c) for c in self.sbom.bom.components])
+        for component in self.sbom.bom.components:
+            self.assertIn(component, self.sbom.bom.components)
+
+    def test_order_is_the_same_as_with_single_inserts(self) -> None:
+        self.assert_same_as_single_inserts(_components(200))
+
+    def test_filled_set_has_the_layout_of_sorted_containers(self) -> None:
+        # _fill_sorted_set writes the internals of sortedcontainers, whose version is pinned for that reason
+        for count in (0, 1, 999, 1000, 2500):
+            expected: Any = SortedSet(range(count))
+            filled: Any = SortedSet([-1])
+            _fill_sorted_set(filled, list(range(count)))
+
+            self.assertEqual(vars(expected._list), vars(filled._list))
+            self.assertEqual(expected._set, filled._set)
+            self.assertEqual(list(range(count)), [filled[i] for i in range(count)])
+            filled.add(count)
+            filled.discard(0)
+            self.assertEqual(list(range(1, count + 1)), list(filled))
+
+    def test_few_components_into_a_large_document(self) -> None:
+        with self.sbom.build():
+            for component in _components(200):
+                self.sbom.add_component(component)
+        self.assert_same_as_single_inserts(_components(3))
+
+    def test_components_are_visible_inside_the_build(self) -> None:
+        with self.sbom.build() as sbom:
+            sbom.add_component(Component(name="added", bom_ref="added"))
+            self.assertIn("added", [c.name for c in sbom.components])
+            self.assertIn('"added"', StandardBomParser.serialize(sbom))
+            sbom.add_component(Component(name="later", bom_ref="later"))
+        self.assertIn("later", [c.name for c in self.sbom.query()])
+
+    def test_setter_replaces_collected_components(self) -> None:
+        with self.sbom.build() as sbom:
+            sbom.add_component(Component(name="dropped", bom_ref="dropped"))
+            sbom.components = [Component(name="kept", bom_ref="kept")]
+        self.assertEqual(["kept"], [c.name for c in self.sbom.components])
+
+    def test_nested_builds_join(self) -> None:
+        with self.sbom.build():
+            with self.sbom.build():
+                self.sbom.add_component(Component(name="nested", bom_ref="nested"))
+            self.assertIsNotNone(self.sbom._build)
+        self.assertIsNone(self.sbom._build)
+        self.assertIn("nested", [c.name for c in self.sbom.components])
+
+    def test_components_are_merged_on_error(self) -> None:
+        with self.assertRaises(RuntimeError):
+            with self.sbom.build():
+                self.sbom.add_component(Component(name="added", bom_ref="added"))
+                raise RuntimeError()
+        self.assertIn("added", [c.name for c in self.sbom.components])
+
+    def test_build_on_new_sbom(self) -> None:
+        sbom = StandardBom()
+        with sbom.build():
+            for name in ("c", "a", "b"):
+                sbom.add_component(Component(name=name, bom_ref=name))
+        self.assertEqual(["a", "b", "c"], [c.name for c in sbom.components])
+
+    def test_frozen_sbom_is_read_only(self) -> None:
+        frozen = self.sbom.freeze()
+        with self.assertRaises(AttributeError):
+            with frozen.build():
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
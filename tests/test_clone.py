@@ -0,0 +1,179 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import gc
+import pickle
+import unittest
+from copy import deepcopy
+from typing import Any, List
+
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class CloneTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+
+    def test_clone_has_equal_content(self) -> None:
+        clone = self.sbom.clone()
+        self.assertEqual(self.sbom.fingerprint(), clone.fingerprint())
+        self.assertEqual(self.sbom.serial_number, clone.serial_number)
+
+    def test_clone_shares_components(self) -> None:
+        clone = self.sbom.clone()
+        for original, copy in zip(self.sbom.bom.components, clone.bom.components):
+            self.assertIs(original, copy)
+        self.assertIsNot(self.sbom.bom.metadata, clone.bom.metadata)
+        self.assertIsNot(self.sbom.bom.components, clone.bom.components)
+
+    def test_copied_sets_are_complete(self) -> None:
+        clone = self.sbom.clone()
+        copies: List[Any] = [clone.bom.components, clone.bom.dependencies]
+        for copied in copies:
+            self.assertFalse(copied.isdisjoint(copied))
+            self.assertTrue(copied.issubset(list(copied)))
+            self.assertTrue(copied.issuperset(list(copied)))
+            self.assertEqual(list(copied), [copied[i] for i in range(len(copied))])
+            for item in copied:
+                self.assertIn(item, copied)
+                self.assertEqual(item, copied[copied.index(item)])
+
+    def test_setter_on_clone_copies_component(self) -> None:
+        original = self.sbom.components[0]
+        before = original.legal_remark
+        clone = self.sbom.clone()
+
+        changed = clone.components[0]
+        changed.legal_remark = "changed"
+
+        self.assertEqual("changed", changed.legal_remark)
+        self.assertEqual(before, self.sbom.components[0].legal_remark)
+        self.assertIs(original.component, self.sbom.bom.components[0])
+        self.assertIsNot(changed.component, original.component)
+        self.assertEqual("changed", clone.components[0].legal_remark)
+
+    def test_setter_on_original_copies_component(self) -> None:
+        clone = self.sbom.clone()
+        self.sbom.components[0].copyright = "changed"
+        self.assertEqual("changed", self.sbom.components[0].copyright)
+        self.assertNotEqual("changed", clone.components[0].copyright)
+
+    def test_wrappers_of_one_component_share_the_copy(self) -> None:
+        clone = self.sbom.clone()
+        before = clone.components[0].copyright
+        first = self.sbom.components[0]
+        second = self.sbom.components[0]
+        first.description = "x"
+        second.copyright = "y"
+
+        self.assertIs(first.component, second.component)
+        self.assertEqual("x", self.sbom.components[0].description)
+        self.assertEqual("y", self.sbom.components[0].copyright)
+        self.assertEqual(before, clone.components[0].copyright)
+        self.assertEqual(len(clone.components), len(self.sbom.components))
+
+    def test_wrapper_obtained_before_clone_is_copied_on_write(self) -> None:
+        wrapper = self.sbom.components[0]
+        clone = self.sbom.clone()
+        wrapper.legal_remark = "changed"
+        self.assertNotEqual("changed", clone.components[0].legal_remark)
+        self.assertEqual("changed", self.sbom.components[0].legal_remark)
+
+    def test_dropped_clone_releases_components(self) -> None:
+        original = self.sbom.bom.components[0]
+        clone = self.sbom.clone()
+        del clone
+        gc.collect()
+        self.sbom.components[0].legal_remark = "changed"
+        self.assertIs(original, self.sbom.bom.components[0])
+
+    def test_source_change_on_clone_copies_component(self) -> None:
+        clone = self.sbom.clone()
+        position = next(i for i, c in enumerate(clone.components) if c.local_sources)
+        before = self.sbom.components[position].local_sources[0].sha256
+        source = clone.components[position].local_sources[0]
+        source.sha256 = "0" * 64
+
+        self.assertEqual("0" * 64, clone.components[position].local_sources[0].sha256)
+        self.assertEqual(before, self.sbom.components[position].local_sources[0].sha256)
+
+    def test_copied_component_keeps_dependencies(self) -> None:
+        clone = self.sbom.clone()
+        shared = clone.components[0].component
+        component = clone.components[0]
+        component.sha256 = "0" * 64
+
+        self.assertIs(shared.bom_ref, component.component.bom_ref)
+        self.assertIn(component.component.bom_ref, {d.ref for d in clone.bom.dependencies})
+        self.assertNotEqual(self.sbom.fingerprint(), clone.fingerprint())
+
+    def test_dependencies_are_copied(self) -> None:
+        clone = self.sbom.clone()
+        self.assertEqual(list(self.sbom.bom.dependencies), list(clone.bom.dependencies))
+        original = self.sbom.bom.dependencies[-1]
+        copied = clone.bom.dependencies[-1]
+        self.assertIsNot(original, copied)
+        self.assertIsNot(original.dependencies, copied.dependencies)
+
+        copied.dependencies.clear()
+        self.assertEqual(4, len(original.dependencies))
+
+    def test_add_component_affects_only_one_document(self) -> None:
+        clone = self.sbom.clone()
+        clone.add_component(Component(name="added", bom_ref="added"))
+        self.assertEqual(len(self.sbom.components) + 1, len(clone.components))
+
+    def test_query_results_are_copied_on_write(self) -> None:
+        clone = self.sbom.clone()
+        name = self.sbom.components[0].name
+        found = clone.query().where(name=name).first()
+        assert found is not None
+        found.legal_remark = "changed"
+        self.assertNotEqual("changed", self.sbom.components[0].legal_remark)
+
+    def test_clone_of_clone(self) -> None:
+        clone = self.sbom.clone()
+        second = clone.clone()
+        second.components[0].legal_remark = "second"
+        clone.components[0].legal_remark = "first"
+        self.assertNotIn(self.sbom.components[0].legal_remark, ("first", "second"))
+        self.assertEqual("first", clone.components[0].legal_remark)
+        self.assertEqual("second", second.components[0].legal_remark)
+
+    def test_pickle_round_trip(self) -> None:
+        with self.sbom.batch():
+            loaded = pickle.loads(pickle.dumps(self.sbom))
+        self.assertEqual(self.sbom.fingerprint(), loaded.fingerprint())
+        self.assertIs(loaded, loaded.components[0]._owner())
+        self.assertIsNone(loaded._batch)
+
+        wrapper = pickle.loads(pickle.dumps(self.sbom.components[0]))
+        self.assertEqual(self.sbom.components[0].name, wrapper.name)
+        self.assertIsNone(wrapper._owner)
+
+    def test_pickle_round_trip_of_clone_and_snapshot(self) -> None:
+        clone = self.sbom.clone()
+        self.assertEqual(self.sbom.fingerprint(), pickle.loads(pickle.dumps(clone)).fingerprint())
+        frozen = self.sbom.freeze()
+        loaded = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual([c.name for c in frozen.components], [c.name for c in loaded.components])
+        self.assertEqual(frozen.fingerprint(), loaded.clone().fingerprint())
+
+    def test_deepcopy_belongs_to_the_copy(self) -> None:
+        clone = self.sbom.clone()
+        copied = deepcopy(clone)
+        owner = copied.components[0]._owner
+        assert owner is not None
+        self.assertIs(copied, owner())
+        self.assertIsNone(copied._sharing)
+
+        name = clone.components[0].name
+        copied.components[0].name = "renamed"
+        self.assertEqual(name, clone.components[0].name)
+        self.assertEqual(name, self.sbom.components[0].name)
+        self.assertIn("renamed", [c.name for c in copied.components])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+from importlib.util import find_spec
+
+from cyclonedx.model.component import Component, ComponentScope
+from cyclonedx.model.license import LicenseExpression
+from packageurl import PackageURL
+
+from siemens_standard_bom.model import COLUMN_FIELDS, SbomComponent, StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class ColumnsTestCase(unittest.TestCase):
+    def test_empty_sbom(self) -> None:
+        columns = StandardBom().to_columns()
+        self.assertEqual(list(COLUMN_FIELDS), list(columns))
+        self.assertTrue(all(len(column) == 0 for column in columns.values()))
+
+    def test_selected_fields(self) -> None:
+        sbom = StandardBom()
+        component = SbomComponent(Component(name="foo", group="org.example", version="1.0"))
+        component.purl = PackageURL(type="maven", namespace="org.example", name="foo", version="1.0")
+        component.scope = ComponentScope.REQUIRED
+        component.licenses = [LicenseExpression(value="MIT OR Apache-2.0")]
+        component.direct_dependency = "true"
+        component.sha256 = "abc"
+        sbom.add_component(component)
+
+        columns = sbom.to_columns(fields=["name", "purl", "scope", "licenses", "direct", "internal", "sha256"])
+        self.assertEqual({
+            "name": ["foo"],
+            "purl": ["pkg:maven/org.example/foo@1.0"],
+            "scope": ["required"],
+            "licenses": [["MIT OR Apache-2.0"]],
+            "direct": [True],
+            "internal": [False],
+            "sha256": ["abc"],
+        }, columns)
+
+    def test_columns_match_component_getters(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        columns = sbom.to_columns()
+        components = sbom.components
+        for name, column in columns.items():
+            self.assertEqual(len(components), len(column), name)
+        self.assertEqual([c.name for c in components], columns["name"])
+        self.assertEqual([c.version for c in components], columns["version"])
+        self.assertEqual([c.direct_dependency for c in components], columns["direct"])
+        self.assertEqual([c.primary_language for c in components], columns["primary_language"])
+        self.assertEqual([c.md5 for c in components], columns["md5"])
+        self.assertEqual([c.sha512 for c in components], columns["sha512"])
+
+    def test_unknown_field(self) -> None:
+        with self.assertRaises(ValueError):
+            StandardBom().to_columns(fields=["name", "unknown"])
+
+    def test_unknown_array_library(self) -> None:
+        with self.assertRaises(ValueError):
+            StandardBom().to_columns(array_library="pandas")
+
+    @unittest.skipUnless(find_spec("numpy"), "numpy is not installed")
+    def test_numpy_arrays(self) -> None:
+        sbom = StandardBom()
+        sbom.add_component(Component(name="foo"))
+        columns = sbom.to_columns(fields=["name", "internal"], array_library="numpy")
+        self.assertEqual("foo", columns["name"][0])
+        self.assertEqual(bool, columns["internal"].dtype)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import os
+import shutil
+import tempfile
+import unittest
+from importlib.metadata import PackageNotFoundError
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom import corpus
+from siemens_standard_bom.corpus import CorpusHit, SbomCorpusIndex
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+LOG4J_CORE = "pkg:maven/org.apache.logging.log4j/log4j-core@2.17.1?type=jar"
+
+
+class SbomCorpusIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.root = self.tmp / "archive"
+        (self.root / "a" / "b").mkdir(parents=True)
+        shutil.copy("tests/v3/full-valid.cdx.json", self.root / "full.cdx.json")
+        shutil.copy("tests/v3/full-valid.cdx.json", self.root / "a" / "b" / "copy.cdx.json")
+        shutil.copy("tests/v3/multiple-dependencies.cdx.json", self.root / "a" / "deps.cdx.json")
+        (self.root / "a" / "notes.txt").write_text("not an SBOM")
+        self.index_file = self.tmp / "corpus.json"
+
+    def _index(self) -> SbomCorpusIndex:
+        return SbomCorpusIndex(self.root, self.index_file)
+
+    def _parsed_files(self, index: SbomCorpusIndex, workers: int = 1) -> List[str]:
+        calls: List[str] = []
+        original = corpus._index_file
+
+        def index_file(path: Path) -> object:
+            calls.append(path.relative_to(self.root).as_posix())
+            return original(path)
+
+        with mock.patch.object(corpus, "_index_file", index_file):
+            index.update(workers=workers)
+        return sorted(calls)
+
+    def test_find(self) -> None:
+        index = self._index()
+        update = index.update(workers=1)
+        self.assertEqual(["a/b/copy.cdx.json", "a/deps.cdx.json", "full.cdx.json"], update.parsed)
+        self.assertEqual(update.parsed, index.files)
+
+        self.assertEqual([CorpusHit("a/b/copy.cdx.json", LOG4J_CORE), CorpusHit("full.cdx.json", LOG4J_CORE)],
+                         index.find(purl=LOG4J_CORE))
+        self.assertEqual(["a/deps.cdx.json"], index.files_containing(coordinates=":dummy1:5.0.12"))
+        self.assertEqual(["a/b/copy.cdx.json", "full.cdx.json"],
+                         index.files_containing(coordinates="commons-codec:commons-codec:1.15",
+                                                license="Apache License, Version 2.0"))
+        self.assertEqual([], index.find(purl=LOG4J_CORE, coordinates=":dummy1:5.0.12"))
+        self.assertEqual([], index.find(purl="pkg:npm/unknown@1.0.0"))
+        # equivalent spellings of a purl are found by its canonical key
+        self.assertEqual(index.find(purl=LOG4J_CORE),
+                         index.find(purl="pkg:MAVEN/org.apache.logging.log4j/log4j-core@2.17.1?classifier=&type=jar"))
+        with self.assertRaises(ValueError):
+            index.find()
+
+    def test_process_pool(self) -> None:
+        index = self._index()
+        update = index.update(workers=2)
+        self.assertEqual(3, len(update.parsed))
+        self.assertEqual(["a/b/copy.cdx.json", "full.cdx.json"], index.files_containing(purl=LOG4J_CORE))
+
+    def test_only_changed_files_are_parsed_again(self) -> None:
+        self._index().update(workers=1)
+
+        index = self._index()
+        self.assertEqual(["a/b/copy.cdx.json", "full.cdx.json"], index.files_containing(purl=LOG4J_CORE))
+        self.assertEqual([], self._parsed_files(index))
+
+        # touched without a change of the content
+        stat = (self.root / "full.cdx.json").stat()
+        os.utime(self.root / "full.cdx.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual([], self._parsed_files(index))
+
+        shutil.copy("tests/v3/multiple-dependencies.cdx.json", self.root / "a" / "b" / "copy.cdx.json")
+        self.assertEqual(["a/b/copy.cdx.json"], self._parsed_files(index))
+        self.assertEqual(["full.cdx.json"], index.files_containing(purl=LOG4J_CORE))
+        self.assertEqual(["a/b/copy.cdx.json", "a/deps.cdx.json"],
+                         self._index().files_containing(purl="pkg:nuget/dummy1@5.0.12"))
+
+    def test_removed_files(self) -> None:
+        index = self._index()
+        index.update(workers=1)
+        (self.root / "full.cdx.json").unlink()
+        update = index.update(workers=1)
+        self.assertEqual(["full.cdx.json"], update.removed)
+        self.assertEqual(["a/b/copy.cdx.json"], index.files_containing(purl=LOG4J_CORE))
+
+    def test_broken_files(self) -> None:
+        (self.root / "broken.cdx.json").write_text("{")
+        index = self._index()
+        update = index.update(workers=1)
+        self.assertEqual(["broken.cdx.json"], list(update.failed))
+        self.assertEqual(update.failed, self._index().errors)
+        # retried by every update
+        self.assertEqual(["broken.cdx.json"], self._parsed_files(index))
+        self.assertEqual(["broken.cdx.json"], self._parsed_files(self._index()))
+
+        shutil.copy("tests/v3/full-valid.cdx.json", self.root / "broken.cdx.json")
+        self.assertEqual(["broken.cdx.json"], self._parsed_files(index))
+        self.assertEqual({}, index.errors)
+
+    def test_broken_structure(self) -> None:
+        (self.root / "list.cdx.json").write_text("[]")
+        (self.root / "type.cdx.json").write_text('{"bomFormat": "CycloneDX", "specVersion": "1.6", "components": 5}')
+        self.assertEqual(["list.cdx.json", "type.cdx.json"], sorted(self._index().update(workers=1).failed))
+
+    def test_environment_errors_are_raised(self) -> None:
+        index = self._index()
+        index.update(workers=1)
+        shutil.copy("tests/v3/multiple-dependencies.cdx.json", self.root / "full.cdx.json")
+        error = PackageNotFoundError("siemens-standard-bom")
+        with mock.patch.object(StandardBomParser, "parse", side_effect=error):
+            with self.assertRaises(PackageNotFoundError):
+                index.update(workers=1)
+        # neither recorded as a broken file nor removed from the index
+        self.assertEqual({}, index.errors)
+        self.assertEqual({}, self._index().errors)
+        self.assertEqual(["a/b/copy.cdx.json", "full.cdx.json"], index.files_containing(purl=LOG4J_CORE))
+        self.assertEqual(["full.cdx.json"], self._parsed_files(index))
+        self.assertEqual(["a/b/copy.cdx.json"], index.files_containing(purl=LOG4J_CORE))
+
+    def test_find_cpe(self) -> None:
+        sbom = StandardBom()
+        sbom.add_component(Component(name="log4j-core", version="2.14.1", bom_ref="log4j",
+                                     cpe="cpe:2.3:a:apache:log4j:2.14.1:*:*:*:*:*:*:*"))
+        sbom.add_component(Component(name="httpd", version="2.4.1", bom_ref="httpd", cpe="cpe:/a:apache:http_server:2.4.1"))
+        StandardBomParser.save(sbom, str(self.root / "cpes.cdx.json"))
+
+        index = self._index()
+        index.update(workers=1)
+        self.assertEqual([CorpusHit("cpes.cdx.json", "httpd"), CorpusHit("cpes.cdx.json", "log4j")],
+                         index.find(cpe="cpe:2.3:a:apache:*"))
+        self.assertEqual([CorpusHit("cpes.cdx.json", "log4j")],
+                         self._index().find(cpe="cpe:2.3:a:apache:log4j:2.1*", coordinates=":log4j-core:2.14.1"))
+        self.assertEqual([], index.find(cpe="cpe:2.3:a:apache:log4j:2.1*", license="MIT"))
+
+    def test_corrupt_index_file(self) -> None:
+        self.index_file.write_text("not json")
+        index = self._index()
+        self.assertEqual([], index.files)
+        self.assertEqual(3, len(index.update(workers=1).parsed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom.cpe import ANY, NA, Cpe, CpeIndex, cpe_matcher, parse_cpe
+from siemens_standard_bom.model import SbomComponent, StandardBom
+
+LOG4J = "cpe:2.3:a:apache:log4j:2.17.1:*:*:*:*:*:*:*"
+
+
+class ParseCpeTestCase(unittest.TestCase):
+    def test_formatted_string(self) -> None:
+        cpe = parse_cpe("cpe:2.3:a:Apache:log4j:2.17.1:-:*:*:*:*:*:*")
+        self.assertEqual(("a", "apache", "log4j", "2.17.1", NA, ANY), cpe[:6])
+        self.assertEqual("cpe:2.3:a:apache:log4j:2.17.1:-:*:*:*:*:*:*", str(cpe))
+
+    def test_escaped_separator(self) -> None:
+        cpe = parse_cpe(r"cpe:2.3:a:vendor:prod\:uct:1.0")
+        self.assertEqual(r"prod\:uct", cpe.product)
+        self.assertEqual("1.0", cpe.version)
+        self.assertEqual(ANY, cpe.other)
+
+    def test_uri(self) -> None:
+        cpe = parse_cpe("cpe:/a:apache:http_server:2.4.1%21:::en")
+        self.assertEqual(Cpe("a", "apache", "http_server", r"2.4.1\!", ANY, ANY, "en"), cpe)
+
+    def test_malformed(self) -> None:
+        for value in ("log4j", "cpe:2.3:a:x:y:1:2:3:4:5:6:7:8:9", "cpe:2.3:a::y"):
+            with self.subTest(value), self.assertRaises(ValueError):
+                parse_cpe(value)
+
+
+class CpeMatcherTestCase(unittest.TestCase):
+    def test_wildcards(self) -> None:
+        cpe = parse_cpe(LOG4J)
+        self.assertTrue(cpe_matcher("cpe:2.3:a:apache:log4j")(cpe))
+        self.assertTrue(cpe_matcher("cpe:2.3:a:apa*:log?j:2.17.*")(cpe))
+        self.assertTrue(cpe_matcher("cpe:2.3:*:*:*log4*")(cpe))
+        self.assertFalse(cpe_matcher("cpe:2.3:o:apache:log4j")(cpe))
+        self.assertFalse(cpe_matcher("cpe:2.3:a:apache:log4j:2.17.1:-")(parse_cpe(LOG4J.replace(":*:*:*:*:*:*:*", ":rc1"))))
+
+    def test_any_and_na_values(self) -> None:
+        self.assertTrue(cpe_matcher("cpe:2.3:a:apache:log4j:2.17.1")(parse_cpe("cpe:2.3:a:apache:log4j:*")))
+        self.assertTrue(cpe_matcher("cpe:2.3:a:apache:log4j:-")(parse_cpe("cpe:2.3:a:apache:log4j:-")))
+        self.assertFalse(cpe_matcher("cpe:2.3:a:apache:log4j:2*")(parse_cpe("cpe:2.3:a:apache:log4j:-")))
+
+
+class CpeIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = CpeIndex([
+            (LOG4J, "log4j"),
+            ("cpe:2.3:a:apache:log4j:2.14.0", "old log4j"),
+            ("cpe:2.3:a:apache:http_server:2.4.1", "httpd"),
+            ("cpe:2.3:a:apache_software_foundation:tomcat:9.0", "tomcat"),
+            ("cpe:2.3:a:openssl:openssl:*", "any openssl"),
+            ("cpe:2.3:o:linux:linux_kernel:5.10", "kernel"),
+            ("not a cpe", "skipped"),
+        ])
+
+    def test_size(self) -> None:
+        self.assertEqual(6, len(self.index))
+
+    def test_exact(self) -> None:
+        self.assertEqual(["log4j"], self.index.match(LOG4J))
+        self.assertEqual(["any openssl"], self.index.match("cpe:2.3:a:openssl:openssl:3.0.1"))
+
+    def test_prefix_and_wildcards(self) -> None:
+        self.assertEqual(["log4j", "old log4j", "httpd", "tomcat"], self.index.match("cpe:2.3:a:apache*"))
+        self.assertEqual(["log4j", "old log4j"], self.index.match("cpe:2.3:*:apache:log4j:2.1?.*"))
+        self.assertEqual(["httpd", "tomcat"], self.index.match("cpe:2.3:a:*:*t*:*"))
+        self.assertEqual(["kernel"], self.index.match("cpe:2.3:o"))
+        self.assertEqual([], self.index.match("cpe:2.3:a:microsoft*"))
+
+    def test_of_components(self) -> None:
+        sbom = StandardBom()
+        for name, cpe in (("log4j-core", LOG4J), ("nginx", "cpe:/a:nginx:nginx:1.20.0"), ("plain", None)):
+            sbom.add_component(Component(name=name, bom_ref=name, cpe=cpe))
+        index = CpeIndex.of_components(sbom.components)
+        self.assertEqual(2, len(index))
+        self.assertEqual(["nginx"], [c.name for c in index.match("cpe:2.3:a:nginx:nginx:1.*")])
+
+
+class ParsedCpeTestCase(unittest.TestCase):
+    def test_parsed_once_per_string(self) -> None:
+        component = SbomComponent(Component(name="log4j-core", cpe=LOG4J))
+        parse_cpe.cache_clear()
+        self.assertEqual("log4j", component.parsed_cpe.product if component.parsed_cpe else None)
+        self.assertIs(component.parsed_cpe, SbomComponent(Component(name="copy", cpe=LOG4J)).parsed_cpe)
+        self.assertEqual(1, parse_cpe.cache_info().misses)
+
+        component.cpe = "cpe:2.3:a:apache:log4j:2.17.2"
+        self.assertEqual("2.17.2", component.parsed_cpe.version if component.parsed_cpe else None)
+        self.assertIsNone(SbomComponent(Component(name="none")).parsed_cpe)
+
+
+if __name__ == '__main__':
+    unittest.main()
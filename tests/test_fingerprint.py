@@ -0,0 +1,101 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from cyclonedx.model import Property
+from cyclonedx.model.component import Component
+from cyclonedx.model.license import DisjunctiveLicense
+
+from siemens_standard_bom.model import SbomComponent, StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class FingerprintTestCase(unittest.TestCase):
+    def test_component_fingerprint_is_stable(self) -> None:
+        first = SbomComponent(Component(name="test", version="1.0.0"))
+        second = SbomComponent(Component(name="test", version="1.0.0"))
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+        self.assertEqual(64, len(first.fingerprint()))
+
+    def test_component_fingerprint_ignores_insertion_order(self) -> None:
+        first = Component(name="test", properties=[Property(name="a", value="1"), Property(name="b", value="2")])
+        second = Component(name="test", properties=[Property(name="b", value="2"), Property(name="a", value="1")])
+        self.assertEqual(SbomComponent(first).fingerprint(), SbomComponent(second).fingerprint())
+
+    def test_component_fingerprint_is_reset_by_setters(self) -> None:
+        component = SbomComponent(Component(name="test", version="1.0.0"))
+        before = component.fingerprint()
+
+        component.version = "2.0.0"
+        after_version = component.fingerprint()
+        self.assertNotEqual(before, after_version)
+
+        component.internal = True
+        self.assertNotEqual(after_version, component.fingerprint())
+
+    def test_component_fingerprint_is_shared_between_wrappers(self) -> None:
+        component = Component(name="test")
+        before = SbomComponent(component).fingerprint()
+        SbomComponent(component).sha256 = "abc"
+        self.assertNotEqual(before, SbomComponent(component).fingerprint())
+
+    def test_component_fingerprint_is_reset_by_nested_wrappers(self) -> None:
+        component = SbomComponent(Component(name="test"))
+        component.add_local_source("file:///sources/test.zip")
+        component.website = "https://example.com"
+
+        before = component.fingerprint()
+        component.local_sources[0].sha256 = "0" * 64
+        after_source = component.fingerprint()
+        self.assertNotEqual(before, after_source)
+
+        component.external_components[0].url = "https://example.org"
+        after_external = component.fingerprint()
+        self.assertNotEqual(after_source, after_external)
+
+        component.licenses.add(DisjunctiveLicense(id="MIT"))
+        self.assertNotEqual(after_external, component.fingerprint())
+
+    def test_sbom_fingerprint_follows_nested_changes(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        component = next(c for c in sbom.components if c.local_sources)
+        before = sbom.fingerprint()
+        component.local_sources[0].sha256 = "0" * 64
+        self.assertNotEqual(before, sbom.fingerprint())
+
+    def test_sbom_fingerprint_ignores_document_identity(self) -> None:
+        first = StandardBom()
+        second = StandardBom()
+        second.serial_number = uuid4()
+        second.version = 2
+        second.timestamp = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+    def test_sbom_fingerprint_ignores_component_order(self) -> None:
+        first = StandardBom()
+        first.add_component(Component(name="a", bom_ref="a"))
+        first.add_component(Component(name="b", bom_ref="b"))
+        second = StandardBom()
+        second.add_component(Component(name="b", bom_ref="b"))
+        second.add_component(Component(name="a", bom_ref="a"))
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+
+    def test_sbom_fingerprint_follows_component_changes(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        before = sbom.fingerprint()
+        self.assertEqual(before, sbom.fingerprint())
+
+        sbom.components[0].legal_remark = "changed"
+        self.assertNotEqual(before, sbom.fingerprint())
+
+    def test_sbom_fingerprint_follows_metadata_changes(self) -> None:
+        sbom = StandardBom()
+        before = sbom.fingerprint()
+        sbom.profile = "external"
+        self.assertNotEqual(before, sbom.fingerprint())
+
+
+if __name__ == '__main__':
+    unittest.main()
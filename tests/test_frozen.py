@@ -0,0 +1,115 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from cyclonedx.model.component import Component
+from cyclonedx.model.contact import OrganizationalContact
+
+from siemens_standard_bom.frozen import FrozenStandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class FreezeTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        self.frozen = self.sbom.freeze()
+
+    def test_freeze_has_equal_content(self) -> None:
+        self.assertIsInstance(self.frozen, FrozenStandardBom)
+        # the snapshot differs only by the bom-ref and dependency entry added for the metadata component
+        self.assertEqual([c.fingerprint() for c in self.sbom.components], [c.fingerprint() for c in self.frozen.components])
+        self.assertEqual([c.name for c in self.sbom.components], [c.name for c in self.frozen.components])
+        self.assertEqual(self.sbom.profile, self.frozen.profile)
+        self.assertEqual(len(self.sbom.tools), len(self.frozen.tools))
+
+    def test_wrappers_are_precomputed(self) -> None:
+        self.assertIs(self.frozen.components, self.frozen.components)
+        self.assertIs(self.frozen.component, self.frozen.component)
+        name = self.frozen.components[2].name
+        self.assertIs(self.frozen.components[2], self.frozen.query().where(name=name).first())
+
+    def test_setters_raise(self) -> None:
+        with self.assertRaises(AttributeError):
+            self.frozen.profile = "external"
+        with self.assertRaises(AttributeError):
+            self.frozen.components = []
+        with self.assertRaises(AttributeError):
+            self.frozen.components[0].version = "9.9.9"
+        with self.assertRaises(AttributeError):
+            self.frozen.components[0].add_author(OrganizationalContact(name="someone"))
+        assert self.frozen.component is not None
+        with self.assertRaises(AttributeError):
+            self.frozen.component.version = "2.0.0"
+        with self.assertRaises(AttributeError):
+            self.frozen.external_components[0].url = "https://example.org"
+
+    def test_add_methods_raise(self) -> None:
+        with self.assertRaises(AttributeError):
+            self.frozen.add_component(Component(name="added"))
+        with self.assertRaises(AttributeError):
+            self.frozen.add_tool(Component(name="tool"))
+        with self.assertRaises(AttributeError):
+            self.frozen.add_author(OrganizationalContact(name="someone"))
+        with self.assertRaises(AttributeError):
+            self.frozen.compute_hashes(".")
+
+    def test_freeze_is_a_snapshot(self) -> None:
+        before = self.frozen.components[0].copyright
+        self.sbom.components[0].copyright = "changed"
+        self.sbom.add_component(Component(name="added", bom_ref="added"))
+        self.assertEqual(before, self.frozen.components[0].copyright)
+        self.assertEqual(len(self.sbom.components) - 1, len(self.frozen.components))
+
+    def test_wrapper_obtained_before_freeze_does_not_reach_snapshot(self) -> None:
+        wrapper = self.sbom.components[0]
+        frozen = self.sbom.freeze()
+        wrapper.description = "changed"
+        self.assertNotEqual("changed", frozen.components[0].description)
+        self.assertIsNot(wrapper.component, frozen.components[0].component)
+
+    def test_nested_getters_return_copies(self) -> None:
+        component = self.frozen.components[0]
+        before = component.fingerprint()
+        component.licenses.clear()
+        component.external_components[0].reference.comment = "changed"
+        for source in component.sources:
+            source.external_ref.hashes.clear()
+        supplier = self.frozen.supplier
+        assert supplier is not None
+        supplier.name = "changed"
+        self.frozen.bom.components.clear()
+
+        self.assertEqual(before, self.frozen.components[0].fingerprint())
+        self.assertNotEqual("changed", self.frozen.bom.metadata.supplier.name)  # type: ignore[union-attr]
+        self.assertNotEqual(0, len(self.frozen.bom.components))
+
+    def test_serialization_does_not_change_snapshot(self) -> None:
+        refs = [c.bom_ref.value for c in self.frozen.components]
+        dependencies = len(self.frozen._model.dependencies)
+        first = StandardBomParser.serialize(self.frozen)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outputs = set(executor.map(lambda _: StandardBomParser.serialize(self.frozen), range(16)))
+        self.assertEqual({first}, outputs)
+        self.assertEqual(refs, [c.bom_ref.value for c in self.frozen.components])
+        self.assertEqual(dependencies, len(self.frozen._model.dependencies))
+
+    def test_clone_of_frozen_is_mutable(self) -> None:
+        clone = self.frozen.clone()
+        clone.components[0].copyright = "changed"
+        self.assertNotEqual("changed", self.frozen.components[0].copyright)
+        self.assertIs(self.frozen, self.frozen.freeze())
+
+    def test_concurrent_reads(self) -> None:
+        def read(_: int) -> int:
+            return sum(1 for c in self.frozen.components if c.name and c.purl is not None) + \
+                self.frozen.query().where(internal=False).count()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = set(executor.map(read, range(64)))
+        self.assertEqual(1, len(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
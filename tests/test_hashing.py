@@ -0,0 +1,138 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from cyclonedx.model import HashAlgorithm, HashType
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom.hashing import hash_file, hash_files
+from siemens_standard_bom.model import SbomComponent, SourceVerificationStatus, StandardBom
+
+CONTENT = b"standard-bom" * 100_000
+
+
+class HashingTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self.tmp.name)
+        (self.base / "sources").mkdir()
+        (self.base / "sources" / "a.zip").write_bytes(CONTENT)
+        (self.base / "sources" / "b.zip").write_bytes(b"other")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_hash_file_single_pass(self) -> None:
+        digests = hash_file(self.base / "sources" / "a.zip",
+                            [HashAlgorithm.MD5, HashAlgorithm.SHA_256, HashAlgorithm.BLAKE2B_256], chunk_size=4096)
+        self.assertEqual(hashlib.md5(CONTENT).hexdigest(), digests[HashAlgorithm.MD5])
+        self.assertEqual(hashlib.sha256(CONTENT).hexdigest(), digests[HashAlgorithm.SHA_256])
+        self.assertEqual(hashlib.blake2b(CONTENT, digest_size=32).hexdigest(), digests[HashAlgorithm.BLAKE2B_256])
+
+    def test_hash_file_unsupported_algorithm(self) -> None:
+        with self.assertRaises(ValueError):
+            hash_file(self.base / "sources" / "a.zip", [HashAlgorithm.BLAKE3])
+
+    def test_hash_files_reports_missing_files(self) -> None:
+        results = hash_files({self.base / "sources" / "b.zip": [HashAlgorithm.SHA_1],
+                              self.base / "missing.zip": [HashAlgorithm.SHA_1]}, workers=2)
+        self.assertEqual({HashAlgorithm.SHA_1: hashlib.sha1(b"other").hexdigest()},
+                         results[self.base / "sources" / "b.zip"])
+        self.assertIsInstance(results[self.base / "missing.zip"], OSError)
+
+    def test_verify_local_sources(self) -> None:
+        sbom = StandardBom()
+        component = SbomComponent(Component(name="a", bom_ref="a"))
+        component.add_local_source("file:///sources/a.zip", hashes=[
+            HashType(alg=HashAlgorithm.SHA_256, content=hashlib.sha256(CONTENT).hexdigest().upper()),
+            HashType(alg=HashAlgorithm.SHA_512, content=hashlib.sha512(CONTENT).hexdigest()),
+            HashType(alg=HashAlgorithm.BLAKE3, content="ignored")])
+        component.add_local_source("file:sources/b.zip", hashes=[HashType(alg=HashAlgorithm.MD5, content="0" * 32)])
+        component.add_local_source("sources/missing.zip", hashes=[HashType(alg=HashAlgorithm.MD5, content="0" * 32)])
+        component.add_local_source("sources/a.zip")
+        component.add_remote_source("https://example.com/a.zip",
+                                    hashes=[HashType(alg=HashAlgorithm.MD5, content="0" * 32)])
+        sbom.add_component(component)
+
+        report = sbom.verify_local_sources(self.base, workers=4)
+        statuses = {(entry.source.url, entry.status) for entry in report}
+        self.assertEqual({
+            ("file:///sources/a.zip", SourceVerificationStatus.VERIFIED),
+            ("file:sources/b.zip", SourceVerificationStatus.MISMATCH),
+            ("sources/missing.zip", SourceVerificationStatus.MISSING),
+            ("sources/a.zip", SourceVerificationStatus.UNVERIFIABLE),
+        }, statuses)
+
+        verified = next(entry for entry in report if entry.ok)
+        self.assertEqual(self.base / "sources" / "a.zip", verified.path)
+        self.assertEqual("a", verified.component.name)
+        self.assertEqual({HashAlgorithm.SHA_256, HashAlgorithm.SHA_512}, set(verified.actual))
+
+    def test_compute_hashes(self) -> None:
+        sbom = StandardBom()
+        by_path = SbomComponent(Component(name="a", bom_ref="a"))
+        by_path.relative_path = "file:///sources/a.zip"
+        by_filename = SbomComponent(Component(name="b", bom_ref="b"))
+        by_filename.filename = "sources/b.zip"
+        missing = SbomComponent(Component(name="c", bom_ref="c"))
+        missing.relative_path = "sources/missing.zip"
+        for component in (by_path, by_filename, missing, SbomComponent(Component(name="d", bom_ref="d"))):
+            sbom.add_component(component)
+
+        results = sbom.compute_hashes(self.base, algorithms=[HashAlgorithm.SHA_1, HashAlgorithm.SHA_256], workers=2)
+        self.assertEqual(3, len(results))
+        self.assertIsInstance(results[self.base / "sources" / "missing.zip"], OSError)
+
+        self.assertEqual(hashlib.sha1(CONTENT).hexdigest(), by_path.sha1)
+        self.assertEqual(hashlib.sha256(CONTENT).hexdigest(), by_path.sha256)
+        self.assertEqual(hashlib.sha256(b"other").hexdigest(), by_filename.sha256)
+        self.assertIsNone(by_filename.md5)
+        self.assertIsNone(missing.sha256)
+
+    def test_component_set_stays_sorted(self) -> None:
+        sbom = StandardBom()
+        for name in ("a", "b"):
+            component = SbomComponent(Component(name=name, bom_ref=name))
+            component.relative_path = f"sources/{name}.zip"
+            sbom.add_component(component)
+
+        sbom.compute_hashes(self.base, workers=1)
+        components = sbom.bom.components
+        for added in list(components):
+            self.assertTrue(added.hashes)
+            self.assertIn(added, components)
+        self.assertEqual(list(components), sorted(components))
+
+        first = components[0]
+        components.remove(first)
+        self.assertNotIn(first, components)
+        components.add(first)
+        components.add(first)
+        self.assertEqual(2, len(components))
+
+    def test_compute_hashes_uses_cache(self) -> None:
+        sbom = StandardBom()
+        component = SbomComponent(Component(name="a", bom_ref="a"))
+        component.relative_path = "sources/a.zip"
+        sbom.add_component(component)
+        cache_file = self.base / "cache" / "hashes.json"
+
+        sbom.compute_hashes(self.base, workers=1, cache_file=cache_file)
+        self.assertTrue(cache_file.is_file())
+
+        with patch("siemens_standard_bom.hashing.hash_file") as hash_file_mock:
+            sbom.compute_hashes(self.base, workers=1, cache_file=cache_file)
+            hash_file_mock.assert_not_called()
+        self.assertEqual(hashlib.sha256(CONTENT).hexdigest(), component.sha256)
+
+        (self.base / "sources" / "a.zip").write_bytes(b"changed content")
+        sbom.compute_hashes(self.base, workers=1, cache_file=cache_file)
+        self.assertEqual(hashlib.sha256(b"changed content").hexdigest(), component.sha256)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import subprocess
+import sys
+import unittest
+from typing import Dict, List
+
+# cumulative import time of the parser module including everything it pulls in, in microseconds;
+# without the cyclonedx stack it stays well below this, with the stack it takes several times as long
+IMPORT_TIME_BUDGET_US = 60_000
+
+
+def _import(statement: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          capture_output=True, text=True, check=True)
+
+
+def _cumulative_import_times(stderr: str) -> Dict[str, int]:
+    times: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class ImportTimeTestCase(unittest.TestCase):
+    def test_parser_import_does_not_load_cyclonedx(self) -> None:
+        result = _import("import sys, siemens_standard_bom.parser; "
+                         "print('\\n'.join(m for m in sys.modules if m.startswith('cyclonedx')))")
+        loaded: List[str] = result.stdout.split()
+        self.assertEqual([], loaded)
+
+    def test_parser_import_time_budget(self) -> None:
+        # the best of several runs, to keep the check stable on busy machines
+        best = min(_cumulative_import_times(_import('import siemens_standard_bom.parser').stderr)
+                   ['siemens_standard_bom.parser'] for _ in range(3))
+        self.assertLess(best, IMPORT_TIME_BUDGET_US)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import os
+import unittest
+from unittest.mock import patch
+
+from siemens_standard_bom.instrumentation import LoggingObserver, StageEvent, StageMetrics
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def test_parse_stages(self) -> None:
+        metrics = StageMetrics()
+        StandardBomParser.parse("tests/v3/full-valid.cdx.json", observer=metrics)
+
+        self.assertEqual(["read", "decode", "deserialize", "wrap"], [e.stage for e in metrics.events])
+        self.assertTrue(all(e.operation == "parse" for e in metrics.events))
+        self.assertTrue(all(e.filename == "tests/v3/full-valid.cdx.json" for e in metrics.events))
+        self.assertEqual(os.path.getsize("tests/v3/full-valid.cdx.json"), metrics.events[0].bytes)
+        self.assertEqual(9, metrics.events[2].components)
+        self.assertTrue(all(e.seconds >= 0 for e in metrics.events))
+
+    def test_save_stages(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        metrics = StageMetrics()
+        StandardBomParser.save(sbom, "output/v3/instrumented.cdx.json", with_dependencies=False, observer=metrics)
+
+        self.assertEqual(["serialize", "strip_dependencies", "write"], [e.stage for e in metrics.events])
+        self.assertEqual(9, metrics.events[0].components)
+        self.assertEqual(metrics.events[1].bytes, metrics.events[2].bytes)
+        self.assertEqual({"save.serialize", "save.strip_dependencies", "save.write"},
+                         set(metrics.seconds_by_stage()))
+
+    def test_write_reports_bytes(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        filename = "output/v3/instrumented-bytes.cdx.json"
+        for projection in (None, "external"):
+            with self.subTest(projection=projection):
+                metrics = StageMetrics()
+                StandardBomParser.save(sbom, filename, projection=projection, observer=metrics, index=True)
+                events = {e.stage: e for e in metrics.events}
+                self.assertEqual(os.path.getsize(filename), events["write"].bytes)
+                self.assertEqual(os.path.getsize(filename + ".index.json"), events["index"].bytes)
+
+        # the serializer escapes non-ASCII characters, but the file size is reported even if it did not
+        metrics = StageMetrics()
+        with patch.object(StandardBomParser, "_serialize", return_value='{"description": "Größe in µm"}'):
+            StandardBomParser.save(sbom, filename, observer=metrics)
+        self.assertEqual(os.path.getsize(filename), metrics.events[-1].bytes)
+        self.assertEqual(len('{"description": "Größe in µm"}') + 3, metrics.events[-1].bytes)
+
+    def test_registered_observers(self) -> None:
+        events: list[StageEvent] = []
+        StandardBomParser.observers.append(events.append)
+        try:
+            StandardBomParser.serialize(StandardBomParser.parse("tests/v3/minimal-required.cdx.json"))
+        finally:
+            StandardBomParser.observers.remove(events.append)
+
+        self.assertEqual(["parse"] * 4 + ["serialize"], [e.operation for e in events])
+
+    def test_logging_observer(self) -> None:
+        with self.assertLogs("siemens_standard_bom.parser", level="DEBUG") as logs:
+            StandardBomParser.parse("tests/v3/minimal-required.cdx.json", observer=LoggingObserver())
+        self.assertEqual(4, len(logs.records))
+        self.assertIn("parse.decode took", logs.output[1])
+
+    def test_no_observers(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/minimal-required.cdx.json")
+        self.assertIsNotNone(sbom)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import gc
+import json
+import unittest
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.license import DisjunctiveLicense, LicenseExpression
+
+from benchmarks.generator import write_document
+from siemens_standard_bom import loader
+from siemens_standard_bom.loader import from_json
+from siemens_standard_bom.purl import PURLS
+
+FIXTURES = sorted(Path('tests/v2').glob('*.cdx.json')) + sorted(Path('tests/v3').glob('*.cdx.json'))
+
+
+def _component(**extra: Any) -> Dict[str, Any]:
+    data = {'type': 'library', 'bom-ref': 'a', 'name': 'a', 'version': '1.0', 'purl': 'pkg:pypi/a@1.0'}
+    data.update(extra)
+    return data
+
+
+class LoaderTestCase(unittest.TestCase):
+    def assert_equal_to_generic(self, data: Dict[str, Any]) -> Bom:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            expected: Bom = Bom.from_json(data=data)  # type: ignore[attr-defined]
+            actual = from_json(data)
+        # generated when the document has none
+        actual.serial_number = expected.serial_number
+        actual.metadata.timestamp = expected.metadata.timestamp
+        self.assertEqual(expected, actual)
+        self.assertEqual([c.bom_ref.value for c in expected.components], [c.bom_ref.value for c in actual.components])
+        return actual
+
+    def test_fixtures(self) -> None:
+        for fixture in FIXTURES:
+            with self.subTest(fixture=fixture.name):
+                self.assert_equal_to_generic(json.loads(fixture.read_text(encoding='utf-8')))
+
+    def test_generated(self) -> None:
+        filename = Path('output/loader/generated.cdx.json')
+        filename.parent.mkdir(exist_ok=True, parents=True)
+        write_document(filename, 300)
+        self.assert_equal_to_generic(json.loads(filename.read_text(encoding='utf-8')))
+
+    def test_purls_are_interned(self) -> None:
+        bom = from_json({'components': [_component(), _component(**{'bom-ref': 'b'})]})
+        first, second = bom.components
+        self.assertIs(first.purl, second.purl)
+        self.assertIs(PURLS.intern('pkg:pypi/a@1.0'), first.purl)
+
+    def test_licenses(self) -> None:
+        bom = from_json({'components': [
+            _component(licenses=[{'expression': 'MIT OR Apache-2.0'}]),
+            _component(**{'bom-ref': 'b', 'licenses': [{'license': {'id': 'MIT'}}, {'license': {'name': 'Custom'}}]}),
+        ]})
+        licenses = {c.bom_ref.value: list(c.licenses) for c in bom.components}
+        self.assertEqual([LicenseExpression('MIT OR Apache-2.0')], licenses['a'])
+        self.assertEqual([DisjunctiveLicense(id='MIT'), DisjunctiveLicense(name='Custom')], licenses['b'])
+
+    def test_unexpected_structures_use_generic_deserializer(self) -> None:
+        documents: List[Dict[str, Any]] = [
+            # keys outside of Standard BOMs
+            {'components': [_component(pedigree={'ancestors': [_component(**{'bom-ref': 'b'})]}, tags=['tag'])]},
+            {'components': [_component(externalReferences=[{'type': 'vcs', 'url': 'https://example.com', 'x': 1}])]},
+            {'components': [_component(licenses=[{'license': {'id': 'MIT', 'acknowledgement': 'declared'}}])]},
+            {'components': [_component(licenses=[{'expression': 'MIT', 'bom-ref': 'l'}])]},
+            {'components': [_component(components=[_component(**{'bom-ref': 'b', 'type': 'data'})])]},
+            {'version': 3, 'dependencies': [{'ref': 'a', 'dependsOn': ['b']}], 'properties': []},
+        ]
+        for document in documents:
+            with self.subTest(document=document):
+                self.assert_equal_to_generic(document)
+
+    def test_invalid_values_raise_as_in_generic_deserializer(self) -> None:
+        for document in ({'components': [_component(type='unknown')]},
+                         {'components': [_component(hashes=[{'alg': 'unknown', 'content': 'ab'}])]},
+                         {'components': [_component(purl='not a purl')]},
+                         {'components': [_component(hashes=[{'alg': 'SHA-256', 'content': 'ab'}, 'ab'])]},
+                         {'components': [_component(properties={'name': 'a', 'value': 'b'})]}):
+            with self.subTest(document=document):
+                with self.assertRaises(Exception) as generic:
+                    Bom.from_json(data=document)  # type: ignore[attr-defined]
+                with self.assertRaises(Exception) as specialized:
+                    from_json(document)
+                self.assertEqual(type(generic.exception), type(specialized.exception))
+
+    def test_unknown_component_key_is_not_passed_to_constructor(self) -> None:
+        with patch.object(Component, 'from_json', wraps=Component.from_json) as generic:  # type: ignore[attr-defined]
+            loader._component(_component(unknown='value'))
+            loader._component(_component())
+        generic.assert_called_once()
+
+    def test_components_are_not_compared_or_hashed_again(self) -> None:
+        # the component set is filled in the order of a key computed once per component: the cost of the
+        # SortedSet constructor, n log n comparisons of the costly comparison tuples, no longer grows with the size
+        count = 2_000
+        data = {'components': [_component(**{'bom-ref': f'c{i}', 'name': f'c{count - i:05}', 'purl': f'pkg:pypi/c{i}@1.0'})
+                               for i in range(count)]}
+        with patch.object(Component, '__lt__', autospec=True, side_effect=Component.__lt__) as less, \
+                patch.object(Component, '__hash__', autospec=True, side_effect=Component.__hash__) as hashed:
+            bom = from_json(data)
+        self.assertEqual(0, less.call_count)
+        self.assertEqual(count, hashed.call_count)
+        self.assertEqual([f'c{i:05}' for i in range(1, count + 1)], [c.name for c in bom.components])
+        self.assertTrue(all(component in bom.components for component in bom.components))
+
+    def test_garbage_collector_is_restored(self) -> None:
+        from_json({'components': [_component()]})
+        self.assertTrue(gc.isenabled())
+        with self.assertRaises(Exception):
+            from_json({'components': [_component(type='unknown')]})
+        self.assertTrue(gc.isenabled())
+
+        gc.disable()
+        try:
+            from_json({'components': [_component()]})
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
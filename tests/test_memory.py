@@ -0,0 +1,53 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+
+from cyclonedx.model import Property
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom.memory import SECTIONS
+from siemens_standard_bom.model import SbomComponent, StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class MemoryReportTestCase(unittest.TestCase):
+    def test_all_sections_are_reported(self) -> None:
+        report = StandardBomParser.parse("tests/v3/full-valid.cdx.json").memory_report()
+        self.assertEqual(list(SECTIONS), list(report.sections))
+        for section in SECTIONS:
+            self.assertGreater(report.sections[section], 0, section)
+        self.assertEqual(sum(report.sections.values()), report.total)
+
+    def test_sections_grow_with_content(self) -> None:
+        sbom = StandardBom()
+        before = sbom.memory_report()
+        component = SbomComponent(Component(name="test"))
+        component.legal_remark = "x" * 10_000
+        sbom.add_component(component)
+        after = sbom.memory_report()
+
+        self.assertGreater(after.sections["properties"], before.sections["properties"] + 10_000)
+        self.assertGreater(after.sections["components"], before.sections["components"])
+        self.assertEqual(before.sections["dependencies"], after.sections["dependencies"])
+
+    def test_duplicates(self) -> None:
+        sbom = StandardBom()
+        for i in range(3):
+            # joined at runtime, so that every component gets its own equal string object
+            value = "-".join(["duplicated", "value"])
+            sbom.add_component(Component(name=f"c{i}", properties=[Property(name="p", value=value)]))
+        report = sbom.memory_report()
+        self.assertEqual(2, report.duplicates["Property"].objects)
+        self.assertGreaterEqual(report.duplicates["str"].objects, 2)
+        self.assertGreater(report.duplicates["str"].bytes, 0)
+
+    def test_shared_objects_are_counted_once(self) -> None:
+        sbom = StandardBom()
+        shared = Property(name="p", value="v" * 10_000)
+        sbom.add_component(Component(name="a", properties=[shared]))
+        sbom.add_component(Component(name="b", properties=[shared]))
+        self.assertLess(sbom.memory_report().sections["properties"], 2 * 10_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ import unittest
 from importlib.metadata import version
 
 from cyclonedx.model import ExternalReference, ExternalReferenceType, XsUri
+from cyclonedx.model.bom import Bom
 from cyclonedx.model.component import ComponentType, Component
 from cyclonedx.model.contact import OrganizationalContact
 from sortedcontainers import SortedSet
@@ -184,6 +185,21 @@ class StandardBomTestCase(unittest.TestCase):
         sbom2.add_component(Component(name='test.jar', type=ComponentType.LIBRARY))
         self.assertNotEqual(sbom.serial_number, sbom2.serial_number)
 
+    def test_new_sbom_matches_wrapped_empty_bom(self) -> None:
+        new_sbom = StandardBom()
+        wrapped = StandardBom(Bom())
+        self.assertEqual(list(wrapped.bom.metadata.tools.components), list(new_sbom.bom.metadata.tools.components))
+        assert wrapped.definitions is not None and new_sbom.definitions is not None
+        self.assertEqual(list(wrapped.definitions.standards), list(new_sbom.definitions.standards))
+        self.assertEqual(wrapped.supplier, new_sbom.supplier)
+
+    def test_new_sboms_do_not_share_entries(self) -> None:
+        first = StandardBom()
+        second = StandardBom()
+        self.assertIsNot(first.tools[0].component, second.tools[0].component)
+        first.tools[0].description = "changed"
+        self.assertIsNone(second.tools[0].description)
+
     def test_definitions_entry_is_provided(self) -> None:
         sbom = StandardBom()
         self.assertIsNotNone(sbom.definitions)
@@ -3,6 +3,7 @@
 import unittest
 
 from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
 
 
 class ProfilesTestCase(unittest.TestCase):
@@ -32,6 +33,14 @@ class ProfilesTestCase(unittest.TestCase):
         sbom.profile = "external"
         self.assertEqual("external", sbom.profile)
 
+    def test_read_profile_from_file(self) -> None:
+        self.assertEqual("clearing", StandardBomParser.read_profile("tests/v3/full-valid.cdx.json"))
+        self.assertIsNone(StandardBomParser.read_profile("tests/v3/minimal-required.cdx.json"))
+
+    def test_read_profile_from_missing_file(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            StandardBomParser.read_profile("missing-file")
+
 
 if __name__ == '__main__':
     unittest.main()
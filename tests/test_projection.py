@@ -0,0 +1,91 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import json
+import random
+import unittest
+from typing import Any, Dict
+from unittest.mock import patch
+
+from siemens_standard_bom.instrumentation import StageMetrics
+from siemens_standard_bom.model import SbomComponent
+from siemens_standard_bom.parser import StandardBomParser
+from siemens_standard_bom import serializer
+from siemens_standard_bom.projection import Projection
+
+
+class ProjectionTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        self.internal = self.sbom.components[0]
+        self.internal.internal = True
+        self.internal_ref = self.internal.component.bom_ref.value
+
+    def _serialize(self, **kwargs: Any) -> Dict[str, Any]:
+        result: Dict[str, Any] = json.loads(StandardBomParser.serialize(self.sbom, **kwargs))
+        return result
+
+    def test_external_profile(self) -> None:
+        data = self._serialize(projection="external")
+        refs = [c["bom-ref"] for c in data["components"]]
+        self.assertNotIn(self.internal_ref, refs)
+        self.assertEqual(len(self.sbom.components) - 1, len(refs))
+        self.assertNotIn("dependencies", data)
+        for component in data["components"]:
+            for reference in component.get("externalReferences", []):
+                self.assertFalse(reference["url"].startswith("file:"))
+            for prop in component.get("properties", []):
+                self.assertNotEqual("siemens:legalRemark", prop["name"])
+
+    def test_clearing_profile_drops_dependencies_of_internal_components(self) -> None:
+        data = self._serialize(projection="clearing")
+        self.assertNotIn(self.internal_ref, [c["bom-ref"] for c in data["components"]])
+        for dependency in data["dependencies"]:
+            self.assertNotEqual(self.internal_ref, dependency["ref"])
+            self.assertNotIn(self.internal_ref, dependency.get("dependsOn", []))
+
+    def test_custom_projection(self) -> None:
+        def only_log4j(component: SbomComponent) -> bool:
+            return component.group == "org.apache.logging.log4j"
+
+        data = self._serialize(projection=Projection(include_component=only_log4j,
+                                                     component_fields=frozenset({"hashes", "licenses"})))
+        self.assertEqual(4, len(data["components"]))
+        for component in data["components"]:
+            self.assertEqual("org.apache.logging.log4j", component["group"])
+            self.assertNotIn("hashes", component)
+            self.assertNotIn("licenses", component)
+
+    def test_same_output_as_generic_writer(self) -> None:
+        for profile in ("clearing", "external"):
+            with self.subTest(profile=profile):
+                # seeded, so that the bom-refs generated for the metadata component are equal
+                random.seed(42)
+                expected = StandardBomParser.serialize(self.sbom, projection=profile)
+                random.seed(42)
+                with patch.object(serializer, 'has_expected_layout', return_value=False):
+                    actual = StandardBomParser.serialize(self.sbom, projection=profile)
+                self.assertEqual(json.loads(expected), json.loads(actual))
+
+    def test_sbom_is_not_changed(self) -> None:
+        # the cyclonedx writer registers a dependency entry for the metadata component on its first run
+        StandardBomParser.serialize(self.sbom)
+        before = self.sbom.fingerprint()
+        self._serialize(projection="external", with_dependencies=False)
+        self.assertEqual(before, self.sbom.fingerprint())
+        self.assertEqual(9, len(self.sbom.components))
+
+    def test_unknown_profile(self) -> None:
+        with self.assertRaises(ValueError):
+            self._serialize(projection="unknown")
+
+    def test_save_with_projection(self) -> None:
+        metrics = StageMetrics()
+        StandardBomParser.save(self.sbom, "output/projection/external.cdx.json", projection="external",
+                               observer=metrics)
+        self.assertEqual(["serialize", "write"], [e.stage for e in metrics.events])
+        reparsed = StandardBomParser.parse("output/projection/external.cdx.json")
+        self.assertEqual(len(self.sbom.components) - 1, len(reparsed.components))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+
+from cyclonedx.model.component import Component
+from packageurl import PackageURL
+
+from siemens_standard_bom.model import SbomComponent, StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+from siemens_standard_bom.purl import PURLS, PurlCache, intern_purls, purl_key
+from siemens_standard_bom.query import ComponentIndex
+
+LOG4J_CORE = "pkg:maven/org.apache.logging.log4j/log4j-core@2.17.1?type=jar"
+
+
+class PurlCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = PurlCache()
+
+    def test_canonical_keys(self) -> None:
+        self.assertEqual("pkg:pypi/django-rest@1.0?a=1&b=2", self.cache.key("pkg:PyPI/Django_Rest@1.0?b=2&a=1"))
+        self.assertEqual("pkg:github/package-url/purl-spec@1.0", self.cache.key("pkg:GitHub/Package-URL/purl-spec@1.0"))
+        self.assertEqual("pkg:maven/org.Apache/Log4j@2.0", self.cache.key(PackageURL("maven", "org.Apache", "Log4j", "2.0")))
+        self.assertEqual("pkg:npm/lodash@4.17.21", self.cache.key("pkg:npm/lodash@4.17.21?empty="))
+
+    def test_equal_purls_are_interned(self) -> None:
+        first = self.cache.intern("pkg:PyPI/Django_Rest@1.0")
+        self.assertIs(first, self.cache.intern("pkg:pypi/django-rest@1.0"))
+        self.assertIs(first, self.cache.intern(PackageURL("pypi", None, "django_rest", "1.0")))
+        self.assertIsNot(first, self.cache.intern("pkg:pypi/django-rest@1.1"))
+
+    def test_maxsize(self) -> None:
+        cache = PurlCache(maxsize=4)
+        for version in range(10):
+            cache.key(f"pkg:npm/lodash@4.17.{version}")
+        self.assertLessEqual(len(cache), 4)
+        self.assertEqual("pkg:npm/lodash@4.17.9", cache.key("pkg:npm/lodash@4.17.9"))
+
+    def test_malformed(self) -> None:
+        with self.assertRaises(ValueError):
+            self.cache.key("lodash")
+
+    def test_nested_components(self) -> None:
+        nested = Component(name="nested", purl=PackageURL("npm", None, "nested", "1.0"))
+        outer = Component(name="outer", purl=PackageURL("npm", None, "outer", "1.0"), components=[nested])
+        intern_purls([outer], self.cache)
+        self.assertIs(self.cache.intern("pkg:npm/nested@1.0"), nested.purl)
+        self.assertIs(self.cache.intern("pkg:npm/outer@1.0"), outer.purl)
+
+
+class InternedPurlsTestCase(unittest.TestCase):
+    def test_parsed_documents_share_purls(self) -> None:
+        first = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        second = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        for a, b in zip(first.components, second.components):
+            if a.purl is not None:
+                self.assertIs(a.purl, b.purl)
+
+    def test_setter_interns(self) -> None:
+        component = SbomComponent(Component(name="log4j-core"))
+        component.purl = PackageURL.from_string(LOG4J_CORE)
+        self.assertIs(PURLS.intern(LOG4J_CORE), component.purl)
+        self.assertEqual(LOG4J_CORE, purl_key(PURLS.intern(LOG4J_CORE)))
+
+    def test_components_by_purl(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        sbom.add_component(Component(name="log4j-core", bom_ref="copy", purl=PackageURL.from_string(LOG4J_CORE)))
+        groups = sbom.components_by_purl()
+        self.assertEqual(8, len(groups))
+        self.assertEqual(["copy", LOG4J_CORE], sorted(c.bom_ref.value or '' for c in groups[LOG4J_CORE]))
+
+    def test_query_by_purl(self) -> None:
+        sbom = StandardBom()
+        sbom.add_component(Component(name="Django_Rest", bom_ref="django", purl=PackageURL("pypi", None, "Django_Rest", "1.0")))
+        sbom.add_component(Component(name="lodash", bom_ref="lodash", purl=PackageURL("npm", None, "lodash", "4.17.21")))
+        for index in (None, ComponentIndex(sbom.bom.components)):
+            with self.subTest(indexed=index is not None):
+                self.assertEqual(["django"], [c.bom_ref.value for c in sbom.query(index).where(purl="pkg:pypi/django-rest@1.0")])
+                self.assertEqual(["lodash"], [c.bom_ref.value for c in sbom.query(index).where(
+                    purl=PackageURL("npm", None, "lodash", "4.17.21"))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import unittest
+
+from cyclonedx.model.component import Component, ComponentScope
+from cyclonedx.model.license import DisjunctiveLicense, LicenseExpression
+from packageurl import PackageURL
+
+from siemens_standard_bom.model import SbomComponent, StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+from siemens_standard_bom.query import ComponentIndex
+
+
+def _component(name: str, purl_type: str, scope: ComponentScope, license_id: str, internal: bool) -> SbomComponent:
+    component = SbomComponent(Component(name=name, bom_ref=name))
+    component.purl = PackageURL(type=purl_type, name=name)
+    component.scope = scope
+    component.licenses = [DisjunctiveLicense(id=license_id)]
+    component.internal = internal
+    return component
+
+
+class QueryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBom()
+        self.sbom.add_component(_component("a", "maven", ComponentScope.REQUIRED, "MIT", False))
+        self.sbom.add_component(_component("b", "npm", ComponentScope.REQUIRED, "Apache-2.0", True))
+        self.sbom.add_component(_component("c", "npm", ComponentScope.OPTIONAL, "MIT", False))
+        self.sbom.add_component(_component("d", "npm", ComponentScope.REQUIRED, "MIT", False))
+
+    def test_empty_query_returns_all(self) -> None:
+        self.assertEqual(["a", "b", "c", "d"], [c.name for c in self.sbom.query()])
+
+    def test_where(self) -> None:
+        query = self.sbom.query().where(scope=ComponentScope.REQUIRED, internal=False)
+        self.assertEqual(["a", "d"], [c.name for c in query])
+
+    def test_license_in(self) -> None:
+        query = self.sbom.query().where(purl_type="npm").license_in(["MIT", "BSD-3-Clause"])
+        self.assertEqual(["c", "d"], [c.name for c in query])
+
+    def test_license_expression(self) -> None:
+        sbom = StandardBom()
+        sbom.add_component(Component(name="x", licenses=[LicenseExpression(value="MIT OR Apache-2.0")]))
+        self.assertEqual(1, sbom.query().license_in(["MIT OR Apache-2.0"]).count())
+
+    def test_with_index(self) -> None:
+        index = ComponentIndex(self.sbom.components)
+        query = self.sbom.query(index).where(scope=ComponentScope.REQUIRED, purl_type="npm").license_in(["MIT"])
+        self.assertEqual(["d"], [c.name for c in query])
+        self.assertEqual(["b"], [c.name for c in self.sbom.query(index).where(internal=True)])
+        self.assertEqual(3, self.sbom.query(index).where(internal=False).count())
+
+    def test_index_agrees_with_scan(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        index = ComponentIndex(sbom.bom.components)
+        for criteria in ({"direct_dependency": True}, {"primary_language": "Java"}, {"purl_type": "maven"},
+                         {"internal": False}, {"direct_dependency": False, "purl_type": "maven"},
+                         {"purl": None}, {"purl_type": None}, {"primary_language": None}):
+            scanned = [c.component for c in sbom.query().where(**criteria)]
+            indexed = [c.component for c in sbom.query(index).where(**criteria)]
+            self.assertEqual(scanned, indexed, criteria)
+        self.assertEqual(1, sbom.query(index).where(purl=None).count())
+
+    def test_results_are_lazy(self) -> None:
+        query = self.sbom.query().where(purl_type="npm")
+        self.sbom.add_component(_component("e", "npm", ComponentScope.REQUIRED, "MIT", False))
+        self.assertEqual(["b", "c", "d", "e"], [c.name for c in query])
+
+    def test_first(self) -> None:
+        first = self.sbom.query().where(purl_type="npm").first()
+        assert first is not None
+        self.assertEqual("b", first.name)
+        self.assertIsNone(self.sbom.query().where(purl_type="pypi").first())
+
+    def test_unknown_field(self) -> None:
+        with self.assertRaises(ValueError):
+            self.sbom.query().where(colour="red")
+
+
+if __name__ == '__main__':
+    unittest.main()
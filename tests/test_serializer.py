@@ -0,0 +1,114 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import copy
+import random
+import unittest
+import warnings
+from pathlib import Path
+from unittest.mock import patch
+
+from cyclonedx.exception.model import LicenseExpressionAlongWithOthersException, UnknownComponentDependencyException
+from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, Property, XsUri
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.bom_ref import BomRef
+from cyclonedx.model.component import Component, ComponentScope, ComponentType, Pedigree
+from cyclonedx.model.contact import OrganizationalContact, OrganizationalEntity
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.model.license import DisjunctiveLicense, LicenseExpression
+from cyclonedx.model.vulnerability import Vulnerability
+from cyclonedx.output.json import JsonV1Dot6
+from packageurl import PackageURL
+
+from benchmarks.generator import write_document
+from siemens_standard_bom import serializer
+from siemens_standard_bom.parser import StandardBomParser
+from siemens_standard_bom.serializer import has_expected_layout, to_json
+
+FIXTURES = sorted(Path('tests/v2').glob('*.cdx.json')) + sorted(Path('tests/v3').glob('*.cdx.json'))
+
+
+def _edge_case_bom() -> Bom:
+    bom = Bom()
+    bom.metadata.component = Component(name='root', purl=PackageURL('maven', 'com.example', 'root', '1.0'))
+    nested = Component(name='outer', bom_ref='outer', components=[
+        Component(name='inner'), Component(name='inner-2', components=[Component(name='innermost')])])
+    various = Component(
+        name='various', bom_ref='various', scope=ComponentScope.OPTIONAL, author='author', publisher='publisher',
+        mime_type='text/plain', cpe='cpe:2.3:a:example:various:1.0:*:*:*:*:*:*:*', description='é ☃ "quoted"\n',
+        supplier=OrganizationalEntity(name='Supplier', urls=[XsUri('https://example.com')]),
+        authors=[OrganizationalContact(name='Jane', email='jane@example.com', phone='123')],
+        licenses=[DisjunctiveLicense(id='MIT'), DisjunctiveLicense(name='Custom', url=XsUri('https://example.com/l'))],
+        hashes=[HashType(alg=HashAlgorithm.STREEBOG_256, content='ab'), HashType(alg=HashAlgorithm.MD5, content='cd')],
+        external_references=[ExternalReference(type=ExternalReferenceType.CITATION, url=XsUri('https://example.com'),
+                                               comment='not in 1.6')],
+        properties=[Property(name='empty', value=''), Property(name='none', value=None)])
+    expression = Component(name='expression', bom_ref='duplicate', type=ComponentType.FILE,
+                           licenses=[LicenseExpression('MIT OR Apache-2.0')])
+    pedigree = Component(name='pedigree', bom_ref='duplicate', pedigree=Pedigree(ancestors=[Component(name='ancestor')]),
+                         tags=['tag'])
+    for component in (nested, various, expression, pedigree):
+        bom.components.add(component)
+    bom.register_dependency(bom.metadata.component, [nested, various])
+    bom.register_dependency(various, [expression])
+    bom.vulnerabilities.add(Vulnerability(id='CVE-2021-44228'))
+    bom.properties.add(Property(name='siemens:profile', value='clearing'))
+    bom.external_references.add(ExternalReference(type=ExternalReferenceType.VCS, url=XsUri('https://example.com/git')))
+    return bom
+
+
+class SerializerTestCase(unittest.TestCase):
+    def assert_identical(self, bom: Bom, indent: int = 4) -> None:
+        # both writers are given their own copy, as they add dependencies; seeding the random numbers makes the
+        # generated bom-refs of components without one equal
+        copied = copy.deepcopy(bom)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            random.seed(42)
+            expected = JsonV1Dot6(bom=bom).output_as_string(indent=indent)
+            random.seed(42)
+            actual = to_json(copied, indent=indent)
+        self.assertEqual(expected, actual)
+        self.assertEqual(sorted(str(d.ref) for d in bom.dependencies), sorted(str(d.ref) for d in copied.dependencies))
+
+    def test_layout_of_installed_model(self) -> None:
+        self.assertTrue(has_expected_layout())
+
+    def test_fixtures(self) -> None:
+        for fixture in FIXTURES:
+            with self.subTest(fixture=fixture.name):
+                self.assert_identical(StandardBomParser.parse(str(fixture)).bom)
+
+    def test_fixtures_without_indent(self) -> None:
+        self.assert_identical(StandardBomParser.parse('tests/v3/full-valid.cdx.json').bom, indent=0)
+
+    def test_generated(self) -> None:
+        filename = Path('output/serializer/generated.cdx.json')
+        filename.parent.mkdir(exist_ok=True, parents=True)
+        write_document(filename, 500)
+        self.assert_identical(StandardBomParser.parse(str(filename)).bom)
+
+    def test_fields_outside_of_standard_bom(self) -> None:
+        self.assert_identical(_edge_case_bom())
+
+    def test_generated_bom_refs_are_reset(self) -> None:
+        bom = _edge_case_bom()
+        to_json(bom)
+        self.assertIsNone(bom.metadata.component.bom_ref.value)  # type: ignore[union-attr]
+        self.assertEqual({'outer', 'various', 'duplicate'}, {c.bom_ref.value for c in bom.components})
+
+    def test_validation(self) -> None:
+        bom = Bom(components=[Component(name='a', bom_ref='a')])
+        bom.dependencies.add(Dependency(ref=BomRef('a'), dependencies=[Dependency(ref=BomRef('unknown'))]))
+        with self.assertRaises(UnknownComponentDependencyException):
+            to_json(bom)
+
+        bom = Bom(components=[Component(name='a', licenses=[DisjunctiveLicense(id='MIT'), LicenseExpression('MIT')])])
+        with self.assertRaises(LicenseExpressionAlongWithOthersException):
+            to_json(bom)
+
+    def test_fallback_to_generic_writer(self) -> None:
+        bom = StandardBomParser.parse('tests/v3/full-valid.cdx.json').bom
+        with patch.object(serializer, 'has_expected_layout', return_value=False), \
+                patch.object(JsonV1Dot6, 'output_as_string', return_value='{}') as output_as_string:
+            self.assertEqual('{}', to_json(bom, indent=2))
+        output_as_string.assert_called_once_with(indent=2)
@@ -0,0 +1,84 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import json
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from cyclonedx.model.component import Component
+
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+from siemens_standard_bom import sidecar
+from siemens_standard_bom.sidecar import build_index, index_filename
+
+OUTPUT = "output/sidecar/full-valid.cdx.json"
+
+
+class SidecarIndexTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        StandardBomParser.save(self.sbom, OUTPUT, index=True)
+
+    def test_index_is_written(self) -> None:
+        index = json.loads(index_filename(OUTPUT).read_text(encoding="utf-8"))
+        self.assertEqual(Path(OUTPUT).stat().st_size, index["size"])
+        for component in self.sbom.components:
+            self.assertIn(component.component.bom_ref.value, index["components"])
+
+    def test_load_component_by_bom_ref_and_purl(self) -> None:
+        for expected in self.sbom.components:
+            by_ref = StandardBomParser.load_component(OUTPUT, str(expected.component.bom_ref))
+            assert by_ref is not None
+            self.assertEqual(expected.component, by_ref.component)
+            if expected.purl is not None:
+                by_purl = StandardBomParser.load_component(OUTPUT, str(expected.purl))
+                assert by_purl is not None
+                self.assertEqual(expected.component, by_purl.component)
+
+    def test_unknown_key(self) -> None:
+        self.assertIsNone(StandardBomParser.load_component(OUTPUT, "pkg:maven/unknown/unknown@1.0"))
+
+    def test_changed_file_is_detected(self) -> None:
+        path = Path(OUTPUT)
+        path.write_text(path.read_text(encoding="utf-8").replace("commons-codec", "commons-codex"), encoding="utf-8")
+        with self.assertRaises(ValueError):
+            StandardBomParser.load_component(OUTPUT, str(self.sbom.components[0].component.bom_ref))
+
+    def test_unchanged_file_is_not_hashed(self) -> None:
+        key = str(self.sbom.components[0].component.bom_ref)
+        with patch.object(sidecar, '_file_digest') as file_digest:
+            self.assertIsNotNone(StandardBomParser.load_component(OUTPUT, key))
+            self.assertIsNotNone(StandardBomParser.load_component(OUTPUT, key))
+        file_digest.assert_not_called()
+
+    def test_touched_file_is_hashed_once(self) -> None:
+        key = str(self.sbom.components[0].component.bom_ref)
+        stat = Path(OUTPUT).stat()
+        os.utime(OUTPUT, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        with patch.object(sidecar, '_file_digest', wraps=sidecar._file_digest) as file_digest:
+            self.assertIsNotNone(StandardBomParser.load_component(OUTPUT, key))
+            self.assertIsNotNone(StandardBomParser.load_component(OUTPUT, key))
+        file_digest.assert_called_once()
+
+    def test_missing_index(self) -> None:
+        StandardBomParser.save(self.sbom, "output/sidecar/no-index.cdx.json")
+        with self.assertRaises(FileNotFoundError):
+            StandardBomParser.load_component("output/sidecar/no-index.cdx.json", "any")
+
+    def test_offsets_with_non_ascii_content(self) -> None:
+        sbom = StandardBom()
+        sbom.add_component(Component(name="bücher", version="1.0", bom_ref="a"))
+        sbom.add_component(Component(name="straße", version="2.0", bom_ref="b"))
+        text = json.dumps(json.loads(StandardBomParser.serialize(sbom)), indent=2, ensure_ascii=False)
+        data = text.encode("utf-8")
+
+        index = build_index(text, data)
+        for key, name in (("a", "bücher"), ("b", "straße")):
+            offset, length = index["components"][key]
+            self.assertEqual(name, json.loads(data[offset:offset + length])["name"])
+
+
+if __name__ == '__main__':
+    unittest.main()
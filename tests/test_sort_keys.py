@@ -0,0 +1,78 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import itertools
+import random
+import unittest
+
+from cyclonedx.model.component import Component, ComponentScope, ComponentType
+from sortedcontainers import SortedSet
+
+from siemens_standard_bom.model import SbomComponent, _ComponentSortKey
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class SortKeyTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+
+    def test_keys_order_like_components(self) -> None:
+        values = [None, "", "a", "b"]
+        components = [Component(name=name or "n", group=group, version=version, bom_ref=ref, type=kind,
+                                scope=scope)
+                      for group, name, version, ref, kind, scope in itertools.product(
+                          values, values[2:], values, [None, "r"], [ComponentType.LIBRARY, ComponentType.FILE],
+                          [None, ComponentScope.REQUIRED])]
+        random.Random(1).shuffle(components)
+        self.assertEqual(list(SortedSet(components)), sorted(components, key=_ComponentSortKey))
+
+    def test_wrappers_sort_like_components(self) -> None:
+        wrappers = list(self.sbom.components)
+        random.Random(3).shuffle(wrappers)
+        self.assertEqual(list(self.sbom.bom.components), [w.component for w in sorted(wrappers)])
+
+        wrappers[0].name = "aaa"
+        wrappers[1].version = "0.0.0"
+        expected = sorted(w.component for w in wrappers)
+        self.assertEqual(expected, [w.component for w in sorted(wrappers)])
+
+    def test_setter_sorts_like_sorted_set(self) -> None:
+        components = list(self.sbom.bom.components) + [Component(name="b", bom_ref="b"), Component(name="a")]
+        random.Random(5).shuffle(components)
+        self.sbom.components = components + components[:3]
+        self.assertEqual(list(SortedSet(components)), list(self.sbom.bom.components))
+        self.assertTrue(all(c in self.sbom.bom.components for c in components))
+
+    def test_setter_leaves_the_old_set_alone(self) -> None:
+        old = self.sbom.bom.components
+        content = list(old)
+        self.sbom.components = [Component(name="new")]
+        self.assertEqual(content, list(old))
+
+    def test_components_changed_directly_are_sorted_by_their_new_values(self) -> None:
+        a, b = Component(name="a", bom_ref="a"), Component(name="b", bom_ref="b")
+        self.sbom.components = [a, b]
+        a.name = "z"
+        self.sbom.components = [a, b]
+        self.assertEqual(["b", "z"], [c.name for c in self.sbom.bom.components])
+
+        # equal to the changed component, so it is dropped as with single inserts
+        twin = Component(name="z", bom_ref="a")
+        self.sbom.components = [a, b, twin, Component(name="d", bom_ref="d")]
+        self.assertEqual(["b", "d", "z"], [c.name for c in self.sbom.bom.components])
+        for component in (a, b, twin):
+            self.assertIn(component, self.sbom.bom.components)
+
+    def test_batch_sorts_components_changed_directly(self) -> None:
+        with self.sbom.batch():
+            for wrapper in self.sbom.components:
+                wrapper.primary_language = "Zig"
+                wrapper.component.name = f"x-{wrapper.name}"
+            sorted(self.sbom.components)
+        self.assertEqual(list(SortedSet(self.sbom.bom.components)), list(self.sbom.bom.components))
+
+    def test_compares_with_other_types(self) -> None:
+        self.assertFalse(SbomComponent(Component(name="a")) < "a")
+
+
+if __name__ == '__main__':
+    unittest.main()
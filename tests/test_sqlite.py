@@ -0,0 +1,91 @@
+# Copyright (c) Siemens AG 2019-2025 ALL RIGHTS RESERVED
+# SPDX-License-Identifier: MIT
+import sqlite3
+import unittest
+
+from cyclonedx.model.component import Component, Pedigree
+
+from siemens_standard_bom.model import StandardBom
+from siemens_standard_bom.parser import StandardBomParser
+
+
+class SqliteTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.conn = sqlite3.connect(":memory:")
+        self.addCleanup(self.conn.close)
+
+    def _assert_round_trip(self, sbom: StandardBom) -> StandardBom:
+        loaded = StandardBom.from_sqlite(self.conn, sbom.to_sqlite(self.conn))
+        self.assertEqual(sbom.fingerprint(), loaded.fingerprint())
+        self.assertEqual(sbom.serial_number, loaded.serial_number)
+        self.assertEqual(list(sbom.bom.components), list(loaded.bom.components))
+        self.assertEqual(list(sbom.bom.dependencies), list(loaded.bom.dependencies))
+        return loaded
+
+    def test_round_trip(self) -> None:
+        for filename in ("tests/v3/full-valid.cdx.json", "tests/v3/metadata-extensive.cdx.json",
+                         "tests/v3/multiple-dependencies.cdx.json", "tests/v3/minimal-required.cdx.json"):
+            with self.subTest(filename):
+                self._assert_round_trip(StandardBomParser.parse(filename))
+
+    def test_normalized_tables(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        sbom_id = sbom.to_sqlite(self.conn)
+
+        rows = self.conn.execute("SELECT s.id, c.version FROM component c JOIN sbom s ON s.id = c.sbom_id "
+                                 "WHERE c.group_name = 'org.apache.logging.log4j' AND c.name = 'log4j-core'")
+        self.assertEqual([(sbom_id, "2.17.1")], rows.fetchall())
+
+        properties = self.conn.execute("SELECT COUNT(*) FROM property").fetchone()[0]
+        self.assertEqual(sum(len(c.component.properties) for c in sbom.components), properties)
+        licenses = self.conn.execute("SELECT COUNT(*) FROM license").fetchone()[0]
+        self.assertEqual(sum(len(c.licenses) for c in sbom.components), licenses)
+        self.assertIsNone(self.conn.execute("SELECT data FROM component WHERE data IS NOT NULL").fetchone())
+
+    def test_purl_lookup_uses_index(self) -> None:
+        StandardBomParser.parse("tests/v3/full-valid.cdx.json").to_sqlite(self.conn)
+        plan = self.conn.execute("EXPLAIN QUERY PLAN SELECT id FROM component WHERE purl = ?", ("x",)).fetchall()
+        self.assertIn("component_purl", str(plan))
+
+    def test_several_sboms(self) -> None:
+        first = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        second = StandardBomParser.parse("tests/v3/multiple-dependencies.cdx.json")
+        first_id = first.to_sqlite(self.conn)
+        second_id = second.to_sqlite(self.conn)
+        self.assertNotEqual(first_id, second_id)
+        self.assertEqual(first.fingerprint(), StandardBom.from_sqlite(self.conn, first_id).fingerprint())
+        self.assertEqual(second.fingerprint(), StandardBom.from_sqlite(self.conn, second_id).fingerprint())
+
+    def test_uncommon_fields_are_kept(self) -> None:
+        sbom = StandardBom()
+        sbom.add_component(Component(name="patched", version="1.0", bom_ref="patched",
+                                     pedigree=Pedigree(notes="backported fix")))
+        loaded = self._assert_round_trip(sbom)
+        pedigree = loaded.bom.components[0].pedigree
+        assert pedigree is not None
+        self.assertEqual("backported fix", pedigree.notes)
+
+    def test_open_transaction_of_caller_is_not_committed(self) -> None:
+        self.conn.execute("CREATE TABLE note (text TEXT)")
+        self.conn.execute("INSERT INTO note VALUES ('pending')")
+        StandardBomParser.parse("tests/v3/full-valid.cdx.json").to_sqlite(self.conn)
+        self.assertTrue(self.conn.in_transaction)
+
+        self.conn.rollback()
+        self.assertEqual([], self.conn.execute("SELECT * FROM note").fetchall())
+        tables = self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        self.assertEqual([("note",)], tables)
+
+    def test_rows_are_committed_without_open_transaction(self) -> None:
+        sbom_id = StandardBomParser.parse("tests/v3/full-valid.cdx.json").to_sqlite(self.conn)
+        self.assertFalse(self.conn.in_transaction)
+        self.conn.rollback()
+        self.assertEqual(1, len(self.conn.execute("SELECT * FROM sbom WHERE id = ?", (sbom_id,)).fetchall()))
+
+    def test_unknown_id(self) -> None:
+        with self.assertRaises(ValueError):
+            StandardBom.from_sqlite(self.conn, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,16 @@
 # SPDX-License-Identifier: MIT
 #
 
+import unittest
 from datetime import datetime, timedelta, timezone
 
+from cyclonedx.model.component import Component
+from cyclonedx.model.contact import OrganizationalContact
+from cyclonedx.model.tool import Tool
 from packageurl import PackageURL
 
-from siemens_standard_bom.model import SbomNature
+from siemens_standard_bom.instrumentation import StageMetrics
+from siemens_standard_bom.model import UNKNOWN_TOOL_NAME, ConversionLoss, SbomNature, StandardBom
 from siemens_standard_bom.parser import StandardBomParser
 from tests.abstract_sbom_compare import AbstractSbomComparingTestCase, read_timestamp
 
@@ -168,3 +173,56 @@ class SbomV2ParserTestCase(AbstractSbomComparingTestCase):
         StandardBomParser.save(bom, output_filename)
         new_bom = StandardBomParser.parse(output_filename)
         self.assertEqual(True, new_bom.internal)
+
+
+class SbomV2NormalizationTestCase(unittest.TestCase):
+    def test_normalize_on_parse(self) -> None:
+        legacy = StandardBomParser.parse("tests/v2/full-valid.cdx.json")
+        metrics = StageMetrics()
+        normalized = StandardBomParser.parse("tests/v2/full-valid.cdx.json", observer=metrics, normalize=True)
+
+        self.assertIn("normalize", [e.stage for e in metrics.events])
+        self.assertEqual(0, len(normalized.bom.metadata.tools.tools))
+        self.assertEqual([(t.name, t.version) for t in legacy.tools], [(t.name, t.version) for t in normalized.tools])
+        for old, new in zip(legacy.components, normalized.components):
+            self.assertIsNone(new.component.author)
+            self.assertEqual([a.name for a in old.authors], [a.name for a in new.authors])
+
+    def test_v3_is_unchanged(self) -> None:
+        sbom = StandardBomParser.parse("tests/v3/full-valid.cdx.json")
+        fingerprint = sbom.fingerprint()
+        self.assertEqual([], sbom.normalize_v2())
+        self.assertEqual(fingerprint, sbom.fingerprint())
+
+    def test_losses_are_reported(self) -> None:
+        sbom = StandardBom()
+        sbom.bom.metadata.tools.tools.add(Tool(vendor="ACME", version="1.0"))
+        sbom.add_component(Component(name="lib", bom_ref="lib", author="Jane Doe",
+                                     authors=[OrganizationalContact(name="Jane Doe")]))
+        sbom.add_component(Component(name="other", bom_ref="other", author="John Doe"))
+
+        losses = sbom.normalize_v2()
+        self.assertEqual([ConversionLoss("lib", "legacy author merged with an equal entry of the authors"),
+                          ConversionLoss("metadata.tools", "tool without a name, named '(unknown tool)'")], losses)
+        self.assertIn(UNKNOWN_TOOL_NAME, [t.name for t in sbom.tools])
+        self.assertEqual(["John Doe"], [a.name for a in sbom.components[1].authors])
+
+        output_filename = "output/v2/losses.cdx.json"
+        sbom.bom.metadata.tools.tools.add(Tool(vendor="ACME", version="2.0"))
+        StandardBomParser.save(sbom, output_filename)
+        with self.assertLogs("siemens_standard_bom.parser", level="WARNING") as logs:
+            StandardBomParser.parse(output_filename, normalize=True)
+        self.assertEqual(1, len(logs.output))
+        self.assertIn("metadata.tools: tool without a name", logs.output[0])
+
+    def test_clone_is_normalized_separately(self) -> None:
+        sbom = StandardBomParser.parse("tests/v2/full-valid.cdx.json")
+        clone = sbom.clone()
+        clone.normalize_v2()
+        self.assertTrue(any(c.component.author is not None for c in sbom.components))
+        self.assertTrue(all(c.component.author is None for c in clone.components))
+        self.assertLess(0, len(sbom.bom.metadata.tools.tools))
+
+    def test_frozen(self) -> None:
+        with self.assertRaises(AttributeError):
+            StandardBomParser.parse("tests/v2/full-valid.cdx.json").freeze().normalize_v2()
@@ -126,20 +126,15 @@ class SbomV3ParserWriteTestCase(AbstractSbomComparingTestCase):
         sbom = StandardBom()
         sbom.add_component(Component(name="Dummy", version="0.0.1"))
 
-        original_write_text = Path.write_text
+        original_write_bytes = Path.write_bytes
         writes: list[Path] = []
 
-        def counting_write_text(
-            self_path: Path,
-            data: str,
-            encoding: str | None = None,
-            errors: str | None = None,
-            newline: str | None = None,
-        ) -> int:
+        def counting_write_bytes(self_path: Path, data: bytes) -> int:
             writes.append(self_path)
-            return original_write_text(self_path, data, encoding=encoding, errors=errors, newline=newline)
+            return original_write_bytes(self_path, data)
 
-        with patch.object(Path, "write_text", counting_write_text):
+        with patch.object(Path, "write_bytes", counting_write_bytes), \
+                patch.object(Path, "write_text", side_effect=AssertionError("written as text")):
             StandardBomParser.save(sbom, output_filename, with_dependencies=False)
 
         self.assertEqual(len(writes), 1)